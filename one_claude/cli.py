@@ -1,8 +1,29 @@
 """CLI interface for one_claude."""
 
+from functools import cache
+from typing import TYPE_CHECKING
+
 import click
 
-from one_claude.config import Config
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from one_claude.config import Config
+
+
+def _load_config(path: str | None = None) -> "Config":
+    """Load config, importing it only when a command runs."""
+    from one_claude.config import Config
+
+    return Config.load(path) if path else Config.load()
+
+
+@cache
+def _make_console() -> "Console":
+    """Shared rich console, created on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 @click.group(invoke_without_command=True)
@@ -14,7 +35,7 @@ def main(ctx: click.Context, config: str | None) -> None:
     Browse, search, and teleport to your Claude Code sessions across time.
     """
     ctx.ensure_object(dict)
-    ctx.obj["config"] = Config.load(config) if config else Config.load()
+    ctx.obj["config"] = _load_config(config)
 
     # If no subcommand, run the TUI
     if ctx.invoked_subcommand is None:
@@ -28,7 +49,6 @@ def main(ctx: click.Context, config: str | None) -> None:
 @click.pass_context
 def sessions(ctx: click.Context) -> None:
     """List all sessions."""
-    from rich.console import Console
     from rich.table import Table
 
     from one_claude.core.scanner import ClaudeScanner
@@ -36,7 +56,7 @@ def sessions(ctx: click.Context) -> None:
     config = ctx.obj["config"]
     scanner = ClaudeScanner(config.claude_dir)
 
-    console = Console()
+    console = _make_console()
     table = Table(title="Claude Code Sessions")
     table.add_column("Session ID", style="dim")
     table.add_column("Project", style="cyan")
@@ -46,7 +66,7 @@ def sessions(ctx: click.Context) -> None:
 
     sessions = scanner.get_sessions_flat()
     for session in sessions[:50]:  # Limit to 50
-        project_name = session.project_display.rstrip("/").split("/")[-1]
+        project_name = session.project_short
         title = (session.title or "Untitled")[:40]
         updated = session.updated_at.strftime("%Y-%m-%d %H:%M")
         session_id = session.id[:12] + "..."
@@ -60,8 +80,6 @@ def sessions(ctx: click.Context) -> None:
 @click.pass_context
 def show(ctx: click.Context, session_id: str) -> None:
     """Show a specific session."""
-    from rich.console import Console
-    from rich.markdown import Markdown
     from rich.panel import Panel
 
     from one_claude.core.models import MessageType
@@ -69,7 +87,7 @@ def show(ctx: click.Context, session_id: str) -> None:
 
     config = ctx.obj["config"]
     scanner = ClaudeScanner(config.claude_dir)
-    console = Console()
+    console = _make_console()
 
     # Find the session
     for project in scanner.scan_all():
@@ -101,7 +119,6 @@ def show(ctx: click.Context, session_id: str) -> None:
 @click.pass_context
 def projects(ctx: click.Context) -> None:
     """List all projects."""
-    from rich.console import Console
     from rich.table import Table
 
     from one_claude.core.scanner import ClaudeScanner
@@ -109,7 +126,7 @@ def projects(ctx: click.Context) -> None:
     config = ctx.obj["config"]
     scanner = ClaudeScanner(config.claude_dir)
 
-    console = Console()
+    console = _make_console()
     table = Table(title="Projects")
     table.add_column("Path", style="cyan")
     table.add_column("Sessions", justify="right")
@@ -126,12 +143,11 @@ def projects(ctx: click.Context) -> None:
 
 @main.command()
 @click.argument("query")
-@click.option("--mode", "-m", default="text", help="Search mode: text, title, content")
+@click.option("--mode", "-m", default="text", help="Search mode: text, title, content, index")
 @click.option("--limit", "-l", default=20, help="Maximum results")
 @click.pass_context
 def search(ctx: click.Context, query: str, mode: str, limit: int) -> None:
     """Search sessions."""
-    from rich.console import Console
     from rich.table import Table
 
     from one_claude.core.scanner import ClaudeScanner
@@ -141,7 +157,7 @@ def search(ctx: click.Context, query: str, mode: str, limit: int) -> None:
     scanner = ClaudeScanner(config.claude_dir)
     engine = SearchEngine(scanner)
 
-    console = Console()
+    console = _make_console()
 
     results = engine.search(query, mode=mode, limit=limit)
 
@@ -210,7 +226,7 @@ def gist_import(ctx: click.Context, gist_url_or_id: str, teleport: bool, mode: s
     from one_claude.gist.importer import ExportInfo, SessionImporter
 
     config = ctx.obj["config"]
-    console = Console()
+    console = _make_console()
 
     def clone_repo(git_info: dict, dest_path: str) -> bool:
         """Clone git repo and checkout specific commit."""
@@ -361,9 +377,11 @@ def gist_import(ctx: click.Context, gist_url_or_id: str, teleport: bool, mode: s
 
         # Run the teleport command
         try:
-            subprocess.run(shell_cmd, cwd=sandbox.working_dir)
+            # close_fds=False: Python's own fds are close-on-exec already
+            subprocess.run(shell_cmd, cwd=sandbox.working_dir, close_fds=False)
         finally:
             await sandbox.stop()
+            await sandbox.await_cleanup()
 
     asyncio.run(do_import())
 
@@ -375,13 +393,11 @@ def gist_export(ctx: click.Context, session_id: str) -> None:
     """Export a session to a GitHub gist."""
     import asyncio
 
-    from rich.console import Console
-
     from one_claude.core.scanner import ClaudeScanner
     from one_claude.gist.exporter import SessionExporter
 
     config = ctx.obj["config"]
-    console = Console()
+    console = _make_console()
     scanner = ClaudeScanner(config.claude_dir)
 
     # Find conversation path by session ID
@@ -420,12 +436,11 @@ def gist_export(ctx: click.Context, session_id: str) -> None:
 @gist.command(name="list")
 def gist_list() -> None:
     """List exported gists."""
-    from rich.console import Console
     from rich.table import Table
 
     from one_claude.gist.store import load_exports
 
-    console = Console()
+    console = _make_console()
     exports = load_exports()
 
     if not exports:
@@ -1,7 +1,10 @@
 """File history and checkpoint management."""
 
 import hashlib
+import os
 from collections import defaultdict
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
 from one_claude.core.models import FileCheckpoint, Message, MessageTree, Session
@@ -51,6 +54,38 @@ class FileHistoryManager:
 
         return dict(checkpoints)
 
+    def iter_latest_checkpoints(self, session_id: str) -> Iterator[tuple[str, FileCheckpoint]]:
+        """Yield (path_hash, latest checkpoint) for each file in a session.
+
+        Only file names are examined; the latest version is tracked per hash
+        in a single directory scan.
+        """
+        session_dir = self.file_history_dir / session_id
+        latest: dict[str, tuple[int, str]] = {}
+        try:
+            with os.scandir(session_dir) as entries:
+                for entry in entries:
+                    path_hash, sep, version_str = entry.name.partition("@v")
+                    if not sep:
+                        continue
+                    try:
+                        version = int(version_str)
+                    except ValueError:
+                        continue
+                    current = latest.get(path_hash)
+                    if (current is None or version > current[0]) and entry.is_file():
+                        latest[path_hash] = (version, entry.path)
+        except OSError:
+            return
+
+        for path_hash, (version, path) in latest.items():
+            yield path_hash, FileCheckpoint(
+                path_hash=path_hash,
+                version=version,
+                session_id=session_id,
+                file_path=Path(path),
+            )
+
     def get_latest_checkpoint(self, session_id: str, path_hash: str) -> FileCheckpoint | None:
         """Get the latest version of a file checkpoint."""
         checkpoints = self.get_checkpoints_for_session(session_id)
@@ -75,14 +110,15 @@ class FileHistoryManager:
 
     def build_path_mapping(self, session: Session, message_tree: MessageTree) -> dict[str, str]:
         """Build a mapping from path hashes to original paths by scanning messages."""
+        # Hash each distinct path once, in first-seen order
+        paths = dict.fromkeys(
+            path
+            for msg in message_tree.all_messages()
+            for path in extract_file_paths_from_message(msg)
+        )
         mapping: dict[str, str] = {}
-
-        for msg in message_tree.all_messages():
-            paths = extract_file_paths_from_message(msg)
-            for path in paths:
-                path_hash = compute_path_hash(path)
-                if path_hash not in mapping:
-                    mapping[path_hash] = path
+        for path in paths:
+            mapping.setdefault(compute_path_hash(path), path)
 
         return mapping
 
@@ -126,6 +162,7 @@ class FileHistoryManager:
         return state
 
 
+@lru_cache(maxsize=4096)
 def compute_path_hash(file_path: str) -> str:
     """Compute the hash used for file-history filenames."""
-    return hashlib.sha256(file_path.encode()).hexdigest()[:16]
+    return hashlib.sha256(file_path.encode(), usedforsecurity=False).hexdigest()[:16]
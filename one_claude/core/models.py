@@ -1,11 +1,15 @@
 """Core data models for one_claude."""
 
-from dataclasses import dataclass, field
+import hashlib
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 
 def escape_project_path(path: str) -> str:
     """Escape path for Claude's project directory naming.
@@ -16,6 +20,21 @@ def escape_project_path(path: str) -> str:
     return path.replace("/", "-").replace("_", "-")
 
 
+def short_project_name(display_path: str) -> str:
+    """Last component of a project path (e.g. "foo" for "/home/me/foo/")."""
+    return display_path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def field_layout(*classes: type) -> str:
+    """Short digest of the dataclasses' field names, in order.
+
+    Slotted dataclasses pickle their fields positionally, so on-disk caches
+    use this as their version to drop pickles from an older layout.
+    """
+    layout = ";".join(f"{cls.__name__}:{','.join(f.name for f in fields(cls))}" for cls in classes)
+    return hashlib.sha1(layout.encode()).hexdigest()[:12]
+
+
 class MessageType(Enum):
     """Type of message in a session."""
 
@@ -33,7 +52,7 @@ class UserType(Enum):
     INTERNAL = "internal"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolUse:
     """Represents a tool invocation within an assistant message."""
 
@@ -42,7 +61,7 @@ class ToolUse:
     input: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Tool execution result within a user message."""
 
@@ -51,7 +70,7 @@ class ToolResult:
     is_error: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ThinkingBlock:
     """Claude's extended thinking block."""
 
@@ -99,10 +118,46 @@ class Message:
     system_data: dict[str, Any] | None = None  # Hook info, etc.
 
     # Raw data for debugging
-    raw: dict[str, Any] = field(default_factory=dict)
+    raw: dict[str, Any] | None = None
 
+    # tz-naive copy of timestamp, computed once for sorting/comparison
+    _naive_ts: datetime | None = field(default=None, init=False, repr=False, compare=False)
+    # Lowercased text_content, filled on first search
+    _text_lower: str | None = field(default=None, init=False, repr=False, compare=False)
+    # Entries in snapshot_data, counted on first display
+    _snapshot_file_count: int | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        ts = self.timestamp
+        self._naive_ts = ts.replace(tzinfo=None) if ts.tzinfo else ts
+
+    @property
+    def text_lower(self) -> str:
+        """Lowercased text content, computed once per message."""
+        if self._text_lower is None:
+            self._text_lower = self.text_content.lower()
+        return self._text_lower
 
-@dataclass
+    @property
+    def snapshot_file_count(self) -> int:
+        """Number of entries in snapshot_data, parsing it once if it is JSON text."""
+        if self._snapshot_file_count is None:
+            snapshot: Any = self.snapshot_data
+            if isinstance(snapshot, str):
+                try:
+                    snapshot = orjson.loads(snapshot)
+                except orjson.JSONDecodeError:
+                    snapshot = None
+            self._snapshot_file_count = len(snapshot) if isinstance(snapshot, dict) else 0
+        return self._snapshot_file_count
+
+
+_by_naive_ts = attrgetter("_naive_ts")
+
+
+@dataclass(slots=True)
 class TreeNode:
     """A message with tree display metadata."""
 
@@ -113,7 +168,7 @@ class TreeNode:
     prefix: str  # Visual prefix for tree display (e.g., "│  ", "├─ ")
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageTree:
     """Tree structure of messages supporting branches via uuid/parentUuid."""
 
@@ -140,38 +195,33 @@ class MessageTree:
                 current = self.messages.get(current.parent_uuid)
             else:
                 break
-        return list(reversed(path))
+        path.reverse()
+        return path
 
     def get_main_thread(self) -> list[Message]:
         """Get the main conversation thread (non-sidechain messages)."""
-        # Start from roots, follow non-sidechain path
-        messages = []
+        # Start from the first non-sidechain root, follow non-sidechain children
+        messages: list[Message] = []
+        msg = None
         for root_uuid in self.root_uuids:
-            msg = self.messages.get(root_uuid)
-            if msg and not msg.is_sidechain:
-                self._collect_main_thread(msg, messages)
+            root = self.messages.get(root_uuid)
+            if root and not root.is_sidechain:
+                msg = root
                 break
-        return messages
 
-    def _collect_main_thread(self, msg: Message, result: list[Message]) -> None:
-        """Recursively collect main thread messages."""
-        result.append(msg)
-        children = self.get_children(msg.uuid)
-        # Prefer non-sidechain children
-        for child in children:
-            if not child.is_sidechain:
-                self._collect_main_thread(child, result)
-                return
-        # If all are sidechains, take first
-        if children:
-            self._collect_main_thread(children[0], result)
+        while msg is not None:
+            messages.append(msg)
+            children = self.get_children(msg.uuid)
+            # Prefer non-sidechain children; if all are sidechains, take first
+            msg = next(
+                (c for c in children if not c.is_sidechain),
+                children[0] if children else None,
+            )
+        return messages
 
     def all_messages(self) -> list[Message]:
         """Get all messages in chronological order."""
-        def get_naive_ts(msg: Message) -> datetime:
-            ts = msg.timestamp
-            return ts.replace(tzinfo=None) if ts.tzinfo else ts
-        return sorted(self.messages.values(), key=get_naive_ts)
+        return sorted(self.messages.values(), key=_by_naive_ts)
 
     def get_tree_nodes(self) -> list[TreeNode]:
         """Get all messages as tree nodes with branch visualization info.
@@ -182,10 +232,6 @@ class MessageTree:
         result: list[TreeNode] = []
         conversation_types = (MessageType.USER, MessageType.ASSISTANT)
 
-        def get_naive_ts(msg: Message) -> datetime:
-            ts = msg.timestamp
-            return ts.replace(tzinfo=None) if ts.tzinfo else ts
-
         def traverse(
             uuid: str,
             depth: int,
@@ -198,7 +244,7 @@ class MessageTree:
 
             children = self.get_children(uuid)
             # Sort children by timestamp
-            children.sort(key=get_naive_ts)
+            children.sort(key=_by_naive_ts)
 
             # Only count conversation children for fork detection
             # (ignore file-history-snapshot and summary which create fake forks)
@@ -256,7 +302,7 @@ class MessageTree:
 
         # Start from root messages
         root_messages = [self.messages[u] for u in self.root_uuids if u in self.messages]
-        root_messages.sort(key=get_naive_ts)
+        root_messages.sort(key=_by_naive_ts)
 
         for i, root in enumerate(root_messages):
             traverse(root.uuid, 0, [], i)
@@ -400,7 +446,7 @@ class MessageTree:
         return not has_tool_result
 
 
-@dataclass
+@dataclass(slots=True)
 class FileCheckpoint:
     """A file state checkpoint."""
 
@@ -415,7 +461,7 @@ class FileCheckpoint:
         return self.file_path.read_bytes()
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """A Claude Code session."""
 
@@ -447,14 +493,72 @@ class Session:
     parent_session_id: str | None = None  # Parent session ID if this is an agent
     child_agent_ids: list[str] = field(default_factory=list)  # Agent session IDs spawned from this session
 
+    # Lowercased search fields, filled on first search
+    _title_lower: str | None = field(default=None, init=False, repr=False, compare=False)
+    _project_display_lower: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _project_path_lower: str | None = field(default=None, init=False, repr=False, compare=False)
+    _project_short: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def title_lower(self) -> str:
+        """Lowercased title, computed once per session."""
+        if self._title_lower is None:
+            self._title_lower = (self.title or "").lower()
+        return self._title_lower
+
+    @property
+    def project_display_lower(self) -> str:
+        """Lowercased display path, computed once per session."""
+        if self._project_display_lower is None:
+            self._project_display_lower = self.project_display.lower()
+        return self._project_display_lower
+
+    @property
+    def project_path_lower(self) -> str:
+        """Lowercased escaped project path, computed once per session."""
+        if self._project_path_lower is None:
+            self._project_path_lower = self.project_path.lower()
+        return self._project_path_lower
+
+    @property
+    def project_short(self) -> str:
+        """Last component of the project path, computed once per session."""
+        if self._project_short is None:
+            self._project_short = short_project_name(self.project_display)
+        return self._project_short
+
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """A Claude Code project (collection of sessions)."""
 
     path: str  # Escaped form
     display_path: str  # Human-readable
     sessions: list[Session] = field(default_factory=list)
+    _short_name: str | None = field(default=None, init=False, repr=False, compare=False)
+    _user_sessions: list[Session] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def short_name(self) -> str:
+        """Last component of the display path, computed once per project."""
+        if self._short_name is None:
+            self._short_name = short_project_name(self.display_path)
+        return self._short_name
+
+    @property
+    def user_sessions(self) -> list[Session]:
+        """Sessions that aren't agent sidechains, in the same order.
+
+        Filtered once per project; the scanner builds a new Project on each
+        scan, so its sessions don't change once they are read.
+        """
+        if self._user_sessions is None:
+            self._user_sessions = [s for s in self.sessions if not s.is_agent]
+        return self._user_sessions
 
     @property
     def session_count(self) -> int:
@@ -469,7 +573,7 @@ class Project:
         return max(self.sessions, key=lambda s: s.updated_at)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationPath:
     """A linear conversation path from root to leaf.
 
@@ -508,6 +612,24 @@ class ConversationPath:
     # Loaded on demand
     messages: list[Message] | None = None  # Linear list from root to leaf
 
+    # Lowercased title, filled on first search
+    _title_lower: str | None = field(default=None, init=False, repr=False, compare=False)
+    _project_short: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def title_lower(self) -> str:
+        """Lowercased title, computed once per path."""
+        if self._title_lower is None:
+            self._title_lower = self.title.lower()
+        return self._title_lower
+
+    @property
+    def project_short(self) -> str:
+        """Last component of the project path, computed once per path."""
+        if self._project_short is None:
+            self._project_short = short_project_name(self.project_display)
+        return self._project_short
+
     def get_fork_siblings(self) -> list[str]:
         """Get UUIDs of other leaves that share the same fork point."""
         return self.sibling_leaf_uuids
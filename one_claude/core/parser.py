@@ -1,14 +1,29 @@
 """JSONL parsing for Claude Code session files."""
 
+import bisect
+import logging
+from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import simdjson
 
+# Malformed lines are skipped; the first one per file is logged here
+_log = logging.getLogger(__name__)
+
 # Cache UTC timezone for faster timestamp parsing
 _UTC = timezone.utc
 
+# Tools whose input names a file path
+_FILE_TOOLS = frozenset({"Read", "Write", "Edit", "Glob", "Grep"})
+
+# Max distinct timestamp strings remembered per parser
+_TS_CACHE_MAX = 4096
+
+# Files up to this size are read in one go and split; larger ones are streamed
+_READ_ALL_MAX = 16 * 1024 * 1024
+
 from one_claude.core.models import (
     Message,
     MessageTree,
@@ -19,6 +34,10 @@ from one_claude.core.models import (
     UserType,
 )
 
+# Enum lookups without raising on unknown values
+_MESSAGE_TYPES = MessageType._value2member_map_
+_USER_TYPES = UserType._value2member_map_
+
 
 # simdjson type helpers
 def _is_array(obj: Any) -> bool:
@@ -58,42 +77,105 @@ def _to_list(obj: Any) -> list:
     return []
 
 
+def _iter_lines(path: Path):
+    """Yield raw JSONL lines (may carry trailing whitespace)."""
+    if path.stat().st_size <= _READ_ALL_MAX:
+        yield from path.read_bytes().split(b"\n")
+    else:
+        # Bound peak memory for very large sessions
+        with open(path, "rb") as f:
+            yield from f
+
+
 class SessionParser:
-    """Parses Claude Code session JSONL files."""
+    """Parses Claude Code session JSONL files.
+
+    Malformed lines are always skipped. With fast_path (the default), lines
+    are parsed without per-line exception handling until the first bad one,
+    then the rest go through the per-line handled loop.
+    """
 
-    def __init__(self):
+    def __init__(self, retain_raw: bool = False, fast_path: bool = True):
         self._parser = simdjson.Parser()
+        self.fast_path = fast_path
+        # Keeping the decoded record on every Message roughly duplicates the
+        # JSONL in memory, so it is opt-in
+        self.retain_raw = retain_raw
+        # Per-file string pool: session_id, cwd, model etc. repeat on every line
+        self._strcache: dict[str, str] = {}
+        # Timestamp string -> parsed datetime (tool bursts share timestamps)
+        self._ts_cache: dict[str, datetime] = {}
+        # Type-specific content parsers
+        self._dispatch = {
+            MessageType.USER: self._parse_user_direct,
+            MessageType.ASSISTANT: self._parse_assistant_direct,
+            MessageType.SUMMARY: self._parse_summary_direct,
+            MessageType.FILE_HISTORY_SNAPSHOT: self._parse_snapshot_direct,
+            MessageType.SYSTEM: self._parse_system_direct,
+        }
+        self._dispatch_legacy = {
+            MessageType.USER: self._parse_user_legacy,
+            MessageType.ASSISTANT: self._parse_assistant_legacy,
+            MessageType.SUMMARY: self._parse_summary_legacy,
+            MessageType.FILE_HISTORY_SNAPSHOT: self._parse_snapshot_legacy,
+        }
+
+    def _i(self, s: str | None) -> str | None:
+        """Return the pooled instance of a repeated string."""
+        if s is None:
+            return None
+        return self._strcache.setdefault(s, s)
 
     def parse_file(self, path: Path) -> MessageTree:
         """Parse a JSONL file into a MessageTree."""
         messages: dict[str, Message] = {}
         root_uuids: list[str] = []
-        children: dict[str, list[str]] = {}
+        children: defaultdict[str, list[str]] = defaultdict(list)
         summaries: list[Message] = []  # Summaries to insert later
-
-        with open(path, "rb") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    doc = self._parser.parse(line)
-                    msg = self._parse_record_direct(doc)
-                    del doc  # Release before next parse
-                    if msg:
-                        messages[msg.uuid] = msg
-                        if msg.parent_uuid is None:
-                            root_uuids.append(msg.uuid)
-                        else:
-                            if msg.parent_uuid not in children:
-                                children[msg.parent_uuid] = []
-                            children[msg.parent_uuid].append(msg.uuid)
-
-                        # Track summaries for chain linking
-                        if msg.type == MessageType.SUMMARY:
-                            summaries.append(msg)
-                except (ValueError, KeyError):
-                    continue
+        self._strcache.clear()
+
+        def add_line(line: bytes) -> None:
+            doc = self._parser.parse(line)
+            msg = self._parse_record_direct(doc)
+            del doc  # Release before next parse
+            if msg:
+                messages[msg.uuid] = msg
+                if msg.parent_uuid is None:
+                    root_uuids.append(msg.uuid)
+                else:
+                    children[msg.parent_uuid].append(msg.uuid)
+
+                # Track summaries for chain linking
+                if msg.type == MessageType.SUMMARY:
+                    summaries.append(msg)
+
+        # simdjson skips surrounding whitespace, so lines need no strip()
+        lines = _iter_lines(path)
+        logged = False
+        if self.fast_path:
+            # Files written by Claude Code are well-formed, so run without
+            # per-line exception handling until something fails
+            line = b""
+            try:
+                for line in lines:
+                    if line:
+                        add_line(line)
+            except (ValueError, KeyError) as e:
+                # Skip the bad line, continue leniently below
+                _log.info("Skipping malformed line in %s: %s (%r)", path, e, line[:200])
+                logged = True
+
+        # Lenient path: remaining lines (all of them without fast_path)
+        for line in lines:
+            if not line:
+                continue
+            try:
+                add_line(line)
+            except (ValueError, KeyError) as e:
+                if not logged:
+                    _log.info("Skipping malformed line in %s: %s (%r)", path, e, line[:200])
+                    logged = True
+                continue
 
         # Link orphaned chains via summaries
         self._link_orphaned_chains(messages, root_uuids, children, summaries)
@@ -101,17 +183,12 @@ class SessionParser:
         # Fix checkpoint timestamps (inherit from parent message)
         self._fix_checkpoint_timestamps(messages)
 
-        return MessageTree(messages=messages, root_uuids=root_uuids, children=children)
+        return MessageTree(messages=messages, root_uuids=root_uuids, children=dict(children))
 
     def _parse_record_direct(self, doc: Any) -> Message | None:
         """Parse a simdjson doc directly into a Message."""
-        msg_type_str = _to_str(doc.get("type"))
-        if not msg_type_str:
-            return None
-
-        try:
-            msg_type = MessageType(msg_type_str)
-        except ValueError:
+        msg_type = _MESSAGE_TYPES.get(_to_str(doc.get("type")))
+        if msg_type is None:
             return None
 
         uuid = _to_str(doc.get("uuid")) or ""
@@ -131,54 +208,53 @@ class SessionParser:
         if not uuid:
             return None
 
-        # Parse timestamp - optimize for Z-suffix (most common)
-        timestamp_str = _to_str(doc.get("timestamp")) or ""
-        try:
-            if timestamp_str and timestamp_str[-1] == "Z":
-                # Parse without Z, then attach UTC timezone directly
-                timestamp = datetime.fromisoformat(timestamp_str[:-1]).replace(tzinfo=_UTC)
-            elif timestamp_str:
-                timestamp = datetime.fromisoformat(timestamp_str)
-            else:
-                timestamp = datetime.now(_UTC)
-        except (ValueError, AttributeError):
-            timestamp = datetime.now(_UTC)
+        timestamp = self._parse_timestamp(_to_str(doc.get("timestamp")) or "")
 
         msg = Message(
             uuid=uuid,
             parent_uuid=_to_str(doc.get("parentUuid")),
             type=msg_type,
             timestamp=timestamp,
-            session_id=_to_str(doc.get("sessionId")) or "",
-            cwd=_to_str(doc.get("cwd")) or "",
-            git_branch=_to_str(doc.get("gitBranch")),
-            version=_to_str(doc.get("version")),
+            session_id=self._i(_to_str(doc.get("sessionId")) or ""),
+            cwd=self._i(_to_str(doc.get("cwd")) or ""),
+            git_branch=self._i(_to_str(doc.get("gitBranch"))),
+            version=self._i(_to_str(doc.get("version"))),
             is_sidechain=bool(doc.get("isSidechain")),
         )
 
         # Parse type-specific content
-        message_data = doc.get("message")
-        if msg_type == MessageType.USER:
-            self._parse_user_direct(msg, doc, message_data)
-        elif msg_type == MessageType.ASSISTANT:
-            self._parse_assistant_direct(msg, doc, message_data)
-        elif msg_type == MessageType.SUMMARY:
-            self._parse_summary_direct(msg, doc, message_data)
-        elif msg_type == MessageType.FILE_HISTORY_SNAPSHOT:
-            self._parse_snapshot_direct(msg, doc)
-        elif msg_type == MessageType.SYSTEM:
-            self._parse_system_direct(msg, doc)
+        handler = self._dispatch.get(msg_type)
+        if handler is not None:
+            handler(msg, doc, doc.get("message"))
 
         return msg
 
+    def _parse_timestamp(self, timestamp_str: str) -> datetime:
+        """Parse an ISO timestamp, memoizing repeated strings."""
+        timestamp = self._ts_cache.get(timestamp_str)
+        if timestamp is not None:
+            return timestamp
+
+        # Optimize for Z-suffix (most common)
+        try:
+            if timestamp_str and timestamp_str[-1] == "Z":
+                # Parse without Z, then attach UTC timezone directly
+                timestamp = datetime.fromisoformat(timestamp_str[:-1]).replace(tzinfo=_UTC)
+            elif timestamp_str:
+                timestamp = datetime.fromisoformat(timestamp_str)
+            else:
+                return datetime.now(_UTC)
+        except (ValueError, AttributeError):
+            return datetime.now(_UTC)
+
+        if len(self._ts_cache) >= _TS_CACHE_MAX:
+            self._ts_cache.clear()
+        self._ts_cache[timestamp_str] = timestamp
+        return timestamp
+
     def _parse_user_direct(self, msg: Message, doc: Any, message_data: Any) -> None:
         """Parse user message content from simdjson."""
-        user_type_str = _to_str(doc.get("userType"))
-        if user_type_str:
-            try:
-                msg.user_type = UserType(user_type_str)
-            except ValueError:
-                pass
+        msg.user_type = _USER_TYPES.get(_to_str(doc.get("userType")))
 
         if not message_data:
             return
@@ -223,8 +299,8 @@ class SessionParser:
 
     def _parse_assistant_direct(self, msg: Message, doc: Any, message_data: Any) -> None:
         """Parse assistant message content from simdjson."""
-        msg.model = _to_str(doc.get("model"))
-        msg.request_id = _to_str(doc.get("requestId"))
+        msg.model = self._i(_to_str(doc.get("model")))
+        msg.request_id = self._i(_to_str(doc.get("requestId")))
 
         if not message_data:
             return
@@ -244,7 +320,7 @@ class SessionParser:
                         tool_input = block.get("input")
                         tool_use = ToolUse(
                             id=_to_str(block.get("id")) or "",
-                            name=_to_str(block.get("name")) or "",
+                            name=self._i(_to_str(block.get("name")) or ""),
                             input=_to_dict(tool_input),
                         )
                         msg.tool_uses.append(tool_use)
@@ -270,7 +346,7 @@ class SessionParser:
         if leaf_uuid:
             msg.parent_uuid = leaf_uuid
 
-    def _parse_snapshot_direct(self, msg: Message, doc: Any) -> None:
+    def _parse_snapshot_direct(self, msg: Message, doc: Any, message_data: Any = None) -> None:
         """Parse file-history-snapshot message from simdjson."""
         snapshot = doc.get("snapshot")
         msg.snapshot_data = _to_dict(snapshot) if snapshot else doc.as_dict()
@@ -280,7 +356,7 @@ class SessionParser:
         if message_id:
             msg.parent_uuid = message_id
 
-    def _parse_system_direct(self, msg: Message, doc: Any) -> None:
+    def _parse_system_direct(self, msg: Message, doc: Any, message_data: Any = None) -> None:
         """Parse system message from simdjson."""
         msg.system_subtype = _to_str(doc.get("subtype"))
 
@@ -301,12 +377,13 @@ class SessionParser:
                 parent = messages.get(msg.parent_uuid)
                 if parent:
                     msg.timestamp = parent.timestamp
+                    msg._naive_ts = parent._naive_ts
 
     def _link_orphaned_chains(
         self,
         messages: dict[str, Message],
         root_uuids: list[str],
-        children: dict[str, list[str]],
+        children: defaultdict[str, list[str]],
         summaries: list[Message],
     ) -> None:
         """Link orphaned message chains via summaries.
@@ -322,23 +399,21 @@ class SessionParser:
         if not summaries:
             return
 
-        def get_naive_ts(ts: datetime) -> datetime:
-            return ts.replace(tzinfo=None) if ts.tzinfo else ts
-
         # Build summary info with effective timestamps from their leaf messages
         # summary.parent_uuid points to the leafUuid (last message before summary)
         summary_info: list[tuple[Message, datetime]] = []
         for summary in summaries:
             if summary.parent_uuid and summary.parent_uuid in messages:
                 leaf_msg = messages[summary.parent_uuid]
-                effective_ts = get_naive_ts(leaf_msg.timestamp)
+                effective_ts = leaf_msg._naive_ts
             else:
                 # Fallback: use summary's own timestamp (may be now())
-                effective_ts = get_naive_ts(summary.timestamp)
+                effective_ts = summary._naive_ts
             summary_info.append((summary, effective_ts))
 
         # Sort by effective timestamp
         summary_info.sort(key=lambda x: x[1])
+        summary_ts_list = [ts for _, ts in summary_info]
 
         # Find messages that need linking:
         # 1. Orphans (parent exists but not in messages) - EXCEPT summaries
@@ -362,18 +437,14 @@ class SessionParser:
 
         for msg_uuid in to_link:
             msg = messages[msg_uuid]
-            msg_ts = get_naive_ts(msg.timestamp)
+            msg_ts = msg._naive_ts
 
             # Find the most recent summary before this message
-            best_summary = None
-            for summary, summary_ts in summary_info:
-                if summary_ts <= msg_ts:
-                    best_summary = summary
+            idx = bisect.bisect_right(summary_ts_list, msg_ts) - 1
+            best_summary = summary_info[idx][0] if idx >= 0 else None
 
             if best_summary:
                 msg.parent_uuid = best_summary.uuid
-                if best_summary.uuid not in children:
-                    children[best_summary.uuid] = []
                 children[best_summary.uuid].append(msg_uuid)
 
                 if msg_uuid in root_uuids:
@@ -382,13 +453,8 @@ class SessionParser:
     # Keep old method for compatibility
     def parse_record(self, data: dict[str, Any]) -> Message | None:
         """Parse a dict record into a Message (legacy, for orjson compatibility)."""
-        msg_type_str = data.get("type")
-        if not msg_type_str:
-            return None
-
-        try:
-            msg_type = MessageType(msg_type_str)
-        except ValueError:
+        msg_type = _MESSAGE_TYPES.get(data.get("type"))
+        if msg_type is None:
             return None
 
         uuid = data.get("uuid", "")
@@ -422,28 +488,17 @@ class SessionParser:
             git_branch=data.get("gitBranch"),
             version=data.get("version"),
             is_sidechain=data.get("isSidechain", False),
-            raw=data,
+            raw=data if self.retain_raw else None,
         )
 
-        message_data = data.get("message", {})
-        if msg_type == MessageType.USER:
-            self._parse_user_legacy(msg, data, message_data)
-        elif msg_type == MessageType.ASSISTANT:
-            self._parse_assistant_legacy(msg, data, message_data)
-        elif msg_type == MessageType.SUMMARY:
-            self._parse_summary_legacy(msg, data, message_data)
-        elif msg_type == MessageType.FILE_HISTORY_SNAPSHOT:
-            self._parse_snapshot_legacy(msg, data)
+        handler = self._dispatch_legacy.get(msg_type)
+        if handler is not None:
+            handler(msg, data, data.get("message", {}))
 
         return msg
 
     def _parse_user_legacy(self, msg: Message, data: dict, message_data: dict) -> None:
-        user_type_str = data.get("userType")
-        if user_type_str:
-            try:
-                msg.user_type = UserType(user_type_str)
-            except ValueError:
-                pass
+        msg.user_type = _USER_TYPES.get(data.get("userType"))
 
         content = message_data.get("content", "")
         if isinstance(content, str):
@@ -518,19 +573,28 @@ class SessionParser:
         if leaf_uuid:
             msg.parent_uuid = leaf_uuid
 
-    def _parse_snapshot_legacy(self, msg: Message, data: dict) -> None:
+    def _parse_snapshot_legacy(
+        self, msg: Message, data: dict, message_data: dict | None = None
+    ) -> None:
         msg.snapshot_data = data.get("snapshot", data)
         message_id = data.get("messageId")
         if message_id:
             msg.parent_uuid = message_id
 
 
+def _parse_one(path: Path) -> MessageTree:
+    """Parse a single JSONL file (module-level so it can run in a worker process)."""
+    return SessionParser().parse_file(path)
+
+
 def extract_file_paths_from_message(msg: Message) -> list[str]:
     """Extract file paths mentioned in tool uses within a message."""
-    paths = []
-    for tool_use in msg.tool_uses:
-        if tool_use.name in ("Read", "Write", "Edit", "Glob", "Grep"):
-            file_path = tool_use.input.get("file_path") or tool_use.input.get("path")
-            if file_path:
-                paths.append(file_path)
-    return paths
+    if not msg.tool_uses:
+        return []
+    return [
+        file_path
+        for tool_use in msg.tool_uses
+        if tool_use.name in _FILE_TOOLS
+        for file_path in (tool_use.input.get("file_path") or tool_use.input.get("path"),)
+        if file_path
+    ]
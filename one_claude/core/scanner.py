@@ -1,10 +1,19 @@
 """Scanner for discovering Claude Code sessions in ~/.claude."""
 
-import hashlib
+import heapq
+import mmap
+import os
 import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Collection
+from dataclasses import replace
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
+from one_claude.core.file_history import compute_path_hash  # noqa: F401 (re-exported)
 from one_claude.core.models import (
     ConversationPath,
     FileCheckpoint,
@@ -14,7 +23,83 @@ from one_claude.core.models import (
     Project,
     Session,
 )
-from one_claude.core.parser import SessionParser
+from one_claude.core.parser import SessionParser, _parse_one
+from one_claude.core.session_index import SessionEntries, SessionIndex
+from one_claude.core.tree_cache import TreeCache
+
+# Checkpoint files are named <16 hex path hash>@v<version>
+_CHECKPOINT_RE = re.compile(r"^([a-f0-9]{16})@v(\d+)$")
+
+# Escaped project names use "-" for "/"
+_DASH_TO_SLASH = str.maketrans("-", "/")
+
+# Below this many files, process pool startup costs more than it saves
+_PARALLEL_PARSE_MIN = 4
+
+# JSONL files at least this large are memory-mapped while scanning
+_MMAP_MIN = 1 << 20
+
+# Below this many changed JSONLs in a project, scan them on the calling thread
+_PARALLEL_SCAN_MIN = 8
+
+# Seconds a scan stays fresh enough for session lookups by ID
+_INDEX_MAX_AGE = 2.0
+
+# A directory listing is only reused if the directory's mtime was this far
+# behind the listing, so changes within one timestamp tick aren't missed
+_LISTING_RACY_NS = 1_000_000_000
+
+_by_updated = attrgetter("updated_at")
+_by_created = attrgetter("created_at")
+
+
+def _first_text_block(content: list) -> str:
+    """Text of the first text block in a message content list."""
+    try:
+        # Usually the first block is the text itself
+        first = content[0]
+        if first["type"] == "text":
+            return first.get("text", "")
+    except (IndexError, KeyError, TypeError):
+        pass
+    return next(
+        (
+            block.get("text", "")
+            for block in content
+            if isinstance(block, dict) and block.get("type") == "text"
+        ),
+        "",
+    )
+
+
+def _count_line_types(buf: bytes | mmap.mmap, start: int) -> Counter:
+    """Count JSONL records in buf[start:] by top-level "type".
+
+    Nested payloads carry their own "type" keys (an assistant record's
+    message has "type":"message" ahead of the outer key), so a substring
+    match is only trusted when it is the line's sole "type"; other lines
+    are decoded.
+    """
+    import orjson
+
+    counts: Counter = Counter()
+    size = len(buf)
+    while start < size:
+        end = buf.find(b"\n", start)
+        if end < 0:
+            end = size
+        if end > start:
+            idx = buf.find(b'"type":"', start, end)
+            type_end = buf.find(b'"', idx + 8, end) if idx >= 0 else -1
+            if type_end > 0 and buf.find(b'"type":', type_end, end) < 0:
+                counts[buf[idx + 8 : type_end]] += 1
+            else:
+                try:
+                    counts[str(orjson.loads(buf[start:end]).get("type", "")).encode()] += 1
+                except Exception:
+                    pass
+        start = end + 1
+    return counts
 
 
 class ClaudeScanner:
@@ -25,37 +110,221 @@ class ClaudeScanner:
         self.projects_dir = self.claude_dir / "projects"
         self.file_history_dir = self.claude_dir / "file-history"
         self.parser = SessionParser()
+        self.tree_cache = TreeCache(self.claude_dir)
+        # Scan results reused while files are unchanged:
+        # project dir -> jsonl name -> (mtime_ns, size, Session or None if skipped)
+        self._session_cache: SessionEntries = {}
+        # Persists _session_cache between runs; loaded on the first scan
+        self.session_index = SessionIndex(self.claude_dir)
+        self._index_loaded = False
+        self._index_dirty = False  # _session_cache changed since it was saved
+        # project dir -> (dir mtime_ns, time listed in ns, [(jsonl name, path)]);
+        # the directory mtime only changes when files are added or removed
+        self._listing_cache: dict[Path, tuple[int, int, list[tuple[str, str]]]] = {}
+        # escaped project name -> resolved display path (resolution probes the fs)
+        self._display_path_cache: dict[str, str] = {}
+        # Guards both caches above; projects are scanned from worker threads
+        self._cache_lock = threading.Lock()
+        # Lookup indexes rebuilt on every scan_all()
+        self._by_id: dict[str, Session] = {}
+        self._children: dict[str, list[Session]] = {}
+        # (monotonic time, projects) of the last full scan
+        self._last_scan: tuple[float, list[Project]] | None = None
+        # Tree cache entries of deleted sessions are dropped after the first scan
+        self._tree_cache_pruned = False
+
+    def scan_all(
+        self, max_age: float = 0.0, changed: Collection[Path] | None = None
+    ) -> list[Project]:
+        """Discover all projects and their sessions.
+
+        Args:
+            max_age: Reuse the previous scan if it is at most this many seconds old
+            changed: Session files known to have changed; once a scan exists,
+                only the projects containing them are rescanned
+        """
+        last = self._last_scan
+        if max_age > 0 and last is not None and time.monotonic() - last[0] <= max_age:
+            return list(last[1])
+        if changed is not None and last is not None:
+            return self._rescan_projects(changed, last[1])
 
-    def scan_all(self) -> list[Project]:
-        """Discover all projects and their sessions."""
+        started = time.monotonic()
         projects = []
 
-        if not self.projects_dir.exists():
-            return projects
+        if not self._index_loaded:
+            self._index_loaded = True
+            saved = self.session_index.load()
+            with self._cache_lock:
+                for project_dir, entries in saved.items():
+                    self._session_cache.setdefault(project_dir, entries)
 
-        for project_dir in sorted(self.projects_dir.iterdir()):
-            if project_dir.is_dir():
-                project = self._scan_project(project_dir)
+        try:
+            with os.scandir(self.projects_dir) as it:
+                project_dirs = sorted(Path(e.path) for e in it if e.is_dir())
+        except OSError:
+            # Unreadable or missing projects dir: keep the saved index for the
+            # next successful scan, and don't reuse this empty result
+            self._rebuild_indexes(projects)
+            return []
+
+        if not project_dirs:
+            self._rebuild_indexes(projects)
+            self._last_scan = (started, projects)
+            self._save_index(project_dirs)
+            return list(projects)
+
+        # Project scans are dominated by directory listing and stat calls, so
+        # overlap them across threads; map() keeps the sorted order
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(32, len(project_dirs))) as executor:
+            for project in executor.map(self._scan_project, project_dirs):
                 if project.sessions:
                     projects.append(project)
 
-        return projects
+        self._rebuild_indexes(projects)
+        self._last_scan = (started, projects)
+        self._save_index(project_dirs)
+        if not self._tree_cache_pruned:
+            self._tree_cache_pruned = True
+            with self._cache_lock:
+                live = [
+                    project_dir / name
+                    for project_dir, files in self._session_cache.items()
+                    for name in files
+                ]
+            self.tree_cache.prune(live)
+        return list(projects)
+
+    def _rescan_projects(
+        self, changed: Collection[Path], previous: list[Project]
+    ) -> list[Project]:
+        """Update a previous scan_all() result for changed session files."""
+        started = time.monotonic()
+        project_dirs: set[Path] = set()
+        for path in changed:
+            try:
+                name = path.relative_to(self.projects_dir).parts[0]
+            except (ValueError, IndexError):
+                continue
+            project_dirs.add(self.projects_dir / name)
+
+        by_name = {project.path: project for project in previous}
+        gone: set[Path] = set()
+        for project_dir in project_dirs:
+            project = self._scan_project(project_dir) if project_dir.is_dir() else None
+            if project is None:
+                gone.add(project_dir)
+            if project is not None and project.sessions:
+                by_name[project_dir.name] = project
+            else:
+                by_name.pop(project_dir.name, None)
+
+        projects = [by_name[name] for name in sorted(by_name)]
+        self._rebuild_indexes(projects)
+        self._last_scan = (started, projects)
+        with self._cache_lock:
+            known = list(self._session_cache.keys() - gone)
+        self._save_index(known)
+        return list(projects)
+
+    def _save_index(self, project_dirs: list[Path]) -> None:
+        """Persist scanned session metadata if the scan changed it."""
+        with self._cache_lock:
+            # Forget projects that no longer exist
+            for project_dir in self._session_cache.keys() - set(project_dirs):
+                del self._session_cache[project_dir]
+                self._index_dirty = True
+            if not self._index_dirty:
+                return
+            self._index_dirty = False
+            # Loaded message trees belong to this run, not the index
+            entries: SessionEntries = {
+                project_dir: {
+                    name: (
+                        (mtime_ns, size, replace(session, message_tree=None))
+                        if session is not None and session.message_tree is not None
+                        else (mtime_ns, size, session)
+                    )
+                    for name, (mtime_ns, size, session) in files.items()
+                }
+                for project_dir, files in self._session_cache.items()
+            }
+        self.session_index.save(entries)
+
+    def _rebuild_indexes(self, projects: list[Project]) -> None:
+        """Index sessions by ID and agent sessions by parent ID."""
+        by_id: dict[str, Session] = {}
+        children: dict[str, list[Session]] = {}
+        for project in projects:
+            for session in project.sessions:
+                by_id.setdefault(session.id, session)
+                if session.is_agent and session.parent_session_id:
+                    children.setdefault(session.parent_session_id, []).append(session)
+        for agents in children.values():
+            agents.sort(key=_by_created)
+        self._by_id = by_id
+        self._children = children
 
     def _scan_project(self, project_dir: Path) -> Project:
         """Scan a single project directory."""
         escaped_path = project_dir.name
-        display_path = self._unescape_path(escaped_path)
+        with self._cache_lock:
+            display_path = self._display_path_cache.get(escaped_path)
+        if display_path is None:
+            display_path = self._unescape_path(escaped_path)
+            with self._cache_lock:
+                self._display_path_cache[escaped_path] = display_path
 
         project = Project(path=escaped_path, display_path=display_path)
 
-        # Find all session JSONL files
-        for jsonl_file in sorted(project_dir.glob("*.jsonl")):
-            session = self._scan_session_file(jsonl_file, project)
-            if session:
-                project.sessions.append(session)
+        entries = self._list_jsonl_files(project_dir)
+
+        # Reuse sessions whose JSONL is unchanged since the last scan
+        with self._cache_lock:
+            cached = self._session_cache.get(project_dir, {})
+        fresh: dict[str, tuple[int, int, Session | None]] = {}
+        stale: list[tuple[str, str, os.stat_result]] = []
+        for name, path in entries:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            hit = cached.get(name)
+            if hit is not None and hit[0] == stat.st_mtime_ns and hit[1] == stat.st_size:
+                fresh[name] = hit
+            else:
+                stale.append((name, path, stat))
+
+        def scan(item: tuple[str, str, os.stat_result]) -> Session | None:
+            _, path, stat = item
+            return self._scan_session_file(Path(path), project, stat)
+
+        if len(stale) >= _PARALLEL_SCAN_MIN:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(8, len(stale))) as executor:
+                scanned = list(executor.map(scan, stale))
+        else:
+            scanned = [scan(item) for item in stale]
+        for (name, _, stat), session in zip(stale, scanned):
+            fresh[name] = (stat.st_mtime_ns, stat.st_size, session)
+
+        # Keep sessions in filename order regardless of which were rescanned
+        for name, _ in entries:
+            hit = fresh.get(name)
+            if hit is not None and hit[2]:
+                project.sessions.append(hit[2])
+        with self._cache_lock:
+            self._session_cache[project_dir] = fresh
+            if stale or len(fresh) != len(cached):
+                self._index_dirty = True
 
         # Link agent sessions to their parents
         sessions_by_id = {s.id: s for s in project.sessions}
+        for session in project.sessions:
+            session.child_agent_ids.clear()
         for session in project.sessions:
             if session.is_agent and session.parent_session_id:
                 parent = sessions_by_id.get(session.parent_session_id)
@@ -63,14 +332,52 @@ class ClaudeScanner:
                     parent.child_agent_ids.append(session.id)
 
         # Sort sessions by updated_at descending
-        project.sessions.sort(key=lambda s: s.updated_at, reverse=True)
+        project.sessions.sort(key=_by_updated, reverse=True)
 
         return project
 
-    def _scan_session_file(self, jsonl_path: Path, project: Project) -> Session | None:
+    def _list_jsonl_files(self, project_dir: Path) -> list[tuple[str, str]]:
+        """(name, path) of each session JSONL in a project, sorted by name.
+
+        The listing is reused while the directory's mtime is unchanged, so
+        an unchanged project costs one stat instead of a readdir.
+        """
+        try:
+            dir_mtime = os.stat(project_dir).st_mtime_ns
+        except OSError:
+            return []
+        with self._cache_lock:
+            cached = self._listing_cache.get(project_dir)
+        if (
+            cached is not None
+            and cached[0] == dir_mtime
+            and dir_mtime < cached[1] - _LISTING_RACY_NS
+        ):
+            return cached[2]
+
+        listed_at = time.time_ns()
+        # DirEntry reuses readdir's file type
+        try:
+            with os.scandir(project_dir) as it:
+                entries = [
+                    (e.name, e.path)
+                    for e in it
+                    if e.name.endswith(".jsonl") and e.is_file(follow_symlinks=False)
+                ]
+        except OSError:
+            return []
+        entries.sort()
+        with self._cache_lock:
+            self._listing_cache[project_dir] = (dir_mtime, listed_at, entries)
+        return entries
+
+    def _scan_session_file(
+        self, jsonl_path: Path, project: Project, stat: os.stat_result | None = None
+    ) -> Session | None:
         """Scan a single session JSONL file for metadata."""
         try:
-            stat = jsonl_path.stat()
+            if stat is None:
+                stat = jsonl_path.stat()
             updated_at = datetime.fromtimestamp(stat.st_mtime)
 
             # Extract session ID from filename
@@ -87,17 +394,29 @@ class ClaudeScanner:
             first_timestamp: datetime | None = None
             first_user_message = ""
 
-            # Track for branch detection
-            parent_child_count: dict[str, int] = {}  # parent_uuid -> child count
-            tool_result_parents: set[str] = set()  # Parents with tool_result children
-
             with open(jsonl_path, "rb") as f:
+                # Map large files instead of copying them into memory
+                if stat.st_size >= _MMAP_MIN:
+                    buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    buf = f.read()
+            try:
+                header_done = False
+                start = 0
+                size = len(buf)
+
                 import orjson
 
-                for line in f:
-                    line = line.strip()
+                # Decode lines only until the metadata is known (usually a few lines)
+                while start < size and not header_done:
+                    end = buf.find(b"\n", start)
+                    if end < 0:
+                        end = size
+                    line = buf[start:end]
+                    start = end + 1
                     if not line:
                         continue
+
                     try:
                         data = orjson.loads(line)
 
@@ -113,23 +432,6 @@ class ClaudeScanner:
                             if msg_type in ("user", "assistant"):
                                 has_real_messages = True
 
-                                # Track parent-child relationships for branch detection
-                                parent_uuid = data.get("parentUuid")
-                                if parent_uuid:
-                                    parent_child_count[parent_uuid] = (
-                                        parent_child_count.get(parent_uuid, 0) + 1
-                                    )
-
-                                    # Check if this is a tool_result (parallel tool call)
-                                    if msg_type == "user":
-                                        message_data = data.get("message", {})
-                                        content = message_data.get("content", [])
-                                        if isinstance(content, list):
-                                            for block in content:
-                                                if isinstance(block, dict) and block.get("type") == "tool_result":
-                                                    tool_result_parents.add(parent_uuid)
-                                                    break
-
                             # Get first timestamp
                             if first_timestamp is None:
                                 ts_str = data.get("timestamp", "")
@@ -148,20 +450,29 @@ class ClaudeScanner:
                                 if isinstance(content, str):
                                     first_user_message = content
                                 elif isinstance(content, list):
-                                    for block in content:
-                                        if isinstance(block, dict) and block.get("type") == "text":
-                                            first_user_message = block.get("text", "")
-                                            break
+                                    first_user_message = _first_text_block(content)
                     except Exception:
                         continue
 
-            # Count real forks (exclude parallel tool calls)
-            real_forks = sum(
-                1
-                for parent, count in parent_child_count.items()
-                if count > 1 and parent not in tool_result_parents
-            )
-            branch_count = real_forks + 1
+                    header_done = (
+                        first_timestamp is not None
+                        and bool(first_user_message)
+                        and (not is_agent or parent_session_id is not None)
+                    )
+
+                if header_done:
+                    # Only counts remain. Whole-buffer substring counts would
+                    # also pick up nested "type" keys, so records are
+                    # classified line by line.
+                    type_counts = _count_line_types(buf, start)
+                    real_count = type_counts[b"user"] + type_counts[b"assistant"]
+                    message_count += real_count + type_counts[b"summary"]
+                    checkpoint_count += type_counts[b"file-history-snapshot"]
+                    if real_count:
+                        has_real_messages = True
+            finally:
+                if isinstance(buf, mmap.mmap):
+                    buf.close()
 
             # Skip sessions with no messages or only summaries (can't be resumed)
             if message_count == 0 or not has_real_messages:
@@ -195,8 +506,7 @@ class ClaudeScanner:
             return "Untitled Session"
 
         # Clean up and truncate
-        title = first_message.strip()
-        title = re.sub(r"\s+", " ", title)  # Normalize whitespace
+        title = " ".join(first_message.split())  # Normalize whitespace
 
         if len(title) > 200:
             title = title[:197] + "..."
@@ -214,14 +524,14 @@ class ClaudeScanner:
         We try different combinations to find the actual path.
         """
         if not escaped.startswith("-"):
-            return escaped.replace("-", "/")
+            return escaped.translate(_DASH_TO_SLASH)
 
         # Handle -- which encodes /. (hidden dirs like .local)
         # Replace -- with /. before processing
         normalized = escaped.replace("--", "-.")
 
         # Start with simple replacement
-        path = "/" + normalized[1:].replace("-", "/")
+        path = normalized.translate(_DASH_TO_SLASH)
 
         # If path exists, return it
         if Path(path).exists():
@@ -265,10 +575,73 @@ class ClaudeScanner:
         if session.message_tree is not None:
             return session.message_tree
 
-        tree = self.parser.parse_file(session.jsonl_path)
+        tree = self._parse_tree(session.jsonl_path)
         session.message_tree = tree
         return tree
 
+    def _parse_tree(self, path: Path) -> MessageTree:
+        """Parse a JSONL file, going through the on-disk tree cache."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return self.parser.parse_file(path)
+
+        tree = self.tree_cache.get(path, stat)
+        if tree is None:
+            tree = self.parser.parse_file(path)
+            self.tree_cache.put(path, stat, tree)
+        return tree
+
+    def load_session_messages_bulk(self, sessions: list[Session]) -> None:
+        """Parse message trees for many sessions, in parallel across processes.
+
+        Each JSONL file is independent, so parsing is spread over a process
+        pool. Trees are stored on each session's ``message_tree``. Workers come
+        from a forkserver (or are spawned), never forked from this process,
+        since callers such as the TUI run this in a thread.
+        """
+        # Serve what we can from the on-disk cache first
+        pending: list[tuple[Session, os.stat_result]] = []
+        for session in sessions:
+            if session.message_tree is not None:
+                continue
+            try:
+                stat = session.jsonl_path.stat()
+            except OSError:
+                continue
+            tree = self.tree_cache.get(session.jsonl_path, stat)
+            if tree is not None:
+                session.message_tree = tree
+            else:
+                pending.append((session, stat))
+        if not pending:
+            return
+
+        if len(pending) >= _PARALLEL_PARSE_MIN:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            try:
+                if "forkserver" in multiprocessing.get_all_start_methods():
+                    context = multiprocessing.get_context("forkserver")
+                else:
+                    context = multiprocessing.get_context("spawn")
+                workers = min(os.cpu_count() or 1, len(pending))
+                with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                    trees = executor.map(
+                        _parse_one, [s.jsonl_path for s, _ in pending], chunksize=4
+                    )
+                    for (session, stat), tree in zip(pending, trees):
+                        session.message_tree = tree
+                        self.tree_cache.put(session.jsonl_path, stat, tree)
+                return
+            except Exception:
+                # Pool unavailable (restricted env, broken worker) - parse serially
+                pass
+
+        for session, _ in pending:
+            self.load_session_messages(session)
+
     def get_file_checkpoints(self, session_id: str) -> list[FileCheckpoint]:
         """Get all file checkpoints for a session."""
         checkpoints = []
@@ -277,59 +650,64 @@ class ClaudeScanner:
         if not session_history_dir.exists():
             return checkpoints
 
-        # Parse checkpoint files: <hash>@v<version>
-        checkpoint_pattern = re.compile(r"^([a-f0-9]{16})@v(\d+)$")
-
-        for checkpoint_file in sorted(session_history_dir.iterdir()):
-            if checkpoint_file.is_file():
-                match = checkpoint_pattern.match(checkpoint_file.name)
-                if match:
-                    path_hash = match.group(1)
-                    version = int(match.group(2))
-                    checkpoints.append(
-                        FileCheckpoint(
-                            path_hash=path_hash,
-                            version=version,
-                            session_id=session_id,
-                            file_path=checkpoint_file,
-                        )
+        with os.scandir(session_history_dir) as it:
+            entries = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+
+        for entry in entries:
+            match = _CHECKPOINT_RE.match(entry.name)
+            if match:
+                path_hash = match.group(1)
+                version = int(match.group(2))
+                checkpoints.append(
+                    FileCheckpoint(
+                        path_hash=path_hash,
+                        version=version,
+                        session_id=session_id,
+                        file_path=Path(entry.path),
                     )
+                )
 
         return checkpoints
 
-    def get_sessions_flat(self, include_agents: bool = False) -> list[Session]:
-        """Get all sessions across all projects as a flat list."""
-        sessions = []
-        for project in self.scan_all():
-            for session in project.sessions:
-                if include_agents or not session.is_agent:
-                    sessions.append(session)
-        # Sort by updated_at descending
-        sessions.sort(key=lambda s: s.updated_at, reverse=True)
-        return sessions
+    def get_sessions_flat(
+        self, include_agents: bool = False, max_age: float = 0.0
+    ) -> list[Session]:
+        """Get all sessions across all projects as a flat list.
+
+        max_age is passed to scan_all().
+        """
+        # Each project's sessions are already newest first, so merge them
+        return list(
+            heapq.merge(
+                *(
+                    project.sessions if include_agents else project.user_sessions
+                    for project in self.scan_all(max_age=max_age)
+                ),
+                key=_by_updated,
+                reverse=True,
+            )
+        )
 
     def get_session_by_id(self, session_id: str) -> Session | None:
         """Get a session by its ID."""
-        for project in self.scan_all():
-            for session in project.sessions:
-                if session.id == session_id:
-                    return session
-        return None
+        self.scan_all(max_age=_INDEX_MAX_AGE)
+        session = self._by_id.get(session_id)
+        if session is None:
+            # The session may have been created since the last scan
+            self.scan_all()
+            session = self._by_id.get(session_id)
+        return session
 
     def get_agent_sessions(self, parent_session_id: str) -> list[Session]:
         """Get all agent sessions for a parent session."""
-        agents = []
-        for project in self.scan_all():
-            for session in project.sessions:
-                if session.is_agent and session.parent_session_id == parent_session_id:
-                    agents.append(session)
-        agents.sort(key=lambda s: s.created_at)
-        return agents
+        self.scan_all()
+        return list(self._children.get(parent_session_id, []))
 
     def scan_conversation_paths(
         self,
         tree_cache: dict[str, MessageTree] | None = None,
         include_agents: bool = False,
+        max_age: float = 0.0,
     ) -> list[ConversationPath]:
         """Scan all sessions and return ConversationPaths.
 
@@ -340,12 +718,13 @@ class ClaudeScanner:
         Args:
             tree_cache: Optional pre-loaded message tree cache (session_id -> tree)
             include_agents: Whether to include agent sessions
+            max_age: Reuse a scan_all() at most this many seconds old
 
         Returns:
             List of ConversationPaths, sorted by updated_at descending.
         """
         tree_cache = tree_cache or {}
-        sessions = self.get_sessions_flat(include_agents=include_agents)
+        sessions = self.get_sessions_flat(include_agents=include_agents, max_age=max_age)
 
         # Build a map of session_id -> session for easy lookup
         sessions_by_id: dict[str, Session] = {s.id: s for s in sessions}
@@ -365,6 +744,7 @@ class ClaudeScanner:
         # Build a map of message_uuid -> session_id for efficient continuation lookup
         # This avoids O(n²) lookups
         uuid_to_session: dict[str, str] = {}
+        self.load_session_messages_bulk([s for s in sessions if s.id not in tree_cache])
         for session in sessions:
             tree = tree_cache.get(session.id) or self.load_session_messages(session)
             tree_cache[session.id] = tree
@@ -671,7 +1051,7 @@ class ClaudeScanner:
                     if session_id in tree_cache:
                         tree = tree_cache[session_id]
                     else:
-                        tree = self.parser.parse_file(jsonl_file)
+                        tree = self._parse_tree(jsonl_file)
                         tree_cache[session_id] = tree
                     if fork_uuid in tree.messages:
                         fork_tree = tree
@@ -688,11 +1068,7 @@ class ClaudeScanner:
                 continue
 
             # Sort children by timestamp (oldest first = main line)
-            def get_naive_ts(msg: Message) -> datetime:
-                ts = msg.timestamp
-                return ts.replace(tzinfo=None) if ts.tzinfo else ts
-
-            fork_children.sort(key=get_naive_ts)
+            fork_children.sort(key=attrgetter("_naive_ts"))
             oldest_child_uuid = fork_children[0].uuid
 
             # Find which path goes through the oldest child (main line)
@@ -742,7 +1118,7 @@ class ClaudeScanner:
                     if session_id in tree_cache:
                         tree = tree_cache[session_id]
                     else:
-                        tree = self.parser.parse_file(jsonl_file)
+                        tree = self._parse_tree(jsonl_file)
                         tree_cache[session_id] = tree
                     all_uuids.update(tree.messages.keys())
                 path_chain_uuids[path.leaf_uuid] = all_uuids
@@ -797,8 +1173,7 @@ class ClaudeScanner:
 
             if candidates:
                 # Pick the candidate with the shortest chain (most direct parent)
-                candidates.sort(key=lambda x: x[1])
-                best_parent = candidates[0][0]
+                best_parent = min(candidates, key=itemgetter(1))[0]
                 path_parent[path.leaf_uuid] = best_parent
                 path_children[best_parent].append(path.leaf_uuid)
 
@@ -966,7 +1341,7 @@ class ClaudeScanner:
             render_groups.append((group_ts, True, group))
 
         # Sort by timestamp descending
-        render_groups.sort(key=lambda g: g[0], reverse=True)
+        render_groups.sort(key=itemgetter(0), reverse=True)
 
         # Render all groups
         for _, is_sibling_group, path_ids in render_groups:
@@ -1004,7 +1379,7 @@ class ClaudeScanner:
             if session_id in tree_cache:
                 tree = tree_cache[session_id]
             else:
-                tree = self.parser.parse_file(newest_file)
+                tree = self._parse_tree(newest_file)
                 tree_cache[session_id] = tree
 
             # Get linear path
@@ -1044,7 +1419,7 @@ class ClaudeScanner:
         if session_id in tree_cache:
             tree = tree_cache[session_id]
         else:
-            tree = self.parser.parse_file(newest_file)
+            tree = self._parse_tree(newest_file)
             tree_cache[session_id] = tree
 
         # Get linear path (also caches on path.messages)
@@ -1055,8 +1430,3 @@ class ClaudeScanner:
             path.messages = messages
 
         return messages, tree
-
-
-def compute_path_hash(file_path: str) -> str:
-    """Compute the hash used for file-history filenames."""
-    return hashlib.sha256(file_path.encode()).hexdigest()[:16]
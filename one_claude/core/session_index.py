@@ -0,0 +1,52 @@
+"""On-disk index of scanned session metadata."""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from one_claude.core.models import Session, field_layout
+
+# Changes with the Session layout so stale pickles are ignored
+_INDEX_VERSION = field_layout(Session)
+
+# project dir -> jsonl name -> (mtime_ns, size, Session or None if skipped)
+SessionEntries = dict[Path, dict[str, tuple[int, int, Session | None]]]
+
+
+class SessionIndex:
+    """Keeps the scanner's per-file session metadata between runs.
+
+    Entries carry the JSONL mtime and size they were scanned at, so only
+    files that changed since the last run are read again.
+    """
+
+    def __init__(self, claude_dir: Path, cache_dir: Path | None = None):
+        self.cache_dir = cache_dir or Path.home() / ".cache" / "one_claude"
+        digest = hashlib.sha1(str(claude_dir).encode()).hexdigest()[:16]
+        self.path = self.cache_dir / f"sessions-{digest}.pickle"
+
+    def load(self) -> SessionEntries:
+        """Return the saved entries, or nothing if they are missing or stale."""
+        try:
+            with open(self.path, "rb") as f:
+                version, entries = pickle.load(f)
+        except Exception:
+            return {}
+        if version != _INDEX_VERSION:
+            return {}
+        return entries
+
+    def save(self, entries: SessionEntries) -> None:
+        """Store entries, replacing the previous index atomically."""
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump((_INDEX_VERSION, entries), f, protocol=5)
+            os.replace(tmp, self.path)
+        except Exception:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,111 @@
+"""On-disk cache of parsed message trees."""
+
+import hashlib
+import os
+import pickle
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from one_claude.core.models import (
+    Message,
+    MessageTree,
+    ThinkingBlock,
+    ToolResult,
+    ToolUse,
+    TreeNode,
+    field_layout,
+)
+
+# Changes with the MessageTree/Message layout so stale pickles are ignored
+_CACHE_VERSION = field_layout(MessageTree, TreeNode, Message, ToolUse, ToolResult, ThinkingBlock)
+
+# Files written to this recently are still growing; caching them would
+# re-pickle the whole tree on every append
+_SETTLE_SECONDS = 5.0
+
+# Oldest entries are pruned once the cache is larger than this
+_MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+
+class TreeCache:
+    """Caches parsed MessageTrees keyed by JSONL path, mtime and size.
+
+    A JSONL that shrank (compaction) or was touched no longer matches its
+    entry and is re-parsed. prune() drops entries for JSONLs that are gone
+    and caps the cache's size.
+    """
+
+    def __init__(self, claude_dir: Path, cache_dir: Path | None = None):
+        root = cache_dir or Path.home() / ".cache" / "one_claude" / "trees"
+        # One directory per ~/.claude, so prune() only sees that tree's sessions
+        digest = hashlib.sha1(str(claude_dir).encode()).hexdigest()[:16]
+        self.cache_dir = root / digest
+
+    def _entry_path(self, path: Path) -> Path:
+        digest = hashlib.sha1(str(path).encode()).hexdigest()
+        return self.cache_dir / f"{digest}.pickle"
+
+    def get(self, path: Path, stat: os.stat_result) -> MessageTree | None:
+        """Return the cached tree if it matches the file's current stat."""
+        try:
+            with open(self._entry_path(path), "rb") as f:
+                version, mtime_ns, size, tree = pickle.load(f)
+        except Exception:
+            return None
+        if version != _CACHE_VERSION or mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+            return None
+        return tree
+
+    def put(self, path: Path, stat: os.stat_result, tree: MessageTree) -> None:
+        """Store a parsed tree, replacing any previous entry atomically.
+
+        Files modified in the last _SETTLE_SECONDS are skipped.
+        """
+        if time.time() - stat.st_mtime < _SETTLE_SECONDS:
+            return
+        entry = self._entry_path(path)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump(
+                    (_CACHE_VERSION, stat.st_mtime_ns, stat.st_size, tree),
+                    f,
+                    protocol=5,
+                )
+            os.replace(tmp, entry)
+        except Exception:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def prune(self, live_paths: Iterable[Path], max_bytes: int = _MAX_CACHE_BYTES) -> None:
+        """Delete entries for JSONLs not in live_paths, then the oldest over max_bytes."""
+        live = {self._entry_path(path).name for path in live_paths}
+        kept: list[tuple[float, int, str]] = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    try:
+                        if entry.name not in live:
+                            os.unlink(entry.path)
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    kept.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in kept)
+        kept.sort()
+        for _, size, path in kept:
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
@@ -10,6 +10,11 @@ GIST_API = "https://api.github.com/gists"
 CLIENT_ID = os.environ.get("GITHUB_CLIENT_ID", "Iv23liW8XnbC7QiqENOl")
 TOKEN_FILE = Path.home() / ".one_claude" / "github_token"
 
+# Device-flow polling: longest wait between retries, and consecutive network
+# failures tolerated before giving up
+_POLL_MAX_DELAY = 60
+_POLL_MAX_FAILURES = 5
+
 
 def get_token() -> str | None:
     """Get stored GitHub token."""
@@ -52,20 +57,35 @@ async def start_device_flow() -> tuple[dict | None, str | None]:
 
 
 async def poll_for_token(device_code: str, interval: int = 5) -> tuple[str | None, str | None]:
-    """Poll for token after user authorizes."""
+    """Poll for token after user authorizes.
+
+    Transient network failures back off exponentially (up to a minute) and
+    give up after a few in a row.
+    """
+    delay = interval
+    failures = 0
     async with httpx.AsyncClient() as client:
         while True:
-            await asyncio.sleep(interval)
-            resp = await client.post(
-                "https://github.com/login/oauth/access_token",
-                headers={"Accept": "application/json"},
-                data={
-                    "client_id": CLIENT_ID,
-                    "device_code": device_code,
-                    "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
-                },
-            )
-            result = resp.json()
+            await asyncio.sleep(delay)
+            try:
+                resp = await client.post(
+                    "https://github.com/login/oauth/access_token",
+                    headers={"Accept": "application/json"},
+                    data={
+                        "client_id": CLIENT_ID,
+                        "device_code": device_code,
+                        "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
+                    },
+                )
+                result = resp.json()
+            except (httpx.RequestError, ValueError) as e:
+                failures += 1
+                if failures >= _POLL_MAX_FAILURES:
+                    return None, f"Network error: {e}"
+                delay = min(delay * 2, _POLL_MAX_DELAY)
+                continue
+            failures = 0
+            delay = interval
 
             if "access_token" in result:
                 token = result["access_token"]
@@ -77,6 +97,7 @@ async def poll_for_token(device_code: str, interval: int = 5) -> tuple[str | Non
                 continue
             elif error == "slow_down":
                 interval += 5
+                delay = interval
             elif error == "expired_token":
                 return None, "Code expired"
             elif error == "access_denied":
@@ -86,7 +107,33 @@ async def poll_for_token(device_code: str, interval: int = 5) -> tuple[str | Non
 
 
 class GistAPI:
-    """Async client for GitHub Gist API."""
+    """Async client for GitHub Gist API.
+
+    Reuses one HTTP client so repeated calls (e.g. fetching every file of a
+    gist) share pooled keep-alive connections. Call aclose() when done.
+    """
+
+    def __init__(self):
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared client, creating it for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            # A client's connections belong to the loop that opened them
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
 
     async def create(
         self,
@@ -98,34 +145,34 @@ class GistAPI:
         if not token:
             return None, "auth_needed"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.post(
-                    GIST_API,
-                    headers={
-                        "Accept": "application/vnd.github+json",
-                        "Authorization": f"Bearer {token}",
-                    },
-                    json={
-                        "description": description,
-                        "public": True,
-                        "files": {name: {"content": content} for name, content in files.items()},
-                    },
-                    timeout=60.0,
-                )
-                if resp.status_code == 201:
-                    return resp.json()["html_url"], None
-                elif resp.status_code == 401:
-                    clear_token()
-                    return None, "Token expired, try again"
-                elif resp.status_code == 422:
-                    return None, f"Validation failed: {resp.text}"
-                else:
-                    return None, f"GitHub API error: {resp.status_code}"
-            except httpx.TimeoutException:
-                return None, "Request timed out"
-            except httpx.RequestError as e:
-                return None, f"Network error: {e}"
+        client = self._get_client()
+        try:
+            resp = await client.post(
+                GIST_API,
+                headers={
+                    "Accept": "application/vnd.github+json",
+                    "Authorization": f"Bearer {token}",
+                },
+                json={
+                    "description": description,
+                    "public": True,
+                    "files": {name: {"content": content} for name, content in files.items()},
+                },
+                timeout=60.0,
+            )
+            if resp.status_code == 201:
+                return resp.json()["html_url"], None
+            elif resp.status_code == 401:
+                clear_token()
+                return None, "Token expired, try again"
+            elif resp.status_code == 422:
+                return None, f"Validation failed: {resp.text}"
+            else:
+                return None, f"GitHub API error: {resp.status_code}"
+        except httpx.TimeoutException:
+            return None, "Request timed out"
+        except httpx.RequestError as e:
+            return None, f"Network error: {e}"
 
     async def update(self, gist_id: str, files: dict[str, str]) -> tuple[bool, str | None]:
         """Update files in an existing gist."""
@@ -133,23 +180,23 @@ class GistAPI:
         if not token:
             return False, "No token"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.patch(
-                    f"{GIST_API}/{gist_id}",
-                    headers={
-                        "Accept": "application/vnd.github+json",
-                        "Authorization": f"Bearer {token}",
-                    },
-                    json={"files": {name: {"content": content} for name, content in files.items()}},
-                    timeout=60.0,
-                )
-                if resp.status_code == 200:
-                    return True, None
-                else:
-                    return False, f"Update failed: {resp.status_code}"
-            except Exception as e:
-                return False, str(e)
+        client = self._get_client()
+        try:
+            resp = await client.patch(
+                f"{GIST_API}/{gist_id}",
+                headers={
+                    "Accept": "application/vnd.github+json",
+                    "Authorization": f"Bearer {token}",
+                },
+                json={"files": {name: {"content": content} for name, content in files.items()}},
+                timeout=60.0,
+            )
+            if resp.status_code == 200:
+                return True, None
+            else:
+                return False, f"Update failed: {resp.status_code}"
+        except Exception as e:
+            return False, str(e)
 
     async def delete(self, gist_id: str) -> tuple[bool, str | None]:
         """Delete a gist."""
@@ -157,49 +204,58 @@ class GistAPI:
         if not token:
             return False, "No token"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.delete(
-                    f"{GIST_API}/{gist_id}",
-                    headers={
-                        "Accept": "application/vnd.github+json",
-                        "Authorization": f"Bearer {token}",
-                    },
-                    timeout=60.0,
-                )
-                if resp.status_code == 204:
-                    return True, None
-                else:
-                    return False, f"Delete failed: {resp.status_code}"
-            except Exception as e:
-                return False, str(e)
+        client = self._get_client()
+        try:
+            resp = await client.delete(
+                f"{GIST_API}/{gist_id}",
+                headers={
+                    "Accept": "application/vnd.github+json",
+                    "Authorization": f"Bearer {token}",
+                },
+                timeout=60.0,
+            )
+            if resp.status_code == 204:
+                return True, None
+            else:
+                return False, f"Delete failed: {resp.status_code}"
+        except Exception as e:
+            return False, str(e)
 
     async def get(self, gist_id: str) -> tuple[dict | None, str | None]:
         """Fetch a gist by ID."""
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.get(f"{GIST_API}/{gist_id}", timeout=60.0)
-                if resp.status_code == 200:
-                    return resp.json(), None
-                elif resp.status_code == 404:
-                    return None, "Gist not found"
-                else:
-                    return None, f"GitHub API error: {resp.status_code}"
-            except httpx.TimeoutException:
-                return None, "Request timed out"
-            except httpx.RequestError as e:
-                return None, f"Network error: {e}"
+        client = self._get_client()
+        try:
+            resp = await client.get(f"{GIST_API}/{gist_id}", timeout=60.0)
+            if resp.status_code == 200:
+                return resp.json(), None
+            elif resp.status_code == 404:
+                return None, "Gist not found"
+            else:
+                return None, f"GitHub API error: {resp.status_code}"
+        except httpx.TimeoutException:
+            return None, "Request timed out"
+        except httpx.RequestError as e:
+            return None, f"Network error: {e}"
+
+    async def get_raw_files(
+        self, raw_urls: list[str]
+    ) -> list[tuple[str | None, str | None]]:
+        """Fetch several raw files at once over the shared connection pool.
+
+        Results are in the same order as raw_urls.
+        """
+        return list(await asyncio.gather(*(self.get_raw_file(url) for url in raw_urls)))
 
     async def get_raw_file(self, raw_url: str) -> tuple[str | None, str | None]:
         """Fetch raw file content from a gist."""
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.get(raw_url, timeout=60.0)
-                if resp.status_code == 200:
-                    return resp.text, None
-                else:
-                    return None, f"Failed to fetch file: {resp.status_code}"
-            except httpx.TimeoutException:
-                return None, "Request timed out"
-            except httpx.RequestError as e:
-                return None, f"Network error: {e}"
+        client = self._get_client()
+        try:
+            resp = await client.get(raw_url, timeout=60.0)
+            if resp.status_code == 200:
+                return resp.text, None
+            else:
+                return None, f"Failed to fetch file: {resp.status_code}"
+        except httpx.TimeoutException:
+            return None, "Request timed out"
+        except httpx.RequestError as e:
+            return None, f"Network error: {e}"
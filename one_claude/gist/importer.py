@@ -199,6 +199,8 @@ class SessionImporter:
         # Track latest version for each file to restore to project
         latest_contents: dict[str, tuple[str, bytes]] = {}  # path_hash -> (original_path, content)
 
+        # Collect every checkpoint first so the downloads go out in one batch
+        wanted: list[tuple[str, int, str | None, str]] = []
         for path_hash, cp_info in manifest.items():
             versions = cp_info.get("versions", [])
             original_path = cp_info.get("original_path")
@@ -212,28 +214,31 @@ class SessionImporter:
                 raw_url = cp_file.get("raw_url")
                 if not raw_url:
                     continue
-
-                content, error = await self.api.get_raw_file(raw_url)
-                if error or content is None:
-                    continue
-
-                # Decode if base64
-                if _is_base64(content):
-                    content_bytes = base64.b64decode(content)
-                else:
-                    content_bytes = content.encode() if isinstance(content, str) else content
-
-                # Save to file-history
-                checkpoint_path = file_history_dir / f"{path_hash}@v{version}"
-                try:
-                    checkpoint_path.write_bytes(content_bytes)
-                    checkpoint_count += 1
-
-                    # Track latest version for project restore
-                    if original_path:
-                        latest_contents[path_hash] = (original_path, content_bytes)
-                except Exception:
-                    continue
+                wanted.append((path_hash, version, original_path, raw_url))
+
+        fetched = await self.api.get_raw_files([raw_url for *_, raw_url in wanted])
+
+        for (path_hash, version, original_path, _), (content, error) in zip(wanted, fetched):
+            if error or content is None:
+                continue
+
+            # Decode if base64
+            if _is_base64(content):
+                content_bytes = base64.b64decode(content)
+            else:
+                content_bytes = content.encode() if isinstance(content, str) else content
+
+            # Save to file-history
+            checkpoint_path = file_history_dir / f"{path_hash}@v{version}"
+            try:
+                checkpoint_path.write_bytes(content_bytes)
+                checkpoint_count += 1
+
+                # Track latest version for project restore
+                if original_path:
+                    latest_contents[path_hash] = (original_path, content_bytes)
+            except Exception:
+                continue
 
         # Restore latest checkpoint files to project directory (if requested)
         if restore_files and latest_contents:
@@ -8,6 +8,9 @@ import orjson
 from one_claude.core.models import MessageType, Session
 from one_claude.core.scanner import ClaudeScanner
 
+# Sessions per embedding request
+EMBED_BATCH_SIZE = 32
+
 
 class EmbeddingGenerator:
     """Generates embeddings using agentd/OpenAI."""
@@ -136,23 +139,65 @@ class EmbeddingGenerator:
         client = self._get_client()
         return client.embed_batch(texts)
 
+    def embed_sessions(
+        self, sessions: list[Session], scanner: ClaudeScanner
+    ) -> list[list[float] | None]:
+        """Generate embeddings for several sessions with one batched request.
+
+        Cached sessions are served from the cache. Returns one embedding per
+        session, or None where the session could not be embedded.
+        """
+        embeddings: list[list[float] | None] = [None] * len(sessions)
+        pending: list[int] = []
+        texts: list[str] = []
+
+        for i, session in enumerate(sessions):
+            cached = self._cache.get(f"session:{session.id}")
+            if cached is not None:
+                embeddings[i] = cached
+                continue
+            try:
+                texts.append(self._build_session_text(session, scanner))
+                pending.append(i)
+            except Exception:
+                pass
+
+        if not texts:
+            return embeddings
+
+        try:
+            batch = self.embed_batch(texts)
+        except Exception:
+            # Fall back to one request per session
+            batch = []
+            for text in texts:
+                try:
+                    batch.append(self._get_client().embed(text))
+                except Exception:
+                    batch.append(None)
+
+        for i, embedding in zip(pending, batch):
+            if embedding is not None:
+                embeddings[i] = embedding
+                self._cache[f"session:{sessions[i].id}"] = embedding
+
+        self._save_cache()
+        return embeddings
+
     def precompute_session_embeddings(
         self, sessions: list[Session], scanner: ClaudeScanner, progress_callback=None
     ) -> int:
         """Precompute embeddings for multiple sessions."""
         computed = 0
+        uncached = [s for s in sessions if f"session:{s.id}" not in self._cache]
+        done = len(sessions) - len(uncached)
 
-        for i, session in enumerate(sessions):
-            cache_key = f"session:{session.id}"
-            if cache_key not in self._cache:
-                try:
-                    self.embed_session(session, scanner)
-                    computed += 1
-                except Exception:
-                    pass
+        for start in range(0, len(uncached), EMBED_BATCH_SIZE):
+            batch = uncached[start : start + EMBED_BATCH_SIZE]
+            computed += sum(e is not None for e in self.embed_sessions(batch, scanner))
+            done += len(batch)
 
             if progress_callback:
-                progress_callback(i + 1, len(sessions), computed)
+                progress_callback(done, len(sessions), computed)
 
-        self._save_cache()
         return computed
@@ -0,0 +1,144 @@
+"""SQLite FTS5 sidecar index over message text."""
+
+import sqlite3
+import threading
+from collections.abc import Collection
+from pathlib import Path
+
+import orjson
+
+from one_claude.core.models import MessageTree, MessageType, Session
+
+# Bump when the schema or tokenizer changes; older databases are rebuilt
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+DROP TABLE IF EXISTS messages;
+DROP TABLE IF EXISTS sessions;
+CREATE VIRTUAL TABLE messages USING fts5(
+    session_id UNINDEXED, uuid UNINDEXED, text, tokenize='trigram'
+);
+CREATE TABLE sessions (id TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER);
+"""
+
+# Trigram indexes can't match shorter queries
+_MIN_QUERY_LEN = 3
+
+
+def _match_expr(query: str) -> str:
+    """Build an FTS5 query matching query as a case-insensitive substring."""
+    return '"' + query.replace('"', '""') + '"'
+
+
+class FTSIndex:
+    """Substring index of user/assistant messages in SQLite FTS5.
+
+    Text is split into trigrams, so a match is the same case-insensitive
+    substring test as the linear scan. Each session is stored with the mtime
+    and size of its JSONL so it can be re-indexed when the file changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._available: bool | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Check if SQLite was built with FTS5 and the trigram tokenizer."""
+        if self._available is None:
+            try:
+                self._connect()
+                self._available = True
+            except sqlite3.Error:
+                self._available = False
+        return self._available
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path / "fts.db", check_same_thread=False)
+            try:
+                if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                    conn.executescript(_SCHEMA)
+                    conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def is_current(self, session: Session) -> bool:
+        """Check whether a session is indexed at its current file state."""
+        try:
+            stat = session.jsonl_path.stat()
+        except OSError:
+            return False
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT mtime_ns, size FROM sessions WHERE id = ?", (session.id,))
+                .fetchone()
+            )
+        return row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size
+
+    def add_session(self, session: Session, tree: MessageTree) -> None:
+        """Replace a session's indexed messages."""
+        try:
+            stat = session.jsonl_path.stat()
+        except OSError:
+            return
+
+        rows = [
+            (session.id, msg.uuid, msg.text_content)
+            for msg in tree.messages.values()
+            if msg.type in (MessageType.USER, MessageType.ASSISTANT) and msg.text_content
+        ]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM messages WHERE session_id = ?", (session.id,))
+                conn.executemany(
+                    "INSERT INTO messages (session_id, uuid, text) VALUES (?, ?, ?)", rows
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO sessions (id, mtime_ns, size) VALUES (?, ?, ?)",
+                    (session.id, stat.st_mtime_ns, stat.st_size),
+                )
+
+    def search(
+        self, query: str, session_ids: Collection[str] | None = None
+    ) -> list[tuple[str, str, int]] | None:
+        """Find sessions with messages containing query.
+
+        Args:
+            query: Substring to match, case-insensitively
+            session_ids: Only match messages from these sessions
+
+        Returns:
+            List of (session_id, last matching message uuid, occurrences of
+            query), or None if the index can't answer the query exactly.
+            Occurrences don't overlap, as in the linear scan.
+        """
+        # SQLite folds case differently from str.lower() outside ASCII
+        if len(query) < _MIN_QUERY_LEN or not query.isascii():
+            return None
+        needle = query.lower()
+        # A bare column next to max() comes from the row holding the maximum
+        sql = (
+            "SELECT session_id, uuid, max(rowid), "
+            "sum((length(lower(text)) - length(replace(lower(text), ?, ''))) / ?) "
+            "FROM messages WHERE messages MATCH ?"
+        )
+        params: tuple = (needle, len(needle), _match_expr(query))
+        if session_ids is not None:
+            sql += " AND session_id IN (SELECT value FROM json_each(?))"
+            params += (orjson.dumps(list(session_ids)).decode(),)
+        with self._lock:
+            try:
+                rows = self._connect().execute(sql + " GROUP BY session_id", params).fetchall()
+            except sqlite3.Error:
+                return None
+        return [(session_id, uuid, count) for session_id, uuid, _rowid, count in rows]
@@ -0,0 +1,160 @@
+"""Token inverted index over message text."""
+
+import re
+from collections import Counter
+from collections.abc import Collection
+from pathlib import Path
+
+import orjson
+
+from one_claude.core.models import MessageTree, MessageType, Session
+
+_TOKEN_RE = re.compile(r"\w{3,}")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase index terms."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class InvertedIndex:
+    """Maps terms to the messages containing them.
+
+    Postings are stored as term -> session_id -> message_uuid -> term frequency,
+    so a session can be dropped and re-indexed when its JSONL file changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._postings: dict[str, dict[str, dict[str, int]]] = {}
+        # session_id -> (jsonl mtime, terms indexed for that session)
+        self._sessions: dict[str, tuple[float, list[str]]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def _load(self) -> None:
+        """Load index from disk on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        index_file = self.path / "inverted.json"
+        if not index_file.exists():
+            return
+        try:
+            data = orjson.loads(index_file.read_bytes())
+            self._postings = data.get("postings", {})
+            self._sessions = {k: (v[0], v[1]) for k, v in data.get("sessions", {}).items()}
+        except Exception:
+            self._postings = {}
+            self._sessions = {}
+
+    def save(self) -> None:
+        """Save index to disk if it changed."""
+        if not self._dirty:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        data = {"postings": self._postings, "sessions": self._sessions}
+        (self.path / "inverted.json").write_bytes(orjson.dumps(data))
+        self._dirty = False
+
+    def is_current(self, session: Session) -> bool:
+        """Check whether a session is indexed at its current file mtime."""
+        self._load()
+        entry = self._sessions.get(session.id)
+        if entry is None:
+            return False
+        try:
+            return entry[0] == session.jsonl_path.stat().st_mtime
+        except OSError:
+            return False
+
+    def remove_session(self, session_id: str) -> None:
+        """Drop all postings for a session."""
+        self._load()
+        entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return
+        for term in entry[1]:
+            by_session = self._postings.get(term)
+            if by_session is not None:
+                by_session.pop(session_id, None)
+                if not by_session:
+                    del self._postings[term]
+        self._dirty = True
+
+    def add_session(self, session: Session, tree: MessageTree) -> None:
+        """Index all user/assistant messages of a session."""
+        self._load()
+        try:
+            mtime = session.jsonl_path.stat().st_mtime
+        except OSError:
+            return
+
+        self.remove_session(session.id)
+
+        terms: set[str] = set()
+        for msg in tree.messages.values():
+            if msg.type not in (MessageType.USER, MessageType.ASSISTANT) or not msg.text_content:
+                continue
+            for term, tf in Counter(tokenize(msg.text_content)).items():
+                self._postings.setdefault(term, {}).setdefault(session.id, {})[msg.uuid] = tf
+                terms.add(term)
+
+        self._sessions[session.id] = (mtime, list(terms))
+        self._dirty = True
+
+    def search(
+        self, query: str, limit: int = 50, session_ids: Collection[str] | None = None
+    ) -> list[tuple[str, str, int]]:
+        """Find messages containing every query term.
+
+        Only sessions in session_ids are scored, if given.
+
+        Returns:
+            List of (session_id, best_message_uuid, session_score), best first.
+            The score is the summed term frequency over matching messages.
+        """
+        self._load()
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        postings = []
+        for term in terms:
+            by_session = self._postings.get(term)
+            if not by_session:
+                return []
+            postings.append(by_session)
+
+        # Intersect smallest posting list first
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        if session_ids is not None:
+            candidates.intersection_update(session_ids)
+        for by_session in postings[1:]:
+            candidates.intersection_update(by_session)
+            if not candidates:
+                return []
+
+        results: list[tuple[str, str, int]] = []
+        for session_id in candidates:
+            msg_lists = [p[session_id] for p in postings]
+            uuids = set(msg_lists[0])
+            for msgs in msg_lists[1:]:
+                uuids.intersection_update(msgs)
+            if not uuids:
+                continue
+
+            best_uuid = ""
+            best_tf = -1
+            total = 0
+            for uuid in uuids:
+                tf = sum(msgs[uuid] for msgs in msg_lists)
+                total += tf
+                if tf > best_tf:
+                    best_uuid, best_tf = uuid, tf
+            results.append((session_id, best_uuid, total))
+
+        results.sort(key=lambda r: r[2], reverse=True)
+        return results[:limit]
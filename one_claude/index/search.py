@@ -1,9 +1,12 @@
 """Search functionality for one_claude."""
 
+import heapq
 import re
 import threading
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Callable
 
@@ -12,6 +15,12 @@ import stringzilla as sz
 from one_claude.core.models import Message, MessageTree, MessageType, Project, Session
 from one_claude.core.scanner import ClaudeScanner
 
+# Reciprocal Rank Fusion constant and precomputed 1 / (k + rank) terms
+_RRF_K = 60
+_RRF = [1.0 / (_RRF_K + rank) for rank in range(1024)]
+
+_by_score = attrgetter("score")
+
 
 def _sz_fold(text: str) -> bytes:
     """Case-fold text for case-insensitive matching."""
@@ -24,11 +33,6 @@ def _sz_find_folded(text_folded: bytes, query_folded: bytes) -> int:
     return -1 if result is None else result
 
 
-def _sz_count_folded(text_folded: bytes, query_folded: bytes) -> int:
-    """Count in already-folded text."""
-    return sz.count(text_folded, query_folded)
-
-
 def _sz_find(text: str, query: str) -> int:
     """Case-insensitive find using stringzilla. Returns -1 if not found."""
     text_folded = _sz_fold(text)
@@ -36,6 +40,68 @@ def _sz_find(text: str, query: str) -> int:
     return _sz_find_folded(text_folded, query_folded)
 
 
+def _required_literal(pattern: str) -> str:
+    """Longest lowercase literal every match of pattern must contain.
+
+    Only top-level literal runs count (groups, branches and repeats may be
+    skipped by a match). Runs are cut at non-ASCII characters and at "i"/"s",
+    which re.IGNORECASE also matches against characters that str.lower()
+    leaves alone (dotless i, long s). Returns "" when nothing is usable.
+    """
+    # re._parser is a CPython implementation detail (sre_parse before 3.11);
+    # without it the scan simply runs the regex on every message
+    try:
+        from re import _parser
+    except ImportError:
+        return ""
+
+    try:
+        items = _parser.parse(pattern)
+    except Exception:
+        return ""
+
+    best = ""
+    run: list[str] = []
+    for op, arg in items:
+        char = chr(arg).lower() if op is _parser.LITERAL else ""
+        if char.isascii() and char and char not in "is":
+            run.append(char)
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    if len(run) > len(best):
+        best = "".join(run)
+    return best
+
+
+def _original_offset(content: str, lower_offset: int) -> int:
+    """Offset in content of the character at lower_offset in its lowercase form."""
+    pos = 0
+    for i, char in enumerate(content):
+        if pos >= lower_offset:
+            return i
+        pos += len(char.lower())
+    return len(content)
+
+
+def _snippet(content: str, content_lower: str, idx: int, length: int, context: int = 40) -> str:
+    """Excerpt of content around a match found at content_lower[idx : idx + length]."""
+    match_end = idx + length
+    if len(content_lower) != len(content):
+        # Lowercasing changed some lengths, so map the match back onto content
+        idx = _original_offset(content, idx)
+        match_end = _original_offset(content, match_end)
+    start = max(0, idx - context)
+    end = min(len(content), match_end + context)
+    snippet = content[start:end]
+    if start > 0:
+        snippet = "..." + snippet
+    if end < len(content):
+        snippet = snippet + "..."
+    return snippet
+
+
 @dataclass
 class SearchResult:
     """A search result."""
@@ -58,6 +124,10 @@ class SearchEngine:
         self._last_cache_time: datetime | None = None
         self._embedder = None
         self._vector_store = None
+        self._inverted_index = None
+        self._fts_index = None
+        # Resolved on first use; checking builds an LLM client
+        self._semantic_available: bool | None = None
         # Message tree cache for fast search
         self._tree_cache: dict[str, MessageTree] = {}
         self._tree_cache_lock = threading.Lock()
@@ -108,6 +178,13 @@ class SearchEngine:
         with self._tree_cache_lock:
             return len(self._tree_cache), len(sessions)
 
+    def invalidate(self, session_ids: set[str]) -> None:
+        """Forget cached trees for changed sessions and the session list."""
+        with self._tree_cache_lock:
+            for session_id in session_ids:
+                self._tree_cache.pop(session_id, None)
+        self._sessions_cache = None
+
     def _get_sessions(self, force_refresh: bool = False) -> list[Session]:
         """Get all sessions, with caching."""
         now = datetime.now()
@@ -133,7 +210,7 @@ class SearchEngine:
 
         Args:
             query: Search query
-            mode: Search mode - "text", "title", or "content"
+            mode: Search mode - "text", "title", "content", or "index"
             project_filter: Filter by project path (partial match)
             limit: Maximum results to return
         """
@@ -144,11 +221,9 @@ class SearchEngine:
 
         # Apply project filter
         if project_filter:
+            pf = project_filter.lower()
             sessions = [
-                s
-                for s in sessions
-                if _sz_find(s.project_display, project_filter) >= 0
-                or _sz_find(s.project_path, project_filter) >= 0
+                s for s in sessions if pf in s.project_display_lower or pf in s.project_path_lower
             ]
 
         results: list[SearchResult] = []
@@ -157,6 +232,8 @@ class SearchEngine:
             results = self._search_titles(query, sessions, limit)
         elif mode == "content":
             results = self._search_content(query, sessions, limit)
+        elif mode == "index":
+            results = self._search_indexed(query, sessions, limit)
         else:  # text - search both
             title_results = self._search_titles(query, sessions, limit)
             content_results = self._search_content(query, sessions, limit)
@@ -174,25 +251,26 @@ class SearchEngine:
                     results.append(r)
                     seen.add(r.session.id)
 
-        # Sort by score descending
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results[:limit]
+        # Top results by score, without sorting the whole list
+        return heapq.nlargest(limit, results, key=_by_score)
 
     def _search_titles(
         self, query: str, sessions: list[Session], limit: int
     ) -> list[SearchResult]:
         """Search session titles using stringzilla for speed."""
         results = []
-        query_words = query.split()
+        query_lower = query.lower()
+        query_words = query_lower.split()
 
         for session in sessions:
             title = session.title or ""
+            title_lower = session.title_lower
 
             # Calculate match score
             score = 0.0
 
             # Exact match (case-insensitive)
-            start = _sz_find(title, query)
+            start = title_lower.find(query_lower)
             if start >= 0:
                 score = 1.0
                 matches = [(start, start + len(query))]
@@ -200,7 +278,7 @@ class SearchEngine:
                 # Word match
                 matches = []
                 for word in query_words:
-                    pos = _sz_find(title, word)
+                    pos = title_lower.find(word)
                     if pos >= 0:
                         score += 0.3
                         matches.append((pos, pos + len(word)))
@@ -221,9 +299,21 @@ class SearchEngine:
     def _search_content(
         self, query: str, sessions: list[Session], limit: int
     ) -> list[SearchResult]:
-        """Search session content (messages) using stringzilla for speed."""
+        """Search session content (messages).
+
+        Uses the FTS5 sidecar index when SQLite supports it, falling back to a
+        linear scan of every message when it doesn't or the query is too short
+        for it.
+        """
+        fts = self._get_fts_index()
+        if fts.available:
+            fts_results = self._search_fts(fts, query, sessions, limit)
+            if fts_results is not None:
+                return fts_results
+
         results = []
-        query_folded = _sz_fold(query)
+        query_lower = query.lower()
+        step = len(query_lower) or 1
 
         for session in sessions:
             tree = self._get_tree(session)
@@ -238,20 +328,19 @@ class SearchEngine:
                 if msg.type not in (MessageType.USER, MessageType.ASSISTANT):
                     continue
 
+                # Lowercased once per message and reused across queries
                 content = msg.text_content
-                content_folded = _sz_fold(content)
-                idx = _sz_find_folded(content_folded, query_folded)
+                content_lower = msg.text_lower
+                idx = content_lower.find(query_lower)
                 if idx >= 0:
-                    total_matches += _sz_count_folded(content_folded, query_folded)
+                    # Count remaining occurrences from the first hit onwards
+                    pos = idx
+                    while pos >= 0:
+                        total_matches += 1
+                        pos = content_lower.find(query_lower, pos + step)
 
                     # Find best snippet
-                    start = max(0, idx - 40)
-                    end = min(len(content), idx + len(query) + 40)
-                    snippet = content[start:end]
-                    if start > 0:
-                        snippet = "..." + snippet
-                    if end < len(content):
-                        snippet = snippet + "..."
+                    snippet = _snippet(content, content_lower, idx, len(query_lower))
 
                     if best_match is None or total_matches > best_match.score:
                         best_match = SearchResult(
@@ -267,6 +356,112 @@ class SearchEngine:
 
         return results
 
+    def _get_fts_index(self):
+        """Get or create the SQLite FTS5 index."""
+        if self._fts_index is None:
+            from one_claude.index.fts import FTSIndex
+
+            self._fts_index = FTSIndex(self.data_dir / "index")
+        return self._fts_index
+
+    def _search_fts(
+        self, fts, query: str, sessions: list[Session], limit: int
+    ) -> list[SearchResult] | None:
+        """Search message text via the FTS5 index.
+
+        Sessions whose JSONL changed since they were indexed are re-indexed first.
+        Returns None if the index can't answer the query.
+        """
+        for session in sessions:
+            if not fts.is_current(session):
+                tree = self._get_tree(session)
+                if tree is not None:
+                    fts.add_session(session, tree)
+
+        session_map = {s.id: s for s in sessions}
+        hits = fts.search(query, session_ids=session_map)
+        if hits is None:
+            return None
+
+        query_lower = query.lower()
+        results = []
+        for session_id, msg_uuid, count in hits:
+            session = session_map[session_id]
+            tree = self._get_tree(session)
+            msg = tree.get_message(msg_uuid) if tree is not None else None
+            snippet = ""
+            if msg is not None:
+                idx = msg.text_lower.find(query_lower)
+                if idx >= 0:
+                    snippet = _snippet(msg.text_content, msg.text_lower, idx, len(query_lower))
+            results.append(
+                SearchResult(
+                    session=session,
+                    message=msg,
+                    score=count,
+                    match_type="text",
+                    snippet=snippet,
+                )
+            )
+
+        return results
+
+    def _get_inverted_index(self):
+        """Get or create the token inverted index."""
+        if self._inverted_index is None:
+            from one_claude.index.inverted import InvertedIndex
+
+            self._inverted_index = InvertedIndex(self.data_dir / "index")
+        return self._inverted_index
+
+    def _search_indexed(
+        self, query: str, sessions: list[Session], limit: int
+    ) -> list[SearchResult]:
+        """Search whole-word terms via the inverted index.
+
+        Sessions whose JSONL changed since they were indexed are re-indexed first.
+        """
+        from one_claude.index.inverted import tokenize
+
+        index = self._get_inverted_index()
+        for session in sessions:
+            if not index.is_current(session):
+                tree = self._get_tree(session)
+                if tree is not None:
+                    index.add_session(session, tree)
+        index.save()
+
+        session_map = {s.id: s for s in sessions}
+        terms = tokenize(query)
+        results = []
+        for session_id, msg_uuid, score in index.search(
+            query, limit=len(session_map), session_ids=session_map
+        ):
+            session = session_map[session_id]
+
+            msg = None
+            snippet = ""
+            tree = self._get_tree(session)
+            if tree is not None:
+                msg = tree.get_message(msg_uuid)
+            if msg is not None:
+                idx = max(msg.text_lower.find(terms[0]), 0)
+                snippet = _snippet(msg.text_content, msg.text_lower, idx, len(terms[0]))
+
+            results.append(
+                SearchResult(
+                    session=session,
+                    message=msg,
+                    score=float(score),
+                    match_type="text",
+                    snippet=snippet,
+                )
+            )
+            if len(results) >= limit:
+                break
+
+        return results
+
     def search_regex(
         self, pattern: str, sessions: list[Session] | None = None, limit: int = 50
     ) -> list[SearchResult]:
@@ -280,6 +475,8 @@ class SearchEngine:
         except re.error:
             return []
 
+        literal = _required_literal(pattern)
+
         for session in sessions:
             tree = self._get_tree(session)
             if tree is None:
@@ -289,6 +486,8 @@ class SearchEngine:
             for msg in messages:
                 if msg.type not in (MessageType.USER, MessageType.ASSISTANT):
                     continue
+                if literal and literal not in msg.text_lower:
+                    continue
 
                 match = regex.search(msg.text_content)
                 if match:
@@ -339,11 +538,12 @@ class SearchEngine:
     @property
     def semantic_available(self) -> bool:
         """Check if semantic search is available."""
-        try:
-            embedder = self._get_embedder()
-            return embedder.available
-        except Exception:
-            return False
+        if self._semantic_available is None:
+            try:
+                self._semantic_available = bool(self._get_embedder().available)
+            except Exception:
+                self._semantic_available = False
+        return self._semantic_available
 
     def search_semantic(
         self,
@@ -377,6 +577,7 @@ class SearchEngine:
         # Build results
         sessions = self._get_sessions()
         session_map = {s.id: s for s in sessions}
+        project_filter_lower = project_filter.lower() if project_filter else ""
 
         results = []
         for session_id, score in matches:
@@ -387,8 +588,8 @@ class SearchEngine:
             # Apply project filter
             if project_filter:
                 if (
-                    _sz_find(session.project_display, project_filter) < 0
-                    and _sz_find(session.project_path, project_filter) < 0
+                    project_filter_lower not in session.project_display_lower
+                    and project_filter_lower not in session.project_path_lower
                 ):
                     continue
 
@@ -431,29 +632,22 @@ class SearchEngine:
             return text_results
 
         # RRF merge
-        k = 60  # RRF constant
-        rrf_scores: dict[str, float] = {}
+        rrf_scores: defaultdict[str, float] = defaultdict(float)
         result_map: dict[str, SearchResult] = {}
 
-        for rank, result in enumerate(text_results):
-            sid = result.session.id
-            rrf_scores[sid] = rrf_scores.get(sid, 0) + 1 / (k + rank)
-            if sid not in result_map:
-                result_map[sid] = result
-
-        for rank, result in enumerate(semantic_results):
-            sid = result.session.id
-            rrf_scores[sid] = rrf_scores.get(sid, 0) + 1 / (k + rank)
-            if sid not in result_map:
-                result_map[sid] = result
+        for ranked in (text_results, semantic_results):
+            for rank, result in enumerate(ranked):
+                sid = result.session.id
+                rrf_scores[sid] += _RRF[rank] if rank < len(_RRF) else 1 / (_RRF_K + rank)
+                result_map.setdefault(sid, result)
 
         # Sort by RRF score
-        sorted_ids = sorted(rrf_scores.keys(), key=lambda x: rrf_scores[x], reverse=True)
+        top_scores = heapq.nlargest(limit, rrf_scores.items(), key=itemgetter(1))
 
         results = []
-        for sid in sorted_ids[:limit]:
+        for sid, score in top_scores:
             result = result_map[sid]
-            result.score = rrf_scores[sid]
+            result.score = score
             result.match_type = "combined"
             results.append(result)
 
@@ -480,20 +674,27 @@ class SearchEngine:
         if not embedder.available:
             return 0
 
+        from one_claude.index.embeddings import EMBED_BATCH_SIZE
+
         sessions = self._get_sessions()
         vector_store = self._get_vector_store()
         indexed = 0
 
-        for i, session in enumerate(sessions):
-            try:
-                embedding = embedder.embed_session(session, self.scanner)
-                vector_store.add(session.id, embedding)
-                indexed += 1
-            except Exception:
-                pass
+        # Embed in batches; one request per batch instead of per session
+        for start in range(0, len(sessions), EMBED_BATCH_SIZE):
+            batch = sessions[start : start + EMBED_BATCH_SIZE]
+            embeddings = embedder.embed_sessions(batch, self.scanner)
+            for session, embedding in zip(batch, embeddings):
+                if embedding is None:
+                    continue
+                try:
+                    vector_store.add(session.id, embedding)
+                    indexed += 1
+                except Exception:
+                    pass
 
             if progress_callback:
-                progress_callback(i + 1, len(sessions), indexed)
+                progress_callback(start + len(batch), len(sessions), indexed)
 
         vector_store.save()
         return indexed
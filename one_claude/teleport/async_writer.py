@@ -0,0 +1,168 @@
+"""Batched file writer for restoring sandbox files."""
+
+import asyncio
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+# In-memory files at least this large are deduplicated by content hash
+_DEDUPE_MIN = 64 * 1024
+
+# Linux ioctl that makes a file share another's extents (a reflink)
+_FICLONE = 0x40049409
+
+
+def _write_bytes(path: str, content: bytes) -> None:
+    """Write content to path, replacing it."""
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _clone_file(src: str, dst: str) -> bool:
+    """Reflink src to dst on copy-on-write filesystems (btrfs, XFS).
+
+    Returns False if the platform or filesystem can't, so the caller writes instead.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        return False
+
+
+class AsyncArtifactWriter:
+    """Collects file writes and flushes them in batches off the event loop.
+
+    Each batch is one worker-thread hop instead of one per file. A full batch
+    is written in the background while the next one fills, so producing
+    files overlaps with writing them. Writes are only guaranteed to be on
+    disk after flush() returns.
+    """
+
+    def __init__(self, max_files: int = 64, max_bytes: int = 8 * 1024 * 1024):
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        # (destination path, content bytes or a source file to copy)
+        self._pending: list[tuple[str, bytes | Path]] = []
+        self._pending_bytes = 0
+        # Batch being written; at most one is in flight so batches land in order
+        self._inflight: asyncio.Task | None = None
+        self._dispatch_lock = asyncio.Lock()
+        # Directories known to exist; restored files mostly share a few parents
+        self._made_dirs: set[str] = set()
+        # Content-addressed record of large files on disk, so identical content
+        # is reflinked to the first copy instead of written again
+        self._path_by_digest: dict[bytes, str] = {}
+        self._digest_by_path: dict[str, bytes] = {}
+        # Cleared once a reflink fails; elsewhere a clone is just a full copy
+        self._reflinks = True
+        # Destinations whose last write failed, reported by the next flush()
+        self._failed: set[str] = set()
+
+    async def submit(self, file_path: str, content: bytes) -> None:
+        """Queue a write, starting a background write once the batch is full."""
+        self._pending.append((file_path, content))
+        self._pending_bytes += len(content)
+        if len(self._pending) >= self.max_files or self._pending_bytes >= self.max_bytes:
+            await self._dispatch()
+
+    async def submit_copy(self, file_path: str, source: Path) -> None:
+        """Queue a copy of source to file_path, done with sendfile where possible."""
+        self._pending.append((file_path, source))
+        if len(self._pending) >= self.max_files:
+            await self._dispatch()
+
+    async def flush(self) -> set[str]:
+        """Write all queued files to disk.
+
+        Returns the destination paths that could not be written since the
+        last flush.
+        """
+        await self._dispatch()
+        async with self._dispatch_lock:
+            await self._wait_inflight()
+            failed = self._failed
+            self._failed = set()
+        return failed
+
+    async def _dispatch(self) -> None:
+        """Hand the pending batch to a background write.
+
+        Waits for the previous batch first, which also bounds memory held by
+        queued content to about two batches.
+        """
+        async with self._dispatch_lock:
+            await self._wait_inflight()
+            if not self._pending:
+                return
+            batch = self._pending
+            self._pending = []
+            self._pending_bytes = 0
+            self._inflight = asyncio.create_task(asyncio.to_thread(self._write_batch, batch))
+
+    async def _wait_inflight(self) -> None:
+        """Wait for the batch being written, if any."""
+        task = self._inflight
+        if task is not None:
+            self._inflight = None
+            await task
+
+    def _write_batch(self, batch: list[tuple[str, bytes | Path]]) -> None:
+        """Write a batch of files, creating parent directories as needed.
+
+        A file that can't be written (e.g. an unreadable copy source) is
+        recorded in _failed and the rest of the batch continues.
+        """
+        made_dirs = self._made_dirs
+        failed = self._failed
+        for file_path, content in batch:
+            try:
+                parent = os.path.dirname(file_path)
+                if parent not in made_dirs:
+                    os.makedirs(parent, exist_ok=True)
+                    # makedirs also created every missing ancestor
+                    while parent not in made_dirs and parent != os.path.dirname(parent):
+                        made_dirs.add(parent)
+                        parent = os.path.dirname(parent)
+                self._write_one(file_path, content)
+            except OSError:
+                failed.add(file_path)
+            else:
+                failed.discard(file_path)
+
+    def _write_one(self, file_path: str, content: bytes | Path) -> None:
+        """Write one file, reflinking an identical large file already written."""
+        # Whatever this path held before is being replaced
+        old_digest = self._digest_by_path.pop(file_path, None)
+        if old_digest is not None and self._path_by_digest.get(old_digest) == file_path:
+            del self._path_by_digest[old_digest]
+
+        if isinstance(content, Path):
+            # Copied in the kernel; hashing first would read the source twice
+            shutil.copyfile(content, file_path)
+            return
+
+        if len(content) < _DEDUPE_MIN or not self._reflinks:
+            _write_bytes(file_path, content)
+            return
+
+        digest = hashlib.sha256(content, usedforsecurity=False).digest()
+        source = self._path_by_digest.get(digest)
+        if source is not None:
+            if _clone_file(source, file_path):
+                self._digest_by_path[file_path] = digest
+                return
+            self._reflinks = False
+            self._path_by_digest.clear()
+            self._digest_by_path.clear()
+            _write_bytes(file_path, content)
+            return
+        _write_bytes(file_path, content)
+        self._path_by_digest[digest] = file_path
+        self._digest_by_path[file_path] = digest
@@ -1,9 +1,75 @@
 """Pluggable teleport executors for different sandbox modes."""
 
 import shutil
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+import orjson
+
+# Use --user to run as current user (not root) so --dangerously-skip-permissions works.
+# The $ is escaped because the command is nested inside a tmux argument.
+_DOCKER_BASE = ("docker", "run", "-it", "--rm", "--user", "\\$(id -u):\\$(id -g)")
+_MSB_BASE = ("msb", "exe")
+
+
+def _container_prefix(
+    base: tuple[str, ...],
+    mounts: tuple[tuple[Path, str], ...],
+    workdir: tuple[str, str],
+    env: tuple[str, dict[str, str]],
+) -> str:
+    """Build a container run prefix as a shell string.
+
+    Args:
+        base: Runtime command and fixed flags
+        mounts: (host path, guest path) volume mounts, passed with -v
+        workdir: (flag, directory) for the working directory
+        env: (flag, variables) for the environment
+    """
+    parts = list(base)
+    for host, guest in mounts:
+        parts += ("-v", f"{host}:{guest}")
+    parts += workdir
+    env_flag, variables = env
+    for key, value in variables.items():
+        parts += (env_flag, f"{key}={value}")
+    return " ".join(parts)
+
+
+# How long a PATH lookup result is trusted; tools may be installed mid-session
+_WHICH_TTL = 30.0
+_which_cache: dict[str, tuple[float, bool]] = {}
+
+
+def _has_command(name: str) -> bool:
+    """Check whether a command is on PATH, caching the answer briefly."""
+    now = time.monotonic()
+    cached = _which_cache.get(name)
+    if cached is not None and now - cached[0] < _WHICH_TTL:
+        return cached[1]
+    found = shutil.which(name) is not None
+    _which_cache[name] = (now, found)
+    return found
+
+
+def _fix_claude_json(claude_dir: Path) -> None:
+    """Create the debug directory and point installMethod at npm."""
+    # Create debug directory (Claude needs this)
+    (claude_dir / ".claude" / "debug").mkdir(parents=True, exist_ok=True)
+
+    # Fix installMethod in .claude.json
+    claude_json = claude_dir / ".claude.json"
+    if not claude_json.exists():
+        return
+    try:
+        data = orjson.loads(claude_json.read_bytes())
+    except orjson.JSONDecodeError:
+        return
+    if isinstance(data, dict) and "installMethod" in data:
+        data["installMethod"] = "npm"
+        claude_json.write_bytes(orjson.dumps(data))
+
 
 class TeleportExecutor(ABC):
     """Base class for teleport execution strategies."""
@@ -98,21 +164,11 @@ class DockerExecutor(TeleportExecutor):
 
     def is_available(self) -> bool:
         """Check if docker is installed."""
-        return shutil.which("docker") is not None
+        return _has_command("docker")
 
     def prepare(self, claude_dir: Path) -> None:
         """Create debug directory and fix installMethod."""
-        import re
-
-        # Create debug directory (Claude needs this)
-        (claude_dir / ".claude" / "debug").mkdir(parents=True, exist_ok=True)
-
-        # Fix installMethod in .claude.json
-        claude_json = claude_dir / ".claude.json"
-        if claude_json.exists():
-            content = claude_json.read_text()
-            content = re.sub(r'"installMethod":[^,}]*', '"installMethod":"npm"', content)
-            claude_json.write_text(content)
+        _fix_claude_json(claude_dir)
 
     def get_command(
         self,
@@ -126,10 +182,15 @@ class DockerExecutor(TeleportExecutor):
         inner_cwd = f"/workspace{project_path}"
 
         # Build docker run prefix
-        # Use --user to run as current user (not root) so --dangerously-skip-permissions works
-        docker_base = f"docker run -it --rm --user \\$(id -u):\\$(id -g) -v {host_dir}:/workspace -v {claude_dir}:/home/user -w {inner_cwd} -e HOME=/home/user"
+        env = {"HOME": "/home/user"}
         if term:
-            docker_base += f" -e TERM={term}"
+            env["TERM"] = term
+        docker_base = _container_prefix(
+            _DOCKER_BASE,
+            ((host_dir, "/workspace"), (claude_dir, "/home/user")),
+            ("-w", inner_cwd),
+            ("-e", env),
+        )
 
         claude_cmd = f"{docker_base} --name teleport-claude {image} claude --resume {session_id}"
         shell_cmd = f"{docker_base} --name teleport-shell {image} bash"
@@ -157,21 +218,11 @@ class MicrovmExecutor(TeleportExecutor):
 
     def is_available(self) -> bool:
         """Check if msb is installed."""
-        return shutil.which("msb") is not None
+        return _has_command("msb")
 
     def prepare(self, claude_dir: Path) -> None:
         """Create debug directory and fix installMethod."""
-        import re
-
-        # Create debug directory (Claude needs this)
-        (claude_dir / ".claude" / "debug").mkdir(parents=True, exist_ok=True)
-
-        # Fix installMethod in .claude.json
-        claude_json = claude_dir / ".claude.json"
-        if claude_json.exists():
-            content = claude_json.read_text()
-            content = re.sub(r'"installMethod":[^,}]*', '"installMethod":"npm"', content)
-            claude_json.write_text(content)
+        _fix_claude_json(claude_dir)
 
     def get_command(
         self,
@@ -185,9 +236,15 @@ class MicrovmExecutor(TeleportExecutor):
         inner_cwd = f"/workspace{project_path}"
 
         # Build msb exe prefix
-        msb_prefix = f"msb exe -v {host_dir}:/workspace -v {claude_dir}:/root --workdir {inner_cwd} --env HOME=/root"
+        env = {"HOME": "/root"}
         if term:
-            msb_prefix += f" --env TERM={term}"
+            env["TERM"] = term
+        msb_prefix = _container_prefix(
+            _MSB_BASE,
+            ((host_dir, "/workspace"), (claude_dir, "/root")),
+            ("--workdir", inner_cwd),
+            ("--env", env),
+        )
 
         claude_cmd = f'{msb_prefix} -e "claude --resume {session_id}" {image}'
         shell_cmd = f"{msb_prefix} -e bash {image}"
@@ -1,19 +1,28 @@
 """File restoration from checkpoints."""
 
-import hashlib
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 import orjson
 
-from one_claude.core.file_history import FileHistoryManager
-from one_claude.core.models import Message, MessageType, Session, escape_project_path
+from one_claude.core.file_history import FileHistoryManager, compute_path_hash
+from one_claude.core.models import (
+    Message,
+    MessageTree,
+    MessageType,
+    Session,
+    escape_project_path,
+)
 from one_claude.core.parser import extract_file_paths_from_message
 from one_claude.core.scanner import ClaudeScanner
 from one_claude.teleport.sandbox import TeleportSandbox
 
+# Sessions whose restore points and path mappings are kept in memory
+_SCAN_CACHE_MAX = 16
+
 
 @dataclass
 class RestorePoint:
@@ -43,15 +52,64 @@ class FileRestorer:
     def __init__(self, scanner: ClaudeScanner):
         self.scanner = scanner
         self.file_history = FileHistoryManager(scanner.file_history_dir)
-        self._path_cache: dict[str, dict[str, str]] = {}  # session_id -> {hash: path}
+        # session_id -> (jsonl mtime_ns, restore points, {hash: path}),
+        # least recently used first
+        self._session_scan_cache: OrderedDict[
+            str, tuple[int, list[RestorePoint], dict[str, str]]
+        ] = OrderedDict()
+        # session_id -> (jsonl mtime_ns, parsed tree), least recently used first
+        self._tree_cache: OrderedDict[str, tuple[int, MessageTree]] = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Drop cached trees, restore points and path mappings."""
+        self._session_scan_cache.clear()
+        self._tree_cache.clear()
+
+    def _load_tree(self, session: Session, mtime_ns: int) -> MessageTree:
+        """Load a session's message tree, reusing it until the JSONL changes."""
+        cached = self._tree_cache.get(session.id)
+        if cached is not None and cached[0] == mtime_ns:
+            self._tree_cache.move_to_end(session.id)
+            return cached[1]
+
+        if cached is not None:
+            # The scanner keeps the tree on the session; it is stale now
+            session.message_tree = None
+        tree = self.scanner.load_session_messages(session)
+        self._tree_cache[session.id] = (mtime_ns, tree)
+        self._tree_cache.move_to_end(session.id)
+        if len(self._tree_cache) > _SCAN_CACHE_MAX:
+            self._tree_cache.popitem(last=False)
+        return tree
 
     def get_restorable_points(self, session: Session) -> list[RestorePoint]:
         """Get list of points that can be restored (any message can be a restore point)."""
-        tree = self.scanner.load_session_messages(session)
-        checkpoints = self.file_history.get_checkpoints_for_session(session.id)
+        return self._scan_session(session)[0]
+
+    def build_path_mapping(self, session: Session) -> dict[str, str]:
+        """Build mapping from path hashes to original paths."""
+        return self._scan_session(session)[1]
+
+    def _scan_session(self, session: Session) -> tuple[list[RestorePoint], dict[str, str]]:
+        """Collect restore points and the path mapping in one walk over the messages.
+
+        Cached per session until its JSONL changes.
+        """
+        try:
+            mtime_ns = session.jsonl_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        cached = self._session_scan_cache.get(session.id)
+        if cached is not None and cached[0] == mtime_ns:
+            self._session_scan_cache.move_to_end(session.id)
+            return cached[1], cached[2]
+
+        tree = self._load_tree(session, mtime_ns)
+        checkpoints = dict(self.file_history.iter_latest_checkpoints(session.id))
 
         points = []
         seen_messages = set()
+        paths: dict[str, None] = {}  # Distinct file paths in first-seen order
 
         # Walk through messages and create restore points
         for msg in tree.all_messages():
@@ -59,6 +117,9 @@ class FileRestorer:
                 continue
             seen_messages.add(msg.uuid)
 
+            for path in extract_file_paths_from_message(msg):
+                paths[path] = None
+
             # Any message can be a restore point
             # But prioritize ones with file operations for the description
             if msg.type == MessageType.FILE_HISTORY_SNAPSHOT:
@@ -84,15 +145,8 @@ class FileRestorer:
                     )
             elif msg.type == MessageType.USER:
                 # User messages as restore points too
-                content_preview = ""
-                if isinstance(msg.content, str):
-                    content_preview = msg.content[:30] + "..." if len(msg.content) > 30 else msg.content
-                elif isinstance(msg.content, list):
-                    for item in msg.content:
-                        if isinstance(item, dict) and item.get("type") == "text":
-                            text = item.get("text", "")
-                            content_preview = text[:30] + "..." if len(text) > 30 else text
-                            break
+                text = msg.text_content
+                content_preview = text[:30] + "..." if len(text) > 30 else text
                 points.append(
                     RestorePoint(
                         message_uuid=msg.uuid,
@@ -104,29 +158,21 @@ class FileRestorer:
 
         # Sort by timestamp descending
         points.sort(key=lambda p: p.timestamp, reverse=True)
-        return points[:50]  # Limit to 50 restore points
-
-    def build_path_mapping(self, session: Session) -> dict[str, str]:
-        """Build mapping from path hashes to original paths."""
-        if session.id in self._path_cache:
-            return self._path_cache[session.id]
+        points = points[:50]  # Limit to 50 restore points
 
-        tree = self.scanner.load_session_messages(session)
         mapping: dict[str, str] = {}
+        for path in paths:
+            mapping.setdefault(compute_path_hash(path), path)
 
-        for msg in tree.all_messages():
-            paths = extract_file_paths_from_message(msg)
-            for path in paths:
-                path_hash = self._compute_hash(path)
-                if path_hash not in mapping:
-                    mapping[path_hash] = path
-
-        self._path_cache[session.id] = mapping
-        return mapping
+        self._session_scan_cache[session.id] = (mtime_ns, points, mapping)
+        self._session_scan_cache.move_to_end(session.id)
+        if len(self._session_scan_cache) > _SCAN_CACHE_MAX:
+            self._session_scan_cache.popitem(last=False)
+        return points, mapping
 
     def _compute_hash(self, path: str) -> str:
         """Compute path hash matching Claude Code's format."""
-        return hashlib.sha256(path.encode()).hexdigest()[:16]
+        return compute_path_hash(path)
 
     def _truncate_jsonl_to_message(
         self,
@@ -187,6 +233,21 @@ class FileRestorer:
 
         return file_history_files
 
+    def _estimate_restore_size(self, session: Session, project_files: list[Path]) -> int:
+        """Bytes a restore will write: project files, checkpoints and the JSONL."""
+        paths = list(project_files)
+        paths.append(session.jsonl_path)
+        fh_session_dir = self.scanner.file_history_dir / session.id
+        if fh_session_dir.is_dir():
+            paths.extend(fh_session_dir.iterdir())
+        total = 0
+        for path in paths:
+            try:
+                total += path.stat().st_size
+            except OSError:
+                continue
+        return total
+
     async def restore_to_sandbox(
         self,
         session: Session,
@@ -203,64 +264,57 @@ class FileRestorer:
         """
         import shutil
 
+        # For sandbox modes (docker/microvm), copy project directory
+        # Local mode runs in-place so doesn't need copying
+        project_dir = Path(session.project_display)
+        project_files: list[Path] = []
+        if mode != "local" and project_dir.exists() and project_dir.is_dir():
+            project_files = [item for item in project_dir.rglob("*") if item.is_file()]
+
         # Create sandbox with project path (use display path for actual filesystem path)
         sandbox = TeleportSandbox(
             session_id=session.id,
             project_path=session.project_display,
             mode=mode,
+            size_hint=self._estimate_restore_size(session, project_files),
         )
         await sandbox.start()
 
-        files_restored: dict[str, str] = {}
+        # Paths queued for the sandbox; only those written make files_restored
+        queued: dict[str, str] = {}
         is_latest = not message_uuid or message_uuid == ""
 
-        # For sandbox modes (docker/microvm), copy project directory
-        # Local mode runs in-place so doesn't need copying
-        if mode != "local":
-            project_dir = Path(session.project_display)
-            if project_dir.exists() and project_dir.is_dir():
-                # Copy all project files to sandbox workspace
-                for item in project_dir.rglob("*"):
-                    if item.is_file():
-                        rel_path = item.relative_to(project_dir)
-                        try:
-                            content = item.read_bytes()
-                            abs_path = str(project_dir / rel_path)
-                            await sandbox.write_file(abs_path, content)
-                            files_restored[abs_path] = "original"
-                        except (PermissionError, OSError):
-                            continue
+        # Copy all project files to sandbox workspace
+        for item in project_files:
+            rel_path = item.relative_to(project_dir)
+            abs_path = str(project_dir / rel_path)
+            await sandbox.copy_file(item, abs_path)
+            queued[abs_path] = "original"
 
         # If rewinding (not latest), apply checkpoint file states
         if not is_latest:
-            checkpoints = self.file_history.get_checkpoints_for_session(session.id)
             path_mapping = self.build_path_mapping(session)
 
-            for path_hash, versions in checkpoints.items():
-                if not versions:
-                    continue
-
-                # Use latest version (versions are sorted by version number)
-                # TODO: Filter by target timestamp if we add mtime to FileCheckpoint
-                applicable_version = versions[-1] if versions else None
-
-                if not applicable_version:
-                    continue
+            # Resolve restorable files up front; checkpoints for paths never
+            # seen in the session can't be placed anywhere
+            # TODO: Filter by target timestamp if we add mtime to FileCheckpoint
+            restorable = [
+                (path_hash, latest)
+                for path_hash, latest in self.file_history.iter_latest_checkpoints(session.id)
+                if path_hash in path_mapping
+            ]
 
-                # Resolve original path
-                original_path = path_mapping.get(path_hash)
-                if not original_path:
-                    continue
+            for path_hash, latest in restorable:
+                original_path = path_mapping[path_hash]
 
-                # Read checkpoint content
-                try:
-                    content = applicable_version.read_content()
-                except Exception:
-                    continue
+                # Overwrite with checkpoint version; checkpoints are plain files,
+                # so they are copied in the kernel rather than read into memory
+                await sandbox.copy_file(latest.file_path, original_path)
+                queued[original_path] = path_hash
 
-                # Overwrite with checkpoint version
-                await sandbox.write_file(original_path, content)
-                files_restored[original_path] = path_hash
+        # Unreadable sources are skipped rather than failing the restore
+        failed = await sandbox.flush()
+        files_restored = {path: source for path, source in queued.items() if path not in failed}
 
         # Setup claude config directory
         source_claude_dir = self.scanner.claude_dir
@@ -279,7 +333,7 @@ class FileRestorer:
         file_history_files = self._get_file_history_for_session(session)
 
         # Setup the claude config in sandbox
-        sandbox.setup_claude_config(
+        await sandbox.setup_claude_config(
             source_claude_dir=source_claude_dir,
             project_dir_name=project_dir_name,
             jsonl_content=jsonl_content,
@@ -296,5 +350,6 @@ class FileRestorer:
         )
 
     async def cleanup(self, teleport_session: TeleportSession) -> None:
-        """Clean up a teleport session."""
+        """Clean up a teleport session, waiting until its directories are gone."""
         await teleport_session.sandbox.stop()
+        await teleport_session.sandbox.await_cleanup()
@@ -6,14 +6,25 @@ Supports multiple execution modes via pluggable executors:
 - microvm: Microsandbox (has TTY limitations)
 """
 
+import asyncio
+import os
 import shutil
 import subprocess
 import tempfile
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
+from one_claude.teleport.async_writer import AsyncArtifactWriter
 from one_claude.teleport.executors import get_executor
 
+# RAM-backed scratch location for sandbox working directories
+_TMPFS_DIR = "/dev/shm"
+
+# Free space that must remain on tmpfs after a restore; it is RAM, so a
+# quarter of its size is also kept free when that is more
+_TMPFS_MIN_FREE = 512 * 1024 * 1024
+
 
 @dataclass
 class SandboxResult:
@@ -24,8 +35,19 @@ class SandboxResult:
     exit_code: int
 
 
-def is_msb_available() -> bool:
-    """Check if msb CLI is available and working."""
+def is_msb_available(refresh: bool = False) -> bool:
+    """Check if msb CLI is available and working.
+
+    The probe result is cached for the process; pass refresh=True to re-run it.
+    """
+    if refresh:
+        _probe_msb.cache_clear()
+    return _probe_msb()
+
+
+@lru_cache(maxsize=1)
+def _probe_msb() -> bool:
+    """Run `msb version` once to see whether msb works."""
     try:
         result = subprocess.run(
             ["msb", "version"],
@@ -37,6 +59,30 @@ def is_msb_available() -> bool:
         return False
 
 
+def _scratch_dir(needed: int = 0) -> str | None:
+    """Directory for sandbox scratch space, preferring tmpfs.
+
+    ONE_CLAUDE_TMPFS_DIR overrides the tmpfs location. Returns None (the
+    default temp directory) when it is missing or needed bytes wouldn't fit
+    with headroom to spare.
+    """
+    tmpfs_dir = os.environ.get("ONE_CLAUDE_TMPFS_DIR", _TMPFS_DIR)
+    try:
+        usage = shutil.disk_usage(tmpfs_dir)
+        headroom = max(_TMPFS_MIN_FREE, usage.total // 4)
+        if usage.free - needed > headroom and os.access(tmpfs_dir, os.W_OK):
+            return tmpfs_dir
+    except OSError:
+        pass
+    return None
+
+
+def _remove_dirs(dirs: list[Path]) -> None:
+    """Delete directories, ignoring errors from Docker root-owned files."""
+    for path in dirs:
+        shutil.rmtree(path, ignore_errors=True)
+
+
 @dataclass
 class TeleportSandbox:
     """Manages file restoration for teleport.
@@ -48,14 +94,18 @@ class TeleportSandbox:
     image: str = "phact/sandbox:v3"
     project_path: str = ""  # Original project path (cwd for claude)
     mode: str = "docker"  # local, docker, or microvm
+    size_hint: int = 0  # Estimated bytes to restore; large restores stay off tmpfs
 
     # Host directory for files (mounted into sandbox)
     _host_dir: Path | None = field(default=None, repr=False)
+    _host_prefix: str = field(default="", repr=False)  # str(_host_dir) + os.sep
     _claude_dir: Path | None = field(default=None, repr=False)  # ~/.claude equivalent
     working_dir: str = ""  # Set on start
-    files: dict[str, bytes] = field(default_factory=dict)
+    files: set[str] = field(default_factory=set)  # Paths written, content lives on disk
     _started: bool = False
     _using_sandbox: bool = False
+    _writer: AsyncArtifactWriter = field(default_factory=AsyncArtifactWriter, repr=False)
+    _cleanup_task: asyncio.Task | None = field(default=None, repr=False)
 
     @property
     def available(self) -> bool:
@@ -77,15 +127,19 @@ class TeleportSandbox:
         if self._started:
             return
 
+        # Short-lived scratch space, so keep it in RAM when it fits
+        scratch = _scratch_dir(self.size_hint)
+
         # Create host directory for workspace files
         self._host_dir = Path(
-            tempfile.mkdtemp(prefix=f"teleport_{self.session_id[:8]}_")
+            tempfile.mkdtemp(prefix=f"teleport_{self.session_id[:8]}_", dir=scratch)
         )
         self.working_dir = str(self._host_dir)
+        self._host_prefix = self.working_dir + os.sep
 
         # Create ~/.claude equivalent directory
         self._claude_dir = Path(
-            tempfile.mkdtemp(prefix=f"teleport_claude_{self.session_id[:8]}_")
+            tempfile.mkdtemp(prefix=f"teleport_claude_{self.session_id[:8]}_", dir=scratch)
         )
 
         # Sandbox mode is determined by whether we're using a container
@@ -100,6 +154,7 @@ class TeleportSandbox:
         """
         if not self._host_dir or not self.project_path:
             return {}
+        await self.flush()
 
         synced: dict[str, str] = {}
         project_dir = Path(self.project_path)
@@ -139,46 +194,73 @@ class TeleportSandbox:
         return synced
 
     async def stop(self) -> None:
-        """Cleanup working directories."""
+        """Cleanup working directories.
+
+        The directories are removed in the background; await_cleanup() waits
+        for that to finish.
+        """
         self._started = False
         self._using_sandbox = False
 
-        # Cleanup host directory (ignore errors from Docker root-owned files)
-        if self._host_dir and self._host_dir.exists():
-            shutil.rmtree(self._host_dir, ignore_errors=True)
+        dirs = [d for d in (self._host_dir, self._claude_dir) if d is not None]
+        if dirs:
+            self._cleanup_task = asyncio.create_task(asyncio.to_thread(_remove_dirs, dirs))
 
-        # Cleanup claude directory
-        if self._claude_dir and self._claude_dir.exists():
-            shutil.rmtree(self._claude_dir, ignore_errors=True)
+    async def await_cleanup(self) -> None:
+        """Wait for directories removed by stop() to be gone."""
+        if self._cleanup_task is not None:
+            await self._cleanup_task
+            self._cleanup_task = None
 
     async def write_file(self, path: str, content: bytes) -> None:
         """Write file to working directory."""
         if not self._host_dir:
             raise RuntimeError("Sandbox not started")
 
-        # Use relative path from root
-        rel_path = path.lstrip("/")
-        file_path = self._host_dir / rel_path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_bytes(content)
-        self.files[path] = content
+        # Plain string join; sandbox paths are absolute, so strip the root
+        file_path = self._host_prefix + path.lstrip("/")
+        # Batched and written off the event loop; see flush()
+        await self._writer.submit(file_path, content)
+        self.files.add(path)
+
+    async def copy_file(self, source: Path, path: str) -> None:
+        """Copy a host file into the working directory without reading it into memory."""
+        if not self._host_dir:
+            raise RuntimeError("Sandbox not started")
+
+        file_path = self._host_prefix + path.lstrip("/")
+        await self._writer.submit_copy(file_path, source)
+        self.files.add(path)
+
+    async def flush(self) -> set[str]:
+        """Ensure all files passed to write_file are on disk.
+
+        Returns the paths that failed to write since the last flush; they are
+        dropped from files.
+        """
+        failed = {
+            "/" + file_path[len(self._host_prefix) :] for file_path in await self._writer.flush()
+        }
+        self.files -= failed
+        return failed
 
     async def read_file(self, path: str) -> bytes:
         """Read file from working directory."""
         if not self._host_dir:
             raise RuntimeError("Sandbox not started")
 
-        rel_path = path.lstrip("/")
-        file_path = self._host_dir / rel_path
-        if file_path.exists():
-            return file_path.read_bytes()
-        return self.files.get(path, b"")
+        await self.flush()
+        try:
+            with open(self._host_prefix + path.lstrip("/"), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return b""
 
     async def list_files(self, path: str = ".") -> list[str]:
         """List files in working directory."""
-        return list(self.files.keys())
+        return list(self.files)
 
-    def setup_claude_config(
+    async def setup_claude_config(
         self,
         source_claude_dir: Path,
         project_dir_name: str,
@@ -197,52 +279,37 @@ class TeleportSandbox:
             raise RuntimeError("Sandbox not started")
 
         home_dir = source_claude_dir.parent  # ~/.claude -> ~
+        claude_subdir = self._claude_dir / ".claude"
 
-        # Copy ~/.claude.json (main auth/settings file)
-        claude_json = home_dir / ".claude.json"
-        if claude_json.exists():
-            dest = self._claude_dir / ".claude.json"
-            shutil.copy2(claude_json, dest)
-
-        # Copy ~/.claude.json.backup
-        claude_json_backup = home_dir / ".claude.json.backup"
-        if claude_json_backup.exists():
-            dest = self._claude_dir / ".claude.json.backup"
-            shutil.copy2(claude_json_backup, dest)
-
-        # Copy ~/.claude/.credentials.json (OAuth tokens)
-        creds_file = source_claude_dir / ".credentials.json"
-        if creds_file.exists():
-            claude_subdir = self._claude_dir / ".claude"
-            claude_subdir.mkdir(parents=True, exist_ok=True)
-            dest = claude_subdir / ".credentials.json"
-            shutil.copy2(creds_file, dest)
-
-        # Copy settings.json
-        settings_file = source_claude_dir / "settings.json"
-        if settings_file.exists():
-            claude_subdir = self._claude_dir / ".claude"
-            claude_subdir.mkdir(parents=True, exist_ok=True)
-            dest = claude_subdir / "settings.json"
-            shutil.copy2(settings_file, dest)
-
-        # Create project directory and write JSONL
+        # Create every destination directory up front so the copies and
+        # writes below are independent and can run concurrently
         # Structure: _claude_dir/.claude/projects/<project_dir_name>/<session_id>.jsonl
-        project_dir = self._claude_dir / ".claude" / "projects" / project_dir_name
+        project_dir = claude_subdir / "projects" / project_dir_name
         project_dir.mkdir(parents=True, exist_ok=True)
+        # Flat structure: .claude/file-history/<session_id>/<hash>@v1
+        fh_session_dir = claude_subdir / "file-history" / self.session_id
+        if file_history_files:
+            fh_session_dir.mkdir(parents=True, exist_ok=True)
+
+        copies = [
+            # ~/.claude.json (main auth/settings file) and its backup
+            (home_dir / ".claude.json", self._claude_dir / ".claude.json"),
+            (home_dir / ".claude.json.backup", self._claude_dir / ".claude.json.backup"),
+            # ~/.claude/.credentials.json (OAuth tokens)
+            (source_claude_dir / ".credentials.json", claude_subdir / ".credentials.json"),
+            (source_claude_dir / "settings.json", claude_subdir / "settings.json"),
+        ]
+        tasks = [asyncio.to_thread(shutil.copy2, src, dest) for src, dest in copies if src.exists()]
 
         # Write the truncated JSONL (use session_id as filename)
         jsonl_file = project_dir / f"{self.session_id}.jsonl"
-        jsonl_file.write_bytes(jsonl_content)
+        tasks.append(asyncio.to_thread(jsonl_file.write_bytes, jsonl_content))
 
-        # Copy file history (flat structure: .claude/file-history/<session_id>/<hash>@v1)
-        if file_history_files:
-            fh_session_dir = self._claude_dir / ".claude" / "file-history" / self.session_id
-            fh_session_dir.mkdir(parents=True, exist_ok=True)
+        # Copy file history
+        for filename, content in file_history_files.items():
+            tasks.append(asyncio.to_thread((fh_session_dir / filename).write_bytes, content))
 
-            for filename, content in file_history_files.items():
-                dest = fh_session_dir / filename
-                dest.write_bytes(content)
+        await asyncio.gather(*tasks)
 
     def get_shell_command(
         self,
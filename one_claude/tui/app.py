@@ -48,105 +48,7 @@ class OneClaude(App):
     TITLE = "one_claude"
     SUB_TITLE = "Time Travel for Claude Code"
 
-    CSS = """
-    Screen {
-        background: $background;
-    }
-
-    #main-container {
-        height: 100%;
-        width: 100%;
-    }
-
-    /* Sidebar styling */
-    .sidebar {
-        width: 26;
-        dock: left;
-        border-right: solid $border;
-        padding: 0 1;
-    }
-
-    .content {
-        width: 1fr;
-        padding-left: 1;
-    }
-
-    /* Section labels */
-    .section-label {
-        color: $text-muted;
-        text-style: bold;
-        margin-bottom: 1;
-    }
-
-    /* Message styling with left accent bars */
-    .message-container {
-        padding: 1;
-        margin-bottom: 1;
-        border-left: thick gray;
-    }
-
-    .message-user {
-        border-left: thick $primary;
-    }
-
-    .message-assistant {
-        background: $surface;
-        border-left: thick $secondary;
-    }
-
-    .message-summary {
-        background: $warning 15%;
-        border-left: thick $warning;
-    }
-
-    .message-checkpoint {
-        background: $success 15%;
-        border-left: thick $success;
-    }
-
-    .message-system {
-        background: $surface-darken-1;
-        border-left: thick gray;
-    }
-
-    .message-header {
-        text-style: bold;
-        margin-bottom: 1;
-        color: $text-muted;
-    }
-
-    .message-user .message-header {
-        color: $primary;
-    }
-
-    .message-assistant .message-header {
-        color: $secondary;
-    }
-
-    .message-checkpoint .message-header {
-        color: $success;
-    }
-
-    .tool-use {
-        background: $surface-darken-1;
-        padding: 0 1;
-        margin: 1 0;
-        border-left: solid $warning;
-    }
-
-    Header {
-        dock: top;
-    }
-
-    Footer {
-        dock: bottom;
-    }
-
-    #search-input {
-        dock: top;
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "app.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "Quit"),
@@ -163,17 +65,27 @@ class OneClaude(App):
         # Register and set Noir theme
         self.register_theme(THEME_NOIR)
 
-        # Check microsandbox availability for sandbox mode
-        self.sandbox_available = is_msb_available()
-
-        # Update subtitle to show sandbox mode
-        mode = "sandbox" if self.sandbox_available else "local"
-        self.sub_title = f"Time Travel for Claude Code [{mode}]"
+        # Microsandbox availability is probed after mount; None until known
+        self.sandbox_available: bool | None = None
+        self.sub_title = "Time Travel for Claude Code"
 
     def on_mount(self) -> None:
         """Handle app mount - push the home screen."""
         self.theme = "noir"
         self.push_screen(HomeScreen(self.scanner))
+        # Probing msb runs a subprocess; keep it off the first paint
+        self.run_worker(self._detect_sandbox, thread=True, exclusive=True, group="sandbox")
+
+    def _detect_sandbox(self) -> None:
+        """Check microsandbox availability and show the mode in the subtitle."""
+        available = is_msb_available()
+        self.call_from_thread(self._set_sandbox_available, available)
+
+    def _set_sandbox_available(self, available: bool) -> None:
+        """Record sandbox availability and update the subtitle."""
+        self.sandbox_available = available
+        mode = "sandbox" if available else "local"
+        self.sub_title = f"Time Travel for Claude Code [{mode}]"
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -192,22 +104,13 @@ class OneClaude(App):
     def action_refresh(self) -> None:
         """Refresh the current view."""
         if isinstance(self.screen, HomeScreen):
-            self.screen.refresh_sessions()
+            self.screen.refresh_conversations(force=True)
 
     def action_help(self) -> None:
         """Show help modal with keyboard shortcuts."""
         screen_name = "session" if isinstance(self.screen, SessionScreen) else "home"
         self.push_screen(HelpModal(screen_name))
 
-    def open_session(self, session_id: str) -> None:
-        """Open a session in detail view."""
-        # Find the session
-        for project in self.scanner.scan_all():
-            for session in project.sessions:
-                if session.id == session_id:
-                    self.push_screen(SessionScreen(session, self.scanner))
-                    return
-
 
 def run() -> None:
     """Run the one_claude TUI application."""
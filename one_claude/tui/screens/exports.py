@@ -82,24 +82,37 @@ class ExportsScreen(Screen):
 
         self.exports = load_exports()
         exports_list = self.query_one("#exports-list", ListView)
-        exports_list.clear()
+        # One repaint for the whole rebuild
+        with self.app.batch_update():
+            exports_list.clear()
+
+            if not self.exports:
+                exports_list.append(ListItem(Static("No exported gists yet", id="empty")))
+                return
+
+            for export in self.exports:
+                item = ListItem(
+                    Vertical(
+                        Static(export.title, classes="export-title"),
+                        Static(
+                            f"{export.message_count} msgs, {export.checkpoint_count} checkpoints | {export.exported_at[:10]} | {export.gist_id[:8]}...",
+                            classes="export-meta",
+                        ),
+                        classes="export-item",
+                    )
+                )
+                exports_list.append(item)
 
+    async def _remove_export(self, export) -> None:
+        """Drop a deleted export's row without rebuilding the list."""
+        exports_list = self.query_one("#exports-list", ListView)
+        index = next((i for i, e in enumerate(self.exports) if e is export), None)
+        if index is None:
+            return
+        del self.exports[index]
+        await exports_list.pop(index)
         if not self.exports:
             exports_list.append(ListItem(Static("No exported gists yet", id="empty")))
-            return
-
-        for export in self.exports:
-            item = ListItem(
-                Vertical(
-                    Static(export.title, classes="export-title"),
-                    Static(
-                        f"{export.message_count} msgs, {export.checkpoint_count} checkpoints | {export.exported_at[:10]} | {export.gist_id[:8]}...",
-                        classes="export-meta",
-                    ),
-                    classes="export-item",
-                )
-            )
-            exports_list.append(item)
 
     def _get_selected_export(self):
         exports_list = self.query_one("#exports-list", ListView)
@@ -116,19 +129,19 @@ class ExportsScreen(Screen):
     def action_go_back(self) -> None:
         self.app.pop_screen()
 
-    def action_copy_url(self) -> None:
+    async def action_copy_url(self) -> None:
         export = self._get_selected_export()
         if export:
-            if copy_to_clipboard(export.gist_url):
+            if await copy_to_clipboard(export.gist_url):
                 self.app.notify("URL copied!")
             else:
                 self.app.notify("Copy failed", severity="error")
 
-    def action_copy_command(self) -> None:
+    async def action_copy_command(self) -> None:
         export = self._get_selected_export()
         if export:
             command = f"uvx one_claude gist import {export.gist_id}"
-            if copy_to_clipboard(command):
+            if await copy_to_clipboard(command):
                 self.app.notify("Command copied!")
             else:
                 self.app.notify("Copy failed", severity="error")
@@ -146,17 +159,18 @@ class ExportsScreen(Screen):
 
         api = GistAPI()
         success, error = await api.delete(export.gist_id)
+        await api.aclose()
 
         if success:
             delete_export(export.gist_id)
             self.app.notify("Gist deleted")
-            self._refresh_list()
+            await self._remove_export(export)
         else:
             # Still remove from local tracking even if GitHub delete fails
             # (gist might have been manually deleted)
             if "404" in str(error):
                 delete_export(export.gist_id)
                 self.app.notify("Removed from list (already deleted from GitHub)")
-                self._refresh_list()
+                await self._remove_export(export)
             else:
                 self.app.notify(f"Delete failed: {error}", severity="error")
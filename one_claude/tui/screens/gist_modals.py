@@ -1,14 +1,17 @@
 """Modal screens for gist export/import and help."""
 
 import asyncio
+import shutil
 import subprocess
 import sys
+from functools import lru_cache
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Static
+from textual.worker import Worker
 
 
 class HelpModal(ModalScreen[None]):
@@ -116,24 +119,40 @@ class HelpModal(ModalScreen[None]):
         self.dismiss(None)
 
 
-def copy_to_clipboard(text: str) -> bool:
-    """Copy text to clipboard."""
-    try:
-        if sys.platform == "darwin":
-            subprocess.run(["pbcopy"], input=text.encode(), check=True)
-            return True
+@lru_cache(maxsize=1)
+def _clipboard_command() -> tuple[str, ...] | None:
+    """Find the clipboard tool once; each reads the text from stdin."""
+    if sys.platform == "darwin":
+        candidates = [("pbcopy",)]
+    else:
         # Linux - try wl-copy then xclip
-        try:
-            subprocess.run(["wl-copy", text], check=True)
-            return True
-        except FileNotFoundError:
-            pass
-        subprocess.run(["xclip", "-selection", "clipboard"], input=text.encode(), check=True)
+        candidates = [("wl-copy",), ("xclip", "-selection", "clipboard")]
+    for command in candidates:
+        if shutil.which(command[0]):
+            return command
+    return None
+
+
+def _run_clipboard(command: tuple[str, ...], payload: bytes) -> bool:
+    """Pipe payload into a clipboard tool, blocking until it exits."""
+    try:
+        subprocess.run(command, input=payload, check=True)
         return True
     except Exception:
         return False
 
 
+async def copy_to_clipboard(text: str) -> bool:
+    """Copy text to clipboard.
+
+    The clipboard tool runs in a worker thread so the UI keeps drawing.
+    """
+    command = _clipboard_command()
+    if command is None:
+        return False
+    return await asyncio.to_thread(_run_clipboard, command, text.encode())
+
+
 class AuthModal(ModalScreen[bool]):
     """Modal for GitHub device flow auth."""
 
@@ -189,7 +208,7 @@ class AuthModal(ModalScreen[bool]):
         self.user_code = user_code
         self.device_code = device_code
         self.interval = interval
-        self._polling = False
+        self._poll_worker: Worker | None = None
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -199,29 +218,28 @@ class AuthModal(ModalScreen[bool]):
             yield Static("Press 'c' to copy code", classes="hint")
             yield Static("Waiting for authorization...", id="status", classes="status")
 
-    def action_copy_code(self) -> None:
-        if copy_to_clipboard(self.user_code):
+    async def action_copy_code(self) -> None:
+        if await copy_to_clipboard(self.user_code):
             self.app.notify("Code copied!")
         else:
             self.app.notify("Copy failed")
 
     def on_mount(self) -> None:
-        self._polling = True
-        asyncio.create_task(self._poll())
+        # A screen worker is cancelled with the modal, so polling can't leak
+        self._poll_worker = self.run_worker(self._poll(), exclusive=True)
 
     async def _poll(self) -> None:
         from one_claude.gist.api import poll_for_token
 
         token, error = await poll_for_token(self.device_code, self.interval)
-        if not self._polling:
-            return
         if token:
             self.dismiss(True)
         else:
             self.query_one("#status", Static).update(f"Error: {error}")
 
     def action_cancel(self) -> None:
-        self._polling = False
+        if self._poll_worker is not None:
+            self._poll_worker.cancel()
         self.dismiss(False)
 
 
@@ -290,15 +308,15 @@ class ExportResultModal(ModalScreen[None]):
             yield Static(f"uvx one_claude gist import {self.gist_id}", classes="command")
             yield Static("'u' copy URL | 'c' copy command | Enter close", classes="hint")
 
-    def action_copy_url(self) -> None:
-        if copy_to_clipboard(self.gist_url):
+    async def action_copy_url(self) -> None:
+        if await copy_to_clipboard(self.gist_url):
             self.app.notify("URL copied!")
         else:
             self.app.notify("Copy failed")
 
-    def action_copy_command(self) -> None:
+    async def action_copy_command(self) -> None:
         command = f"uvx one_claude gist import {self.gist_id}"
-        if copy_to_clipboard(command):
+        if await copy_to_clipboard(command):
             self.app.notify("Command copied!")
         else:
             self.app.notify("Copy failed")
@@ -436,25 +454,27 @@ class GistsModal(ModalScreen[None]):
 
         self.exports = load_exports()
         gists_list = self.query_one("#gists-list", ListView)
-        gists_list.clear()
-
-        if not self.exports:
-            gists_list.append(ListItem(Static("No exported gists yet")))
-            return
-
-        for export in self.exports:
-            item = ListItem(
-                Vertical(
-                    Static(export.title, classes="gist-title"),
-                    Static(
-                        f"{export.message_count} msgs, {export.checkpoint_count} checkpoints | {export.exported_at[:10]}",
-                        classes="gist-meta",
-                    ),
-                    classes="gist-item",
+        # One repaint for the whole rebuild
+        with self.app.batch_update():
+            gists_list.clear()
+
+            if not self.exports:
+                gists_list.append(ListItem(Static("No exported gists yet")))
+                return
+
+            for export in self.exports:
+                item = ListItem(
+                    Vertical(
+                        Static(export.title, classes="gist-title"),
+                        Static(
+                            f"{export.message_count} msgs, {export.checkpoint_count} checkpoints | {export.exported_at[:10]}",
+                            classes="gist-meta",
+                        ),
+                        classes="gist-item",
+                    )
                 )
-            )
-            item.export = export  # Attach data
-            gists_list.append(item)
+                item.export = export  # Attach data
+                gists_list.append(item)
 
     def _get_selected_export(self):
         from textual.widgets import ListView
@@ -464,10 +484,10 @@ class GistsModal(ModalScreen[None]):
             return self.exports[gists_list.index]
         return None
 
-    def action_copy_url(self) -> None:
+    async def action_copy_url(self) -> None:
         export = self._get_selected_export()
         if export:
-            if copy_to_clipboard(export.gist_url):
+            if await copy_to_clipboard(export.gist_url):
                 self.app.notify("URL copied!")
             else:
                 self.app.notify("Copy failed")
@@ -483,14 +503,28 @@ class GistsModal(ModalScreen[None]):
 
         api = GistAPI()
         success, error = await api.delete(export.gist_id)
+        await api.aclose()
 
         if success:
             delete_export(export.gist_id)
             self.app.notify("Gist deleted")
-            self._refresh_list()
+            await self._remove_export(export)
         else:
             self.app.notify(f"Delete failed: {error}", severity="error")
 
+    async def _remove_export(self, export) -> None:
+        """Drop a deleted export's row without rebuilding the list."""
+        from textual.widgets import ListItem, ListView
+
+        gists_list = self.query_one("#gists-list", ListView)
+        index = next((i for i, e in enumerate(self.exports) if e is export), None)
+        if index is None:
+            return
+        del self.exports[index]
+        await gists_list.pop(index)
+        if not self.exports:
+            gists_list.append(ListItem(Static("No exported gists yet")))
+
     def action_cursor_down(self) -> None:
         from textual.widgets import ListView
 
@@ -5,31 +5,96 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache, partial
+from operator import attrgetter
+from pathlib import Path
 
 try:
-    import pyperclip
+    from watchfiles import awatch
 except ImportError:
-    pyperclip = None  # type: ignore
+    awatch = None  # type: ignore
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Footer, Input, Label, ListItem, ListView, Static
+from textual.worker import get_current_worker
 
-from one_claude.core.models import ConversationPath, Project
+from one_claude.core.models import ConversationPath, MessageTree, Project
 from one_claude.core.scanner import ClaudeScanner
 from one_claude.index.search import SearchEngine
 from one_claude.teleport.executors import get_mode_names
+from one_claude.teleport.restore import FileRestorer
+from one_claude.tui.screens.session import SessionScreen
+
+# Seconds a scan of ~/.claude is reused before the list rescans on refresh
+_RESCAN_MAX_AGE = 5.0
+
+# Seconds of typing pause before the conversation list is filtered
+_FILTER_DEBOUNCE = 0.1
+
+# Recent (query, project, preloaded trees) -> matching path IDs kept for reuse
+_MATCH_CACHE_MAX = 64
+
+
+# (seconds below, unit in seconds, suffix) for relative times; older is a date
+_TIME_BUCKETS = (
+    (60, 0, "just now"),
+    (3600, 60, "m ago"),
+    (86400, 3600, "h ago"),
+    (604800, 86400, "d ago"),
+)
+
+
+def _current_minute() -> datetime:
+    """Now, truncated to the minute relative times are computed against."""
+    return datetime.now().replace(second=0, microsecond=0)
+
+
+# Path fields a ConversationListItem renders (besides the sibling count)
+_displayed_fields = attrgetter(
+    "id",
+    "tree_prefix",
+    "title",
+    "last_user_message",
+    "project_display",
+    "updated_at",
+    "message_count",
+)
+
+
+@lru_cache(maxsize=4096)
+def _relative_time(updated: datetime, now: datetime) -> str:
+    """Format updated relative to now (e.g. "5m ago")."""
+    # Make both naive for comparison
+    if updated.tzinfo is not None:
+        updated = updated.replace(tzinfo=None)
+
+    seconds = (now - updated).total_seconds()
+    for limit, unit, suffix in _TIME_BUCKETS:
+        if seconds < limit:
+            return f"{int(seconds / unit)}{suffix}" if unit else suffix
+    return updated.strftime("%Y-%m-%d")
 
 
 class ConversationListItem(ListItem):
     """A single conversation path item in the list."""
 
-    def __init__(self, path: ConversationPath, is_match: bool = True, next_prefix: str = ""):
+    def __init__(
+        self,
+        path: ConversationPath,
+        is_match: bool = True,
+        next_prefix: str = "",
+        now: datetime | None = None,
+    ):
         super().__init__()
         self.path = path
+        self.now = now  # Shared reference time for the list pass
         self.is_match = is_match
         self.next_prefix = next_prefix  # Prefix of next item, for tree connection
         # Add dimmed class for non-matching items during search
@@ -54,26 +119,63 @@ class ConversationListItem(ListItem):
 
         # Meta line with tree continuation prefix (separate for coloring)
         meta_prefix = self._get_meta_prefix()
+        meta_content = self._meta_content()
+
+        # Cells of the item's grid (see DEFAULT_CSS); no row containers needed
+        if last_msg:
+            yield Static(display_title, classes="session-title", markup=False)
+            yield Static(f"  {last_msg}", classes="session-last-msg", markup=False)
+        else:
+            yield Static(display_title, classes="session-title -wide", markup=False)
+        yield Static(path_id, classes="session-id")
+        # Use Rich markup to color the tree prefix differently from content
+        if meta_prefix:
+            yield Static(
+                self._meta_markup(meta_prefix, meta_content),
+                classes="session-meta",
+                markup=True,
+            )
+        else:
+            yield Static(meta_content, classes="session-meta", markup=False)
+
+    def _meta_content(self) -> str:
+        """Project, time, size and branch summary for the meta line."""
         meta_content = f"{self._get_project_name()}  {self._format_time()}  {self.path.message_count} msgs"
 
         # Add branch indicator if this path has siblings
         if self.path.sibling_leaf_uuids:
             branch_count = len(self.path.sibling_leaf_uuids) + 1
             meta_content += f"  {branch_count} branches"
-
-        with Horizontal(classes="session-row"):
-            yield Static(display_title, classes="session-title", markup=False)
-            if last_msg:
-                yield Static(f"  {last_msg}", classes="session-last-msg", markup=False)
-            yield Static(path_id, classes="session-id")
-        with Horizontal(classes="session-row"):
-            # Use Rich markup to color the tree prefix differently from content
-            if meta_prefix:
-                safe_content = meta_content.replace("[", "\\[")
-                full_meta = f"[white]{meta_prefix}[/white]{safe_content}"
-                yield Static(full_meta, classes="session-meta", markup=True)
-            else:
-                yield Static(meta_content, classes="session-meta", markup=False)
+        return meta_content
+
+    @staticmethod
+    def _meta_markup(meta_prefix: str, meta_content: str) -> str:
+        """Meta line markup with the tree prefix colored apart from the content."""
+        safe_content = meta_content.replace("[", "\\[")
+        return f"[white]{meta_prefix}[/white]{safe_content}"
+
+    def shows(self, path: ConversationPath) -> bool:
+        """Check whether this item already renders what path would."""
+        return _displayed_fields(self.path) == _displayed_fields(path) and (
+            len(self.path.sibling_leaf_uuids) == len(path.sibling_leaf_uuids)
+        )
+
+    def set_next_prefix(self, next_prefix: str) -> bool:
+        """Reconnect the tree lines to a new next item without rebuilding.
+
+        Returns False if the item has to be rebuilt instead.
+        """
+        old_meta_prefix = self._get_meta_prefix()
+        self.next_prefix = next_prefix
+        meta_prefix = self._get_meta_prefix()
+        if meta_prefix == old_meta_prefix:
+            return True
+        if not meta_prefix or not old_meta_prefix:
+            return False  # Switches between plain and markup rendering
+        self.query_one(".session-meta", Static).update(
+            self._meta_markup(meta_prefix, self._meta_content())
+        )
+        return True
 
     def _get_meta_prefix(self) -> str:
         """Get the prefix for the metadata line to continue tree lines."""
@@ -135,35 +237,11 @@ class ConversationListItem(ListItem):
 
     def _get_project_name(self) -> str:
         """Get short project name."""
-        path = self.path.project_display
-        parts = path.rstrip("/").split("/")
-        return parts[-1] if parts else path
+        return self.path.project_short
 
     def _format_time(self) -> str:
         """Format the time as relative."""
-        now = datetime.now()
-        updated = self.path.updated_at
-
-        # Make both naive for comparison
-        if updated.tzinfo is not None:
-            updated = updated.replace(tzinfo=None)
-
-        diff = now - updated
-        seconds = diff.total_seconds()
-
-        if seconds < 60:
-            return "just now"
-        elif seconds < 3600:
-            mins = int(seconds / 60)
-            return f"{mins}m ago"
-        elif seconds < 86400:
-            hours = int(seconds / 3600)
-            return f"{hours}h ago"
-        elif seconds < 604800:
-            days = int(seconds / 86400)
-            return f"{days}d ago"
-        else:
-            return updated.strftime("%Y-%m-%d")
+        return _relative_time(self.path.updated_at, self.now or _current_minute())
 
 
 class ProjectListItem(ListItem):
@@ -187,9 +265,7 @@ class ProjectListItem(ListItem):
         """Get short project name."""
         if not self.project:
             return self.label
-        path = self.project.display_path
-        parts = path.rstrip("/").split("/")
-        return parts[-1] if parts else path
+        return self.project.short_name
 
 
 class HomeScreen(Screen):
@@ -276,6 +352,11 @@ class HomeScreen(Screen):
         height: auto;
         padding: 0 1;
         margin-bottom: 0;
+        /* Title, last message and ID over a full-width meta line */
+        layout: grid;
+        grid-size: 3 2;
+        grid-columns: 1fr auto 9;
+        grid-rows: 1 1;
     }
 
     ConversationListItem:hover {
@@ -286,18 +367,15 @@ class HomeScreen(Screen):
         background: $panel;
     }
 
-    ConversationListItem .session-row {
-        width: 100%;
-        height: 1;
-    }
-
     ConversationListItem .session-title {
-        width: 1fr;
         text-style: bold;
     }
 
+    ConversationListItem .session-title.-wide {
+        column-span: 2;
+    }
+
     ConversationListItem .session-id {
-        width: 9;
         color: $text-muted;
     }
 
@@ -307,7 +385,7 @@ class HomeScreen(Screen):
     }
 
     ConversationListItem .session-meta {
-        width: 100%;
+        column-span: 3;
         color: $text-muted;
     }
 
@@ -322,6 +400,13 @@ class HomeScreen(Screen):
 
     """
 
+    # Conversations mounted up front; the rest are mounted on demand
+    INITIAL_RENDER_COUNT = 100
+    # Number of conversations to mount when nearing the end of the list
+    LOAD_MORE_COUNT = 100
+    # Load more once the cursor is this close to the last mounted conversation
+    LOAD_AHEAD = 20
+
     def __init__(self, scanner: ClaudeScanner):
         super().__init__()
         self.scanner = scanner
@@ -334,6 +419,19 @@ class HomeScreen(Screen):
         self.search_query: str = ""
         self.teleport_mode: str = "docker"  # Default to docker
         self._g_pressed: bool = False  # For gg command
+        self._filter_timer: Timer | None = None  # Pending debounced filter
+        self._list_items: list[ConversationListItem] = []  # Mounted, in display order
+        # Every (path, is_match, next_prefix) row; only a prefix is mounted
+        self._rows: list[tuple[ConversationPath, bool, str]] = []
+        self._scan_lock = threading.Lock()  # Held by the scan worker
+        # Session files changed since the last scan was shown
+        self._changed_files: set[Path] = set()
+        # project display path -> its paths, filled as projects are selected
+        self._project_paths: dict[str, list[ConversationPath]] = {}
+        # path ID -> lowercased text of its messages, once all its trees are loaded
+        self._content_text: dict[str, str] = {}
+        # Search matches for recent queries, least recently used first
+        self._match_cache: OrderedDict[tuple[str, str | None, int], set[str]] = OrderedDict()
 
     def compose(self) -> ComposeResult:
         """Create the home screen layout."""
@@ -354,71 +452,205 @@ class HomeScreen(Screen):
         """Load conversations on mount."""
         self.refresh_conversations()
         # Focus conversation list by default
-        self.query_one("#session-list", ListView).focus()
+        session_list = self.query_one("#session-list", ListView)
+        session_list.focus()
+        # Mount more conversations as the list is scrolled towards the end
+        self.watch(session_list, "scroll_y", self._on_session_list_scroll, init=False)
 
         # Check for missing tools in local mode
         self._check_local_tools()
 
-    def refresh_conversations(self) -> None:
-        """Refresh the conversation list."""
-        # Still need projects for the sidebar
-        self.projects = self.scanner.scan_all()
+        if awatch is not None:
+            self.run_worker(self._watch_sessions, exclusive=True, group="watch")
+
+    def refresh_conversations(self, force: bool = False) -> None:
+        """Refresh the conversation list.
+
+        Scanning runs in a worker thread; the lists are rebuilt when it is done.
+
+        Args:
+            force: Rescan ~/.claude even if the last scan is recent
+        """
+        if not self.all_paths:
+            # First load; later refreshes keep showing the current list
+            self.query_one("#session-list", ListView).loading = True
+        # Changes stay pending until a scan including them is shown, since a
+        # newer refresh cancels this worker
+        changed = frozenset(self._changed_files)
+        self.run_worker(
+            partial(self._scan_conversations, force, changed),
+            thread=True,
+            exclusive=True,
+            group="scan",
+        )
+
+    async def _watch_sessions(self) -> None:
+        """Rescan the session files that change, dropping only their cached trees."""
+        try:
+            async for changes in awatch(
+                self.scanner.projects_dir,
+                watch_filter=lambda _change, path: path.endswith(".jsonl"),
+            ):
+                changed = {Path(path) for _, path in changes}
+                self.search_engine.invalidate({path.stem for path in changed})
+                self._changed_files |= changed
+                self.refresh_conversations()
+        except Exception:
+            pass  # Missing projects dir or no watcher backend; refresh with r
+
+    def _scan_conversations(self, force: bool, changed: frozenset[Path]) -> None:
+        """Scan projects and conversation paths, then hand them to the UI."""
+        # Workers replaced by a newer refresh keep running; don't overlap scans
+        with self._scan_lock:
+            if get_current_worker().is_cancelled:
+                return
+            # Still need projects for the sidebar
+            if force:
+                projects = self.scanner.scan_all()
+            elif changed:
+                projects = self.scanner.scan_all(changed=changed)
+            else:
+                projects = self.scanner.scan_all(max_age=_RESCAN_MAX_AGE)
 
-        # Populate project list
-        project_list = self.query_one("#project-list", ListView)
-        project_list.clear()
-        project_list.append(ProjectListItem(None, "All"))
-        for project in self.projects:
-            project_list.append(ProjectListItem(project))
+            # Get conversation paths (uses tree cache from search engine preload);
+            # they come from the sessions just scanned, not a second scan
+            tree_cache = self.search_engine._tree_cache
+            paths = self.scanner.scan_conversation_paths(
+                tree_cache=tree_cache, max_age=_RESCAN_MAX_AGE
+            )
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._show_conversations, projects, paths, changed)
+
+    def _show_conversations(
+        self,
+        projects: list[Project],
+        paths: list[ConversationPath],
+        changed: frozenset[Path] = frozenset(),
+    ) -> None:
+        """Rebuild the project and conversation lists from a scan."""
+        self._changed_files -= changed
+        self.projects = projects
+        self.all_paths = paths
+        self._project_paths.clear()
+        self._content_text.clear()
+        self._match_cache.clear()
+
+        # Rebuild both lists with a single repaint
+        with self.app.batch_update():
+            project_list = self.query_one("#project-list", ListView)
+            project_list.clear()
+            project_list.append(ProjectListItem(None, "All"))
+            for project in self.projects:
+                project_list.append(ProjectListItem(project))
+
+            # Show conversations
+            self._update_conversation_list()
+            self.query_one("#session-list", ListView).loading = False
+
+    def _update_conversation_list(self) -> None:
+        """Update the conversation list based on selected project and search."""
+        # Removals, mounts and the header update land in one repaint
+        with self.app.batch_update():
+            self._filter_conversation_list()
 
-        # Get conversation paths (uses tree cache from search engine preload)
+    def find_path(self, leaf_uuid: str) -> ConversationPath | None:
+        """Loaded conversation path ending at leaf_uuid, if any."""
+        return next((p for p in self.all_paths if p.leaf_uuid == leaf_uuid), None)
+
+    def _matching_ids(self, base_paths: list[ConversationPath]) -> set[str]:
+        """IDs of paths in base_paths that match the search query.
+
+        Results are reused for a repeated query and project until the paths
+        are rescanned or the background preload adds message trees. A query
+        that extends a cached one only rechecks that query's matches.
+        """
         tree_cache = self.search_engine._tree_cache
-        self.all_paths = self.scanner.scan_conversation_paths(tree_cache=tree_cache)
+        project = self.selected_project.display_path if self.selected_project else None
+        key = (self.search_query, project, len(tree_cache))
+        cached = self._match_cache.get(key)
+        if cached is not None:
+            self._match_cache.move_to_end(key)
+            return cached
+
+        # The query is matched as one phrase, within the title or one message
+        query = self.search_query.lower()
+        matching_ids: set[str] = set()
 
-        # Show conversations
-        self._update_conversation_list()
+        # Anything containing the extended query contains its prefix, so only
+        # the longest cached prefix's matches can still match
+        narrowed: set[str] | None = None
+        narrowed_len = 0
+        for (prev_query, prev_project, prev_trees), prev_ids in self._match_cache.items():
+            prev_query = prev_query.lower()
+            if (
+                prev_project == project
+                and prev_trees == key[2]
+                and len(prev_query) > narrowed_len
+                and query.startswith(prev_query)
+            ):
+                narrowed, narrowed_len = prev_ids, len(prev_query)
+        if narrowed is not None:
+            base_paths = [p for p in base_paths if p.id in narrowed]
+
+        for p in base_paths:
+            # Title match
+            if query in p.title_lower:
+                matching_ids.add(p.id)
+                continue
+
+            # Content match - one substring scan over the path's joined text;
+            # messages are joined by line breaks, which a query can't contain
+            if query in self._path_content_text(p, tree_cache):
+                matching_ids.add(p.id)
+
+        self._match_cache[key] = matching_ids
+        if len(self._match_cache) > _MATCH_CACHE_MAX:
+            self._match_cache.popitem(last=False)
+        return matching_ids
+
+    def _path_content_text(
+        self, path: ConversationPath, tree_cache: dict[str, MessageTree]
+    ) -> str:
+        """Lowercased text of a path's messages, one message per line.
+
+        Cached once every session on the path has its tree preloaded.
+        """
+        text = self._content_text.get(path.id)
+        if text is not None:
+            return text
+        parts: list[str] = []
+        complete = True
+        for jsonl_file in path.jsonl_files:
+            tree = tree_cache.get(jsonl_file.stem)
+            if not tree:
+                complete = False
+                continue
+            parts.extend(
+                msg.text_lower
+                for msg in tree.get_linear_path(path.leaf_uuid)
+                if msg.text_content
+            )
+        text = "\n".join(parts)
+        if complete:
+            self._content_text[path.id] = text
+        return text
 
-    def _update_conversation_list(self) -> None:
-        """Update the conversation list based on selected project and search."""
+    def _filter_conversation_list(self) -> None:
+        """Filter paths and sync the list widget; see _update_conversation_list."""
         session_list = self.query_one("#session-list", ListView)
-        session_list.clear()
 
         # Start with all or project-filtered paths
         if self.selected_project:
-            base_paths = [
-                p for p in self.all_paths
-                if p.project_display == self.selected_project.display_path
-            ]
+            display_path = self.selected_project.display_path
+            base_paths = self._project_paths.get(display_path)
+            if base_paths is None:
+                base_paths = [p for p in self.all_paths if p.project_display == display_path]
+                self._project_paths[display_path] = base_paths
         else:
             base_paths = self.all_paths
 
         # Track which paths match the search (for highlighting)
-        matching_ids: set[str] = set()
-
-        if self.search_query:
-            query_lower = self.search_query.lower()
-            tree_cache = self.search_engine._tree_cache
-
-            for p in base_paths:
-                # Title match
-                if query_lower in p.title.lower():
-                    matching_ids.add(p.id)
-                    continue
-
-                # Content match - search messages in tree cache
-                for jsonl_file in p.jsonl_files:
-                    session_id = jsonl_file.stem
-                    tree = tree_cache.get(session_id)
-                    if tree:
-                        # Get the linear path for this conversation
-                        path_msgs = tree.get_linear_path(p.leaf_uuid)
-                        for msg in path_msgs:
-                            if msg.text_content and query_lower in msg.text_content.lower():
-                                matching_ids.add(p.id)
-                                break
-                        else:
-                            continue
-                        break
+        matching_ids = self._matching_ids(base_paths) if self.search_query else set()
 
         # Filter and display paths
         if self.search_query:
@@ -448,6 +680,7 @@ class HomeScreen(Screen):
         else:
             self.paths = list(base_paths)
 
+        rows = []
         for i, path in enumerate(self.paths):
             # If searching, dim non-matching paths (but still show them if tree has a match)
             is_match = not self.search_query or path.id in matching_ids
@@ -455,7 +688,8 @@ class HomeScreen(Screen):
             next_prefix = ""
             if i + 1 < len(self.paths):
                 next_prefix = self.paths[i + 1].tree_prefix or ""
-            session_list.append(ConversationListItem(path, is_match=is_match, next_prefix=next_prefix))
+            rows.append((path, is_match, next_prefix))
+        self._sync_conversation_items(session_list, rows)
 
         # Update header
         header = self.query_one("#sessions-header", Label)
@@ -463,25 +697,141 @@ class HomeScreen(Screen):
         if self.search_query:
             match_count = len(matching_ids)
             if self.selected_project:
-                name = self.selected_project.display_path.rstrip("/").split("/")[-1]
+                name = self.selected_project.short_name
                 header.update(f"Conversations - {name} ({match_count}/{count} match)")
             else:
                 header.update(f"Conversations ({match_count}/{count} match)")
         elif self.selected_project:
-            name = self.selected_project.display_path.rstrip("/").split("/")[-1]
+            name = self.selected_project.short_name
             header.update(f"Conversations - {name} ({count})")
         else:
             header.update(f"Conversations ({count})")
 
+    def _sync_conversation_items(
+        self, session_list: ListView, rows: list[tuple[ConversationPath, bool, str]]
+    ) -> None:
+        """Make the list show rows, reusing items already mounted for them.
+
+        Only the first INITIAL_RENDER_COUNT rows are mounted; the rest follow
+        as the cursor or scroll position nears the end (_load_more_conversations).
+        Filtering keeps the relative order of paths, so surviving items stay
+        put; only items that left or changed are removed and only new ones are
+        mounted. A rescan's fresh paths replace those of unchanged items, and
+        the cursor stays on the same path if it is still listed.
+        """
+        index = session_list.index
+        selected_id = (
+            self._list_items[index].path.id
+            if index is not None and index < len(self._list_items)
+            else None
+        )
+        self._rows = rows
+        mounted = {item.path.id: item for item in self._list_items}
+        now = _current_minute()
+        items: list[ConversationListItem] = []
+        kept: set[int] = set()
+        for path, is_match, next_prefix in rows[: self.INITIAL_RENDER_COUNT]:
+            item = mounted.pop(path.id, None)
+            # The item renders its path; a changed next_prefix only redraws
+            # the tree connector on its meta line
+            if (
+                item is not None
+                and item.shows(path)
+                and (item.next_prefix == next_prefix or item.set_next_prefix(next_prefix))
+            ):
+                item.path = path
+                item.is_match = is_match
+                item.set_class(not is_match, "dimmed")
+                kept.add(id(item))
+            else:
+                item = ConversationListItem(
+                    path, is_match=is_match, next_prefix=next_prefix, now=now
+                )
+            items.append(item)
+
+        for item in self._list_items:
+            if id(item) not in kept:
+                item.remove()
+
+        # Mount each run of new items next to the kept item before it
+        anchor: ConversationListItem | None = None
+        run: list[ConversationListItem] = []
+        for item in items + [None]:
+            if item is not None and id(item) not in kept:
+                run.append(item)
+                continue
+            if run:
+                if anchor is not None:
+                    session_list.mount_all(run, after=anchor)
+                elif item is not None:
+                    session_list.mount_all(run, before=item)
+                else:
+                    session_list.mount_all(run)
+                run = []
+            anchor = item
+
+        self._list_items = items
+        session_list.index = next(
+            (i for i, item in enumerate(items) if item.path.id == selected_id), None
+        )
+
+    def _load_more_conversations(self, count: int = 0) -> bool:
+        """Mount the next count rows (LOAD_MORE_COUNT by default).
+
+        Returns True if any were mounted.
+        """
+        start = len(self._list_items)
+        rows = self._rows[start : start + (count or self.LOAD_MORE_COUNT)]
+        if not rows:
+            return False
+        now = _current_minute()
+        items = [
+            ConversationListItem(path, is_match=is_match, next_prefix=next_prefix, now=now)
+            for path, is_match, next_prefix in rows
+        ]
+        self.query_one("#session-list", ListView).mount_all(items)
+        self._list_items.extend(items)
+        return True
+
+    def _ensure_conversation_mounted(self, index: int) -> None:
+        """Mount rows up to index so the cursor can move there."""
+        missing = index + 1 - len(self._list_items)
+        if missing > 0:
+            self._load_more_conversations(missing)
+
+    def _on_session_list_scroll(self, scroll_y: float) -> None:
+        """Mount more conversations when scrolled near the end of the list."""
+        session_list = self.query_one("#session-list", ListView)
+        if session_list.max_scroll_y - scroll_y <= session_list.size.height:
+            self._load_more_conversations()
+
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        """Mount more conversations as the cursor nears the last mounted one."""
+        if event.list_view.id == "session-list" and event.list_view.index is not None:
+            if event.list_view.index >= len(self._list_items) - self.LOAD_AHEAD:
+                self._load_more_conversations()
+
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes."""
         if event.input.id == "search-input":
             self.search_query = event.value
-            self._update_conversation_list()
+            # Coalesce fast typing into a single rebuild
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(_FILTER_DEBOUNCE, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        """Filter the conversation list once typing pauses."""
+        self._filter_timer = None
+        self._update_conversation_list()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle search input submission (Enter)."""
         if event.input.id == "search-input":
+            if self._filter_timer is not None:
+                # Apply the pending filter now so the list matches the query
+                self._filter_timer.stop()
+                self._apply_filter()
             session_list = self.query_one("#session-list", ListView)
             session_list.focus()
             if self.paths:
@@ -494,8 +844,6 @@ class HomeScreen(Screen):
             self._update_conversation_list()
         elif isinstance(event.item, ConversationListItem):
             # Open session screen with conversation path
-            from one_claude.tui.screens.session import SessionScreen
-
             self.app.push_screen(SessionScreen(event.item.path, self.scanner))
 
     def action_cursor_down(self) -> None:
@@ -527,6 +875,8 @@ class HomeScreen(Screen):
         """Go to bottom of list (G)."""
         self._g_pressed = False
         focused = self.focused
+        if isinstance(focused, ListView) and focused.id == "session-list":
+            self._ensure_conversation_mounted(len(self._rows) - 1)
         if isinstance(focused, ListView) and focused.children:
             focused.index = len(focused.children) - 1
 
@@ -542,6 +892,8 @@ class HomeScreen(Screen):
         """Page down half screen (ctrl+d)."""
         self._g_pressed = False
         focused = self.focused
+        if isinstance(focused, ListView) and focused.id == "session-list":
+            self._ensure_conversation_mounted((focused.index or 0) + 10)
         if isinstance(focused, ListView) and focused.children:
             focused.index = min(len(focused.children) - 1, (focused.index or 0) + 10)
 
@@ -556,6 +908,8 @@ class HomeScreen(Screen):
         """Page down full screen (ctrl+f)."""
         self._g_pressed = False
         focused = self.focused
+        if isinstance(focused, ListView) and focused.id == "session-list":
+            self._ensure_conversation_mounted((focused.index or 0) + 20)
         if isinstance(focused, ListView) and focused.children:
             focused.index = min(len(focused.children) - 1, (focused.index or 0) + 20)
 
@@ -595,12 +949,17 @@ class HomeScreen(Screen):
             self._update_conversation_list()
 
     def _copy_to_clipboard(self, text: str) -> tuple[bool, str]:
-        """Copy text to clipboard. Returns (success, error_hint)."""
+        """Copy text to clipboard. Returns (success, error_hint).
+
+        Blocks on the clipboard tool; call it from a worker thread.
+        """
+        payload = text.encode()  # Shared by every tool fed through stdin
+
         # macOS: pbcopy
         if sys.platform == "darwin":
             if shutil.which("pbcopy"):
                 try:
-                    subprocess.run(["pbcopy"], input=text.encode(), check=True)
+                    subprocess.run(["pbcopy"], input=payload, check=True)
                     return True, ""
                 except Exception:
                     pass
@@ -618,20 +977,21 @@ class HomeScreen(Screen):
             try:
                 subprocess.run(
                     ["xclip", "-selection", "clipboard"],
-                    input=text.encode(),
+                    input=payload,
                     check=True,
                 )
                 return True, ""
             except Exception:
                 pass
 
-        # Try pyperclip as last resort
-        if pyperclip:
-            try:
-                pyperclip.copy(text)
-                return True, ""
-            except Exception:
-                pass
+        # Try pyperclip as last resort; imported only if it gets this far
+        try:
+            import pyperclip
+
+            pyperclip.copy(text)
+            return True, ""
+        except Exception:
+            pass
 
         # Suggest install based on environment
         if os.environ.get("WAYLAND_DISPLAY"):
@@ -639,12 +999,20 @@ class HomeScreen(Screen):
         else:
             return False, "install xclip"
 
-    def action_copy_session_id(self) -> None:
+    async def action_copy_session_id(self) -> None:
         """Copy selected conversation ID to clipboard."""
         session_list = self.query_one("#session-list", ListView)
         if session_list.index is not None and session_list.index < len(self.paths):
             path = self.paths[session_list.index]
-            success, hint = self._copy_to_clipboard(path.id)
+            # OSC 52 asks the terminal itself to copy; no subprocess, and it
+            # reaches the local clipboard over SSH
+            self.app.copy_to_clipboard(path.id)
+            if os.environ.get("SSH_CONNECTION"):
+                # Clipboard tools here would copy on the remote host
+                success, hint = True, ""
+            else:
+                # Not every terminal honours OSC 52, so use the local tool too
+                success, hint = await asyncio.to_thread(self._copy_to_clipboard, path.id)
             if success:
                 self.app.notify(f"Copied: {path.id[:8]}...")
             else:
@@ -677,8 +1045,6 @@ class HomeScreen(Screen):
 
     async def _do_teleport(self, path: ConversationPath) -> None:
         """Execute teleport to a conversation path."""
-        from one_claude.teleport.restore import FileRestorer
-
         mode_str = self.teleport_mode
         self.app.notify(f"Teleporting to {path.id[:8]} ({mode_str})...")
 
@@ -725,10 +1091,13 @@ class HomeScreen(Screen):
                 sys.stderr.write(f"   Terminal: {term_size.columns}x{term_size.lines} ({term})\n\n")
                 sys.stderr.flush()
 
-                subprocess.run(shell_cmd, cwd=working_dir)
+                # Python opens files non-inheritable, so only the terminal's stdio
+                # reaches the shell anyway; skip the close-every-fd pass on spawn
+                subprocess.run(shell_cmd, cwd=working_dir, close_fds=False)
 
             self.app.notify("Cleaning up...")
             await sandbox.stop()
+            await sandbox.await_cleanup()
             self.app.notify(f"Returned from teleport ({files_count} files)")
 
         except Exception as e:
@@ -806,7 +1175,7 @@ class HomeScreen(Screen):
             msg = f"Imported {result.message_count} msgs, {result.checkpoint_count} checkpoints"
             self.app.notify(msg)
             self.app.notify(f"Session: {result.session_id[:8] if result.session_id else 'unknown'}")
-            self.refresh_conversations()
+            self.refresh_conversations(force=True)
         else:
             self.app.notify(f"Import failed: {result.error}", severity="error")
 
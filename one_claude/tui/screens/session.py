@@ -1,13 +1,14 @@
 """Session detail screen showing the conversation."""
 
+import asyncio
 import os
 import shutil
+import subprocess
+import sys
+from bisect import bisect_left
+from collections.abc import Iterable
 from datetime import datetime
-
-try:
-    import pyperclip
-except ImportError:
-    pyperclip = None  # type: ignore
+from functools import lru_cache
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -18,11 +19,86 @@ from textual.widgets import Collapsible, Footer, Input, Label, Static
 
 from one_claude.core.models import ConversationPath, Message, MessageTree, MessageType
 from one_claude.core.scanner import ClaudeScanner
+from one_claude.teleport.restore import FileRestorer
+
+
+# Tool name -> (input shown for it, max characters or None for all)
+_TOOL_SUMMARY_INPUTS: dict[str, tuple[str, int | None]] = {
+    "Read": ("file_path", None),
+    "Write": ("file_path", None),
+    "Edit": ("file_path", None),
+    "Bash": ("command", 60),
+    "Grep": ("pattern", None),
+    "Glob": ("pattern", None),
+    "Task": ("description", None),
+}
+
+
+# Message types shown in the conversation; system messages are toggled with s
+_DISPLAY_TYPES = frozenset(
+    {
+        MessageType.USER,
+        MessageType.ASSISTANT,
+        MessageType.SUMMARY,
+        MessageType.FILE_HISTORY_SNAPSHOT,
+    }
+)
+_DISPLAY_TYPES_WITH_SYSTEM = _DISPLAY_TYPES | {MessageType.SYSTEM}
+
+# Message type -> CSS classes of its widget
+_TYPE_CLASSES = {
+    MessageType.USER: "message-container message-user",
+    MessageType.ASSISTANT: "message-container message-assistant",
+    MessageType.SUMMARY: "message-container message-summary",
+    MessageType.FILE_HISTORY_SNAPSHOT: "message-container message-checkpoint",
+    MessageType.SYSTEM: "message-container message-system",
+}
+
+
+def _pyperclip_copy(text: str) -> None:
+    """Copy with pyperclip, imported on first use; raises if it is missing."""
+    import pyperclip
+
+    pyperclip.copy(text)
+
+
+@lru_cache(maxsize=4096)
+def _format_age(ts: datetime, now: datetime) -> str:
+    """Format ts relative to now (e.g. "2h 5m ago"); now is minute-aligned."""
+    if ts.tzinfo is not None:
+        ts = ts.replace(tzinfo=None)
+
+    diff = now - ts
+    seconds = int(diff.total_seconds())
+
+    if seconds < 60:
+        return "just now"
+
+    minutes = seconds // 60
+    hours = minutes // 60
+    days = hours // 24
+
+    if days > 7:
+        return ts.strftime("%Y-%m-%d %H:%M")
+    elif days > 0:
+        remaining_hours = hours % 24
+        if remaining_hours > 0:
+            return f"{days}d {remaining_hours}h ago"
+        return f"{days}d ago"
+    elif hours > 0:
+        remaining_mins = minutes % 60
+        if remaining_mins > 0:
+            return f"{hours}h {remaining_mins}m ago"
+        return f"{hours}h ago"
+    else:
+        return f"{minutes}m ago"
 
 
 class MessageClicked(TextualMessage):
     """Message sent when a message widget is clicked."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: Message) -> None:
         self.message = message
         super().__init__()
@@ -37,27 +113,16 @@ class MessageWidget(Static):
         turn_number: int = 0,
         show_thinking: bool = False,
         has_branch: bool = False,  # True if there's a branch at this point
+        now: datetime | None = None,  # Minute-aligned, shared by a batch of widgets
     ):
         self.message = message
         self.turn_number = turn_number
         self.show_thinking = show_thinking
         self.has_branch = has_branch
+        self.now = now
 
         # Determine CSS class based on message type
-        if message.type == MessageType.USER:
-            classes = "message-container message-user"
-        elif message.type == MessageType.ASSISTANT:
-            classes = "message-container message-assistant"
-        elif message.type == MessageType.SUMMARY:
-            classes = "message-container message-summary"
-        elif message.type == MessageType.FILE_HISTORY_SNAPSHOT:
-            classes = "message-container message-checkpoint"
-        elif message.type == MessageType.SYSTEM:
-            classes = "message-container message-system"
-        else:
-            classes = "message-container"
-
-        super().__init__(classes=classes)
+        super().__init__(classes=_TYPE_CLASSES.get(message.type, "message-container"))
 
     def on_click(self) -> None:
         """Handle click on message widget."""
@@ -69,13 +134,14 @@ class MessageWidget(Static):
         header_text = self._build_header()
         yield Static(header_text, classes="message-header")
 
-        # Content
+        # Content; empty fields get no widget, so they add nothing to layout
         if self.message.type == MessageType.USER:
-            yield self._render_user_content()
+            yield from self._render_user_content()
         elif self.message.type == MessageType.ASSISTANT:
             yield from self._render_assistant_content()
         elif self.message.type == MessageType.SUMMARY:
-            yield Static(self.message.summary_text or "", classes="message-content", markup=False)
+            if self.message.summary_text:
+                yield Static(self.message.summary_text, classes="message-content", markup=False)
         elif self.message.type == MessageType.FILE_HISTORY_SNAPSHOT:
             yield from self._render_checkpoint_content()
         elif self.message.type == MessageType.SYSTEM:
@@ -111,38 +177,10 @@ class MessageWidget(Static):
 
     def _format_time(self) -> str:
         """Format timestamp with h/m/d breakdown."""
-        ts = self.message.timestamp
-        now = datetime.now()
-
-        if ts.tzinfo is not None:
-            ts = ts.replace(tzinfo=None)
-
-        diff = now - ts
-        seconds = int(diff.total_seconds())
-
-        if seconds < 60:
-            return "just now"
-
-        minutes = seconds // 60
-        hours = minutes // 60
-        days = hours // 24
-
-        if days > 7:
-            return ts.strftime("%Y-%m-%d %H:%M")
-        elif days > 0:
-            remaining_hours = hours % 24
-            if remaining_hours > 0:
-                return f"{days}d {remaining_hours}h ago"
-            return f"{days}d ago"
-        elif hours > 0:
-            remaining_mins = minutes % 60
-            if remaining_mins > 0:
-                return f"{hours}h {remaining_mins}m ago"
-            return f"{hours}h ago"
-        else:
-            return f"{minutes}m ago"
+        now = self.now or datetime.now().replace(second=0, microsecond=0)
+        return _format_age(self.message.timestamp, now)
 
-    def _render_user_content(self) -> Static:
+    def _render_user_content(self) -> ComposeResult:
         """Render user message content."""
         content = self.message.text_content
 
@@ -153,7 +191,8 @@ class MessageWidget(Static):
             if len(result.content) > 500:
                 content += "\n... (truncated)"
 
-        return Static(content, classes="message-content", markup=False)
+        if content:
+            yield Static(content, classes="message-content", markup=False)
 
     def _render_assistant_content(self) -> ComposeResult:
         """Render assistant message content."""
@@ -167,26 +206,14 @@ class MessageWidget(Static):
             yield Static(tool_display, classes="tool-use", markup=False)
 
         # Thinking (if enabled)
-        if self.show_thinking and self.message.thinking:
+        if self.show_thinking and self.message.thinking and self.message.thinking.content:
             yield Static(self.message.thinking.content, classes="thinking", markup=False)
 
     def _render_checkpoint_content(self) -> ComposeResult:
         """Render file history checkpoint content."""
-        snapshot = self.message.snapshot_data
-        if isinstance(snapshot, str):
-            # Parse JSON string if needed
-            import json
-            try:
-                snapshot = json.loads(snapshot)
-            except (json.JSONDecodeError, TypeError):
-                snapshot = {}
-
-        if isinstance(snapshot, dict):
-            file_count = len(snapshot)
-            if file_count > 0:
-                yield Static(f"Saved {file_count} file(s)", classes="checkpoint-info")
-            else:
-                yield Static("Checkpoint saved", classes="checkpoint-info")
+        file_count = self.message.snapshot_file_count
+        if file_count > 0:
+            yield Static(f"Saved {file_count} file(s)", classes="checkpoint-info")
         else:
             yield Static("Checkpoint saved", classes="checkpoint-info")
 
@@ -208,30 +235,15 @@ class MessageWidget(Static):
         name = tool_use.name
         inputs = tool_use.input
 
-        # Format based on tool type
-        if name == "Read":
-            path = inputs.get("file_path", "")
-            return f"Read: {path}"
-        elif name == "Write":
-            path = inputs.get("file_path", "")
-            return f"Write: {path}"
-        elif name == "Edit":
-            path = inputs.get("file_path", "")
-            return f"Edit: {path}"
-        elif name == "Bash":
-            cmd = inputs.get("command", "")[:60]
-            return f"Bash: {cmd}"
-        elif name == "Grep":
-            pattern = inputs.get("pattern", "")
-            return f"Grep: {pattern}"
-        elif name == "Glob":
-            pattern = inputs.get("pattern", "")
-            return f"Glob: {pattern}"
-        elif name == "Task":
-            desc = inputs.get("description", "")
-            return f"Task: {desc}"
-        else:
+        # Known tools show one input, optionally truncated
+        shown = _TOOL_SUMMARY_INPUTS.get(name)
+        if shown is None:
             return f"{name}: {str(inputs)[:50]}"
+        key, limit = shown
+        value = inputs.get(key, "")
+        if limit:
+            value = value[:limit]
+        return f"{name}: {value}"
 
 
 class SessionScreen(Screen):
@@ -357,15 +369,20 @@ class SessionScreen(Screen):
         self.scanner = scanner
         self.displayed_count: int = 0
         self.search_query: str = ""
-        self.match_widgets: list[MessageWidget] = []
+        # Search matches as indices into _all_display_messages
+        self.match_indices: list[int] = []
+        self._match_set: set[int] = set()
+        # Last (query, matches), narrowed when the next query extends it
+        self._last_search: tuple[str, list[int]] | None = None
         self.current_match_index: int = -1
         # All message widgets and selection
         self.message_widgets: list[MessageWidget] = []
         self.selected_message: Message | None = None
         self.selected_message_widget: MessageWidget | None = None
         self.current_message_index: int = -1
-        # Checkpoint navigation (subset of messages)
-        self.checkpoint_widgets: list[MessageWidget] = []
+        # Checkpoint navigation: indices into _all_display_messages, so
+        # checkpoints in the unrendered gap are reachable too
+        self.checkpoint_indices: list[int] = []
         self.current_checkpoint_index: int = -1
         # Toggle for showing system messages (hidden by default)
         self.show_system: bool = False
@@ -375,6 +392,14 @@ class SessionScreen(Screen):
         self._fork_points: set[str] = set()
         # All display messages (for lazy loading)
         self._all_display_messages: list[Message] = []
+        # Widgets used by most actions, kept to skip a DOM query per keystroke
+        self._search_input = Input(placeholder="/search...", id="search-input")
+        self._meta = Static(f"  {self.path.project_display}", id="session-meta")
+        self._container = ScrollableContainer(id="message-container")
+        # Lowercased searchable text of each display message
+        self._search_text: list[str] = []
+        # Message UUID -> index of its first display message
+        self._index_by_uuid: dict[str, int] = {}
         # Gap in the middle (unrendered messages between top and bottom)
         self._gap_start: int = 0  # First unrendered index
         self._gap_end: int = 0  # Last unrendered index (exclusive)
@@ -382,7 +407,7 @@ class SessionScreen(Screen):
     def compose(self) -> ComposeResult:
         """Create the session screen layout."""
         # Search input (hidden by default)
-        yield Input(placeholder="/search...", id="search-input")
+        yield self._search_input
 
         # Header with session info and ID
         with Horizontal(id="session-header-row"):
@@ -395,19 +420,16 @@ class SessionScreen(Screen):
                 self.path.id[:8],
                 id="session-id",
             )
-        yield Static(
-            f"  {self.path.project_display}",
-            id="session-meta",
-        )
+        yield self._meta
 
         # Message list
-        yield ScrollableContainer(id="message-container")
+        yield self._container
         yield Footer()
 
     def on_mount(self) -> None:
         """Load messages on mount."""
         self._load_messages()
-        container = self.query_one("#message-container", ScrollableContainer)
+        container = self._container
         # Focus container so keybindings work immediately
         container.focus()
         # Scroll to bottom and select last checkpoint
@@ -420,7 +442,7 @@ class SessionScreen(Screen):
 
     def _load_messages(self) -> None:
         """Load and display messages."""
-        container = self.query_one("#message-container", ScrollableContainer)
+        container = self._container
 
         # Load messages and tree together (avoid double-parsing)
         messages, tree = self.scanner.load_conversation_path_with_tree(self.path)
@@ -434,18 +456,40 @@ class SessionScreen(Screen):
                 if tree.is_fork_point(msg.uuid):
                     self._fork_points.add(msg.uuid)
 
-        # Filter to displayable message types
-        display_types = [MessageType.USER, MessageType.ASSISTANT, MessageType.SUMMARY, MessageType.FILE_HISTORY_SNAPSHOT]
-        if self.show_system:
-            display_types.append(MessageType.SYSTEM)
-        self._all_display_messages = [m for m in messages if m.type in display_types]
-
-        # Count checkpoints
-        checkpoint_count = sum(1 for m in self._all_display_messages if m.type == MessageType.FILE_HISTORY_SNAPSHOT)
+        # Filter to displayable message types, indexing them in the same pass
+        display_types = _DISPLAY_TYPES_WITH_SYSTEM if self.show_system else _DISPLAY_TYPES
+        checkpoint_type = MessageType.FILE_HISTORY_SNAPSHOT
+        display_messages: list[Message] = []
+        index_by_uuid: dict[str, int] = {}
+        search_text: list[str] = []
+        checkpoint_indices: list[int] = []
+        for m in messages:
+            msg_type = m.type
+            if msg_type not in display_types:
+                continue
+            i = len(display_messages)
+            display_messages.append(m)
+            index_by_uuid.setdefault(m.uuid, i)
+            # text_lower is memoized on the message and shared with the home
+            # screen's search; only summaries need a joined copy
+            text = m.text_lower
+            if m.summary_text:
+                text = f"{text}\0{m.summary_text.lower()}"
+            search_text.append(text)
+            if msg_type is checkpoint_type:
+                checkpoint_indices.append(i)
+        self._all_display_messages = display_messages
+        self._index_by_uuid = index_by_uuid
+        self._search_text = search_text
+        self.checkpoint_indices = checkpoint_indices
+        checkpoint_count = len(checkpoint_indices)
+        self.match_indices = []
+        self._match_set = set()
+        self._last_search = None
 
         # Update header with info
         self.displayed_count = len(self._all_display_messages)
-        meta = self.query_one("#session-meta", Static)
+        meta = self._meta
         branch_str = ""
         if self.path.sibling_leaf_uuids:
             branch_count = len(self.path.sibling_leaf_uuids) + 1
@@ -465,47 +509,56 @@ class SessionScreen(Screen):
             self._gap_start = self.INITIAL_RENDER_COUNT  # End of top section
             self._gap_end = total - self.INITIAL_RENDER_COUNT  # Start of bottom section
 
-        # Create message widgets for both ends
+        # Create message widgets for both ends, with a single repaint
         self.message_widgets = []
-        self.checkpoint_widgets = []
-        self._render_messages(container, 0, self._gap_start)  # Top section
-        if self._gap_end < total:
-            self._render_messages(container, self._gap_end, total)  # Bottom section
+        with self.app.batch_update():
+            self._render_messages(container, 0, self._gap_start)  # Top section
+            if self._gap_end < total:
+                self._render_messages(container, self._gap_end, total)  # Bottom section
 
     def _render_messages(self, container, start_idx: int, end_idx: int, prepend: bool = False) -> None:
         """Render messages in the given range."""
-        messages_to_render = self._all_display_messages[start_idx:end_idx]
-        new_widgets = []
-
-        for i, msg in enumerate(messages_to_render, start=start_idx + 1):
-            has_branch = msg.uuid in self._fork_points
-            widget = MessageWidget(
-                msg,
-                turn_number=i,
-                show_thinking=True,
-                has_branch=has_branch,
-            )
-            new_widgets.append(widget)
-            if msg.type == MessageType.FILE_HISTORY_SNAPSHOT:
-                self.checkpoint_widgets.append(widget)
+        new_widgets = self._build_widgets(start_idx, end_idx)
 
+        # Each range is mounted in one call, so it lays out once
         if prepend:
             # Insert at the beginning
-            for widget in reversed(new_widgets):
-                container.mount(widget, before=0)
+            container.mount_all(new_widgets, before=0)
             self.message_widgets = new_widgets + self.message_widgets
         else:
             # Append at the end
-            for widget in new_widgets:
-                container.mount(widget)
+            container.mount_all(new_widgets)
             self.message_widgets.extend(new_widgets)
 
+    def _build_widgets(self, start_idx: int, end_idx: int) -> list[MessageWidget]:
+        """Create unmounted widgets for the display messages in the given range."""
+        # Ages are shown to the minute; an aligned now lets _format_age reuse them
+        now = datetime.now().replace(second=0, microsecond=0)
+        widgets = [
+            MessageWidget(
+                msg,
+                turn_number=i,
+                show_thinking=True,
+                has_branch=msg.uuid in self._fork_points,
+                now=now,
+            )
+            for i, msg in enumerate(
+                self._all_display_messages[start_idx:end_idx], start=start_idx + 1
+            )
+        ]
+        # Search matches rendered after the search are highlighted too
+        if self._match_set:
+            for idx, widget in enumerate(widgets, start=start_idx):
+                if idx in self._match_set:
+                    widget.add_class("search-match")
+        return widgets
+
     def _load_more_at_top(self) -> bool:
         """Load more messages at the top of the gap. Returns True if more were loaded."""
         if self._gap_start >= self._gap_end:
             return False  # No gap left
 
-        container = self.query_one("#message-container", ScrollableContainer)
+        container = self._container
 
         # Calculate new range - expand top section into the gap
         new_end = min(self._gap_start + self.LOAD_MORE_COUNT, self._gap_end)
@@ -513,19 +566,9 @@ class SessionScreen(Screen):
         # Find the widget index where we need to insert (after current top section)
         insert_idx = self._gap_start
 
-        # Render the new messages
-        messages_to_render = self._all_display_messages[self._gap_start:new_end]
-        new_widgets = []
-        for i, msg in enumerate(messages_to_render, start=self._gap_start + 1):
-            has_branch = msg.uuid in self._fork_points
-            widget = MessageWidget(msg, turn_number=i, show_thinking=True, has_branch=has_branch)
-            new_widgets.append(widget)
-            if msg.type == MessageType.FILE_HISTORY_SNAPSHOT:
-                self.checkpoint_widgets.append(widget)
-
-        # Insert after the top section
-        for j, widget in enumerate(new_widgets):
-            container.mount(widget, before=insert_idx + j)
+        # Render the new messages and insert them after the top section
+        new_widgets = self._build_widgets(self._gap_start, new_end)
+        container.mount_all(new_widgets, before=insert_idx)
 
         # Insert into message_widgets at the right position
         self.message_widgets = (
@@ -542,7 +585,7 @@ class SessionScreen(Screen):
         if self._gap_start >= self._gap_end:
             return False  # No gap left
 
-        container = self.query_one("#message-container", ScrollableContainer)
+        container = self._container
 
         # Calculate new range - expand bottom section into the gap
         new_start = max(self._gap_end - self.LOAD_MORE_COUNT, self._gap_start)
@@ -550,19 +593,9 @@ class SessionScreen(Screen):
         # Find the widget index where the bottom section starts
         bottom_section_start = self._gap_start
 
-        # Render the new messages
-        messages_to_render = self._all_display_messages[new_start:self._gap_end]
-        new_widgets = []
-        for i, msg in enumerate(messages_to_render, start=new_start + 1):
-            has_branch = msg.uuid in self._fork_points
-            widget = MessageWidget(msg, turn_number=i, show_thinking=True, has_branch=has_branch)
-            new_widgets.append(widget)
-            if msg.type == MessageType.FILE_HISTORY_SNAPSHOT:
-                self.checkpoint_widgets.append(widget)
-
-        # Insert before the bottom section
-        for j, widget in enumerate(new_widgets):
-            container.mount(widget, before=bottom_section_start + j)
+        # Render the new messages and insert them before the bottom section
+        new_widgets = self._build_widgets(new_start, self._gap_end)
+        container.mount_all(new_widgets, before=bottom_section_start)
 
         # Insert into message_widgets at the right position
         self.message_widgets = (
@@ -629,7 +662,7 @@ class SessionScreen(Screen):
 
     def _scroll_to_end_and_select_last(self) -> None:
         """Scroll to bottom and select last message."""
-        container = self.query_one("#message-container", ScrollableContainer)
+        container = self._container
         container.scroll_end(animate=False)
         # Select last message
         if self.message_widgets:
@@ -638,24 +671,24 @@ class SessionScreen(Screen):
 
     def action_cancel_or_back(self) -> None:
         """Cancel search or go back to home screen."""
-        search_input = self.query_one("#search-input", Input)
+        search_input = self._search_input
         if search_input.has_class("visible"):
             # Hide search and clear highlights
             search_input.remove_class("visible")
             search_input.value = ""
             self._clear_highlights()
-            self.query_one("#message-container", ScrollableContainer).focus()
+            self._container.focus()
         else:
             self.app.pop_screen()
 
     def action_scroll_down(self) -> None:
         """Scroll down."""
-        container = self.query_one("#message-container", ScrollableContainer)
+        container = self._container
         container.scroll_down()
 
     def action_scroll_up(self) -> None:
         """Scroll up, loading more messages if approaching gap."""
-        container = self.query_one("#message-container", ScrollableContainer)
+        container = self._container
         # Check if near top of visible area and load more if gap exists
         if container.scroll_y < 200 and self._gap_start < self._gap_end:
             self._load_more_at_top()
@@ -698,39 +731,50 @@ class SessionScreen(Screen):
     def on_message_clicked(self, event: MessageClicked) -> None:
         """Handle message click."""
         # Find the widget for this message
-        for widget in self.message_widgets:
-            if widget.message.uuid == event.message.uuid:
-                self._select_message_widget(widget)
-                break
+        msg_idx = self._index_by_uuid.get(event.message.uuid)
+        if msg_idx is None:
+            return
+        widget_idx = self._message_index_to_widget_index(msg_idx)
+        if widget_idx is not None:
+            self._select_message_widget(self.message_widgets[widget_idx])
 
     def _select_message_widget(self, widget: MessageWidget) -> None:
         """Select a message widget and update UI."""
-        # Clear previous selection
-        if self.selected_message_widget:
-            self.selected_message_widget.remove_class("selected")
-            self.selected_message_widget.styles.background = None
-            self.selected_message_widget.styles.border_left = None
-
-        # Select the widget
-        widget.add_class("selected")
-        widget.styles.background = "#1e2a3a"  # Subtle dark blue tint
-        widget.styles.border_left = ("thick", "#00d4ff")  # Cyan accent
+        # Reselecting (e.g. tab wrapping onto the same checkpoint) keeps the
+        # styles as they are rather than restyling the widget twice
+        if widget is not self.selected_message_widget:
+            # Clear previous selection
+            if self.selected_message_widget:
+                self.selected_message_widget.remove_class("selected")
+                self.selected_message_widget.styles.background = None
+                self.selected_message_widget.styles.border_left = None
+
+            # Select the widget
+            widget.add_class("selected")
+            widget.styles.background = "#1e2a3a"  # Subtle dark blue tint
+            widget.styles.border_left = ("thick", "#00d4ff")  # Cyan accent
         widget.scroll_visible()
         self.selected_message_widget = widget
         self.selected_message = widget.message
 
-        # Update index
-        try:
-            self.current_message_index = self.message_widgets.index(widget)
-        except ValueError:
+        # Update index; turn numbers are 1-based message indices
+        msg_idx = widget.turn_number - 1
+        widget_idx = self._message_index_to_widget_index(msg_idx)
+        if widget_idx is not None and widget_idx < len(self.message_widgets) and (
+            self.message_widgets[widget_idx] is widget
+        ):
+            self.current_message_index = widget_idx
+        else:
             self.current_message_index = -1
 
         # Update checkpoint index if this is a checkpoint
-        if widget.message.type == MessageType.FILE_HISTORY_SNAPSHOT:
-            try:
-                self.current_checkpoint_index = self.checkpoint_widgets.index(widget)
-            except ValueError:
-                pass
+        if (
+            widget.message.type == MessageType.FILE_HISTORY_SNAPSHOT
+            and self.current_message_index >= 0
+        ):
+            cp_idx = bisect_left(self.checkpoint_indices, msg_idx)
+            if cp_idx < len(self.checkpoint_indices) and self.checkpoint_indices[cp_idx] == msg_idx:
+                self.current_checkpoint_index = cp_idx
 
     def action_next_message(self) -> None:
         """Go to next message."""
@@ -755,32 +799,31 @@ class SessionScreen(Screen):
 
     def action_next_checkpoint(self) -> None:
         """Go to next checkpoint."""
-        if not self.checkpoint_widgets:
+        if not self.checkpoint_indices:
             return
-        self.current_checkpoint_index = (self.current_checkpoint_index + 1) % len(self.checkpoint_widgets)
-        widget = self.checkpoint_widgets[self.current_checkpoint_index]
-        self._select_message_widget(widget)
+        self.current_checkpoint_index = (self.current_checkpoint_index + 1) % len(self.checkpoint_indices)
+        self._select_checkpoint()
 
     def action_prev_checkpoint(self) -> None:
         """Go to previous checkpoint."""
-        if not self.checkpoint_widgets:
+        if not self.checkpoint_indices:
             return
-        self.current_checkpoint_index = (self.current_checkpoint_index - 1) % len(self.checkpoint_widgets)
-        widget = self.checkpoint_widgets[self.current_checkpoint_index]
-        self._select_message_widget(widget)
+        self.current_checkpoint_index = (self.current_checkpoint_index - 1) % len(self.checkpoint_indices)
+        self._select_checkpoint()
+
+    def _select_checkpoint(self) -> None:
+        """Select the current checkpoint, rendering it first if it is in the gap."""
+        msg_idx = self.checkpoint_indices[self.current_checkpoint_index]
+        widget_idx = self._ensure_message_loaded(msg_idx)
+        self._select_message_widget(self.message_widgets[widget_idx])
 
     def action_teleport(self) -> None:
         """Launch teleport from selected message."""
-        import asyncio
         if self.selected_message:
             asyncio.create_task(self._do_teleport())
 
     async def _do_teleport(self) -> None:
         """Execute the teleport and launch shell."""
-        import subprocess
-        import sys
-        from one_claude.teleport.restore import FileRestorer
-
         try:
             # Get Session object for restorer
             if not self.path.jsonl_files:
@@ -835,17 +878,19 @@ class SessionScreen(Screen):
                 sys.stderr.flush()
 
                 # Run tmux session in foreground
-                subprocess.run(shell_cmd, cwd=working_dir)
+                # Inherit fds rather than closing each one; see HomeScreen._do_teleport
+                subprocess.run(shell_cmd, cwd=working_dir, close_fds=False)
 
             # Cleanup temp directory after shell exits
             await sandbox.stop()
+            await sandbox.await_cleanup()
 
         except Exception as e:
             self.app.notify(f"Teleport error: {e}", severity="error")
 
     def action_start_search(self) -> None:
         """Show search input."""
-        search_input = self.query_one("#search-input", Input)
+        search_input = self._search_input
         search_input.add_class("visible")
         search_input.focus()
 
@@ -854,77 +899,91 @@ class SessionScreen(Screen):
         if event.input.id == "search-input":
             self._perform_search(event.value)
             # Hide search input and return focus to container for n/N navigation
-            search_input = self.query_one("#search-input", Input)
+            search_input = self._search_input
             search_input.remove_class("visible")
-            self.query_one("#message-container", ScrollableContainer).focus()
+            self._container.focus()
 
     def _perform_search(self, query: str) -> None:
         """Search for query in messages."""
         self._clear_highlights()
         self.search_query = query.lower()
-        self.match_widgets = []
-        self.current_match_index = -1
 
         if not self.search_query:
             return
 
-        # Find all matching message widgets
-        container = self.query_one("#message-container", ScrollableContainer)
-        for widget in container.query(MessageWidget):
-            msg = widget.message
-            # Search in text content and summary
-            searchable = (msg.text_content or "") + (msg.summary_text or "")
-            if self.search_query in searchable.lower():
-                self.match_widgets.append(widget)
+        # A query extending the last one can only match among its matches
+        candidates: Iterable[int] = range(len(self._search_text))
+        if self._last_search is not None and self.search_query.startswith(self._last_search[0]):
+            candidates = self._last_search[1]
+        search_text = self._search_text
+        self.match_indices = [i for i in candidates if self.search_query in search_text[i]]
+        self._match_set = set(self.match_indices)
+        self._last_search = (self.search_query, self.match_indices)
+
+        # Highlight matches that are already rendered; the rest are
+        # highlighted as they are loaded
+        for widget_idx, widget in enumerate(self.message_widgets):
+            if self._widget_index_to_message_index(widget_idx) in self._match_set:
                 widget.add_class("search-match")
 
         # Go to first match
-        if self.match_widgets:
+        if self.match_indices:
             self.current_match_index = 0
             self._scroll_to_current_match()
-            self.app.notify(f"Match 1 of {len(self.match_widgets)}")
+            self.app.notify(f"Match 1 of {len(self.match_indices)}")
         else:
             self.app.notify(f"No matches for '{query}'")
 
     def action_next_match(self) -> None:
         """Go to next search match."""
-        if not self.match_widgets:
+        if not self.match_indices:
             return
-        self.current_match_index = (self.current_match_index + 1) % len(self.match_widgets)
+        self.current_match_index = (self.current_match_index + 1) % len(self.match_indices)
         self._scroll_to_current_match()
-        self.app.notify(f"Match {self.current_match_index + 1} of {len(self.match_widgets)}")
+        self.app.notify(f"Match {self.current_match_index + 1} of {len(self.match_indices)}")
 
     def action_prev_match(self) -> None:
         """Go to previous search match."""
-        if not self.match_widgets:
+        if not self.match_indices:
             return
-        self.current_match_index = (self.current_match_index - 1) % len(self.match_widgets)
+        self.current_match_index = (self.current_match_index - 1) % len(self.match_indices)
         self._scroll_to_current_match()
-        self.app.notify(f"Match {self.current_match_index + 1} of {len(self.match_widgets)}")
+        self.app.notify(f"Match {self.current_match_index + 1} of {len(self.match_indices)}")
 
     def _scroll_to_current_match(self) -> None:
-        """Scroll to show the current match."""
-        if 0 <= self.current_match_index < len(self.match_widgets):
-            widget = self.match_widgets[self.current_match_index]
-            widget.scroll_visible()
+        """Scroll to show the current match, rendering it first if needed."""
+        if 0 <= self.current_match_index < len(self.match_indices):
+            widget_idx = self._ensure_message_loaded(self.match_indices[self.current_match_index])
+            self.message_widgets[widget_idx].scroll_visible()
 
     def _clear_highlights(self) -> None:
         """Clear all search highlights."""
-        container = self.query_one("#message-container", ScrollableContainer)
-        for widget in container.query(".search-match"):
-            widget.remove_class("search-match")
-        self.match_widgets = []
+        # Only rendered matches carry the highlight
+        for msg_idx in self.match_indices:
+            widget_idx = self._message_index_to_widget_index(msg_idx)
+            if widget_idx is not None:
+                self.message_widgets[widget_idx].remove_class("search-match")
+        self.match_indices = []
+        self._match_set = set()
         self.current_match_index = -1
 
-    def action_copy_session_id(self) -> None:
+    async def action_copy_session_id(self) -> None:
         """Copy conversation path ID to clipboard."""
-        if pyperclip:
-            try:
-                pyperclip.copy(self.path.id)
-                self.app.notify(f"Copied: {self.path.id[:8]}...")
-                return
-            except Exception:
-                pass
+        # OSC 52 asks the terminal itself to copy; no subprocess, and it
+        # reaches the local clipboard over SSH
+        self.app.copy_to_clipboard(self.path.id)
+        if os.environ.get("SSH_CONNECTION"):
+            # pyperclip here would copy on the remote host
+            self.app.notify(f"Copied: {self.path.id[:8]}...")
+            return
+        # Not every terminal honours OSC 52, so use pyperclip too
+        try:
+            # pyperclip shells out to the clipboard tool; keep it off the event loop
+            await asyncio.to_thread(_pyperclip_copy, self.path.id)
+            self.app.notify(f"Copied: {self.path.id[:8]}...")
+            return
+        except Exception:
+            pass
         # Fallback: just show the ID
         self.app.notify(f"ID: {self.path.id}")
 
@@ -946,26 +1005,33 @@ class SessionScreen(Screen):
         # TODO: Show a picker if there are multiple siblings
         sibling_uuid = self.path.sibling_leaf_uuids[0]
 
-        # Find the ConversationPath for this sibling
-        # We need to scan paths again or cache them
-        tree_cache = {}
-        paths = self.scanner.scan_conversation_paths(tree_cache=tree_cache)
-        for p in paths:
-            if p.leaf_uuid == sibling_uuid:
-                # Replace this screen with the sibling path
-                self.app.pop_screen()
-                self.app.push_screen(SessionScreen(p, self.scanner))
-                return
+        from one_claude.tui.screens.home import HomeScreen
+
+        # Find the ConversationPath for this sibling; the home screen already
+        # holds every path, so only rescan if it doesn't have it
+        sibling = None
+        for screen in self.app.screen_stack:
+            if isinstance(screen, HomeScreen):
+                sibling = screen.find_path(sibling_uuid)
+                break
+        if sibling is None:
+            tree_cache = {}
+            paths = self.scanner.scan_conversation_paths(tree_cache=tree_cache)
+            sibling = next((p for p in paths if p.leaf_uuid == sibling_uuid), None)
+        if sibling is not None:
+            # Replace this screen with the sibling path
+            self.app.pop_screen()
+            self.app.push_screen(SessionScreen(sibling, self.scanner))
+            return
 
         self.app.notify("Could not find sibling branch")
 
     def _reload_messages(self) -> None:
         """Reload all messages (used after toggling filters)."""
-        container = self.query_one("#message-container", ScrollableContainer)
+        container = self._container
         # Clear existing widgets
         container.remove_children()
         self.message_widgets = []
-        self.checkpoint_widgets = []
         self.selected_message = None
         self.selected_message_widget = None
         self.current_message_index = -1
@@ -976,8 +1042,6 @@ class SessionScreen(Screen):
 
     def action_export_from_message(self) -> None:
         """Export from selected message to gist."""
-        import asyncio
-
         if self.selected_message:
             asyncio.create_task(self._do_export())
         else:
@@ -0,0 +1,64 @@
+"""Shared fixtures for one_claude tests."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from one_claude.core.scanner import ClaudeScanner
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point ~ at a temporary directory so caches don't touch the real one."""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    return home
+
+
+@pytest.fixture
+def claude_dir(tmp_path: Path) -> Path:
+    """An empty ~/.claude with a projects directory."""
+    path = tmp_path / "claude"
+    (path / "projects").mkdir(parents=True)
+    return path
+
+
+@pytest.fixture
+def write_session(claude_dir: Path) -> Callable[..., Path]:
+    """Write a linear user/assistant session JSONL and return its path."""
+
+    def write(session_id: str, texts: list[str], project: str = "-tmp-project") -> Path:
+        project_dir = claude_dir / "projects" / project
+        project_dir.mkdir(parents=True, exist_ok=True)
+        records = []
+        parent = None
+        for i, text in enumerate(texts):
+            role = "user" if i % 2 == 0 else "assistant"
+            uuid = f"{session_id}-{i}"
+            content = text if role == "user" else [{"type": "text", "text": text}]
+            records.append(
+                {
+                    "type": role,
+                    "uuid": uuid,
+                    "parentUuid": parent,
+                    "sessionId": session_id,
+                    "timestamp": f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}.000Z",
+                    "cwd": "/tmp/project",
+                    "message": {"role": role, "content": content},
+                }
+            )
+            parent = uuid
+        path = project_dir / f"{session_id}.jsonl"
+        path.write_text("".join(json.dumps(record) + "\n" for record in records))
+        return path
+
+    return write
+
+
+@pytest.fixture
+def scanner(claude_dir: Path) -> ClaudeScanner:
+    """A scanner over claude_dir."""
+    return ClaudeScanner(claude_dir)
@@ -0,0 +1,84 @@
+"""Tests for the batched sandbox file writer."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from one_claude.teleport import async_writer
+from one_claude.teleport.async_writer import _DEDUPE_MIN, AsyncArtifactWriter
+
+
+def _write_all(writer: AsyncArtifactWriter, files: dict[Path, bytes | Path]) -> set[str]:
+    async def run() -> set[str]:
+        for path, content in files.items():
+            if isinstance(content, Path):
+                await writer.submit_copy(str(path), content)
+            else:
+                await writer.submit(str(path), content)
+        return await writer.flush()
+
+    return asyncio.run(run())
+
+
+def test_writes_batches_and_creates_parents(tmp_path: Path):
+    files = {tmp_path / "a" / "b" / f"{n}.txt": f"file {n}".encode() for n in range(10)}
+    assert _write_all(AsyncArtifactWriter(max_files=3), files) == set()
+    for path, content in files.items():
+        assert path.read_bytes() == content
+
+
+def test_reflinks_identical_large_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    clones = []
+
+    def clone(src: str, dst: str) -> bool:
+        clones.append((src, dst))
+        Path(dst).write_bytes(Path(src).read_bytes())
+        return True
+
+    monkeypatch.setattr(async_writer, "_clone_file", clone)
+    content = b"x" * _DEDUPE_MIN
+    first, second = tmp_path / "first", tmp_path / "second"
+    _write_all(AsyncArtifactWriter(), {first: content, second: content})
+    assert clones == [(str(first), str(second))]
+    assert second.read_bytes() == content
+
+
+def test_falls_back_to_writes_without_reflinks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    calls = []
+
+    def clone(src: str, dst: str) -> bool:
+        calls.append(dst)
+        return False
+
+    monkeypatch.setattr(async_writer, "_clone_file", clone)
+    content = b"y" * _DEDUPE_MIN
+    files = {tmp_path / f"{n}": content for n in range(4)}
+    writer = AsyncArtifactWriter()
+    assert _write_all(writer, files) == set()
+    assert not writer._reflinks
+    assert len(calls) == 1  # Not attempted again once a clone failed
+    assert all(path.read_bytes() == content for path in files)
+
+
+def test_small_files_are_not_deduplicated(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(async_writer, "_clone_file", pytest.fail)
+    _write_all(AsyncArtifactWriter(), {tmp_path / "a": b"same", tmp_path / "b": b"same"})
+    assert (tmp_path / "b").read_bytes() == b"same"
+
+
+def test_flush_reports_failed_copies(tmp_path: Path):
+    source = tmp_path / "source"
+    source.write_bytes(b"data")
+    good, bad = tmp_path / "out" / "good", tmp_path / "out" / "bad"
+    writer = AsyncArtifactWriter()
+
+    failed = _write_all(writer, {good: source, bad: tmp_path / "missing"})
+    assert failed == {str(bad)}
+    assert good.read_bytes() == b"data"
+    assert not bad.exists()
+
+    # Reported once, and cleared when the path is written successfully
+    assert _write_all(writer, {}) == set()
+    assert _write_all(writer, {bad: tmp_path / "missing", good: source}) == {str(bad)}
+    assert _write_all(writer, {bad: source}) == set()
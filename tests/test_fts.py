@@ -0,0 +1,102 @@
+"""Tests for the SQLite FTS5 content index and its use by SearchEngine."""
+
+from pathlib import Path
+
+import pytest
+
+from one_claude.core.scanner import ClaudeScanner
+from one_claude.index.fts import FTSIndex
+from one_claude.index.search import SearchEngine
+
+
+@pytest.fixture
+def engine(scanner: ClaudeScanner, tmp_path: Path) -> SearchEngine:
+    engine = SearchEngine(scanner, tmp_path / "data")
+    if not engine._get_fts_index().available:
+        pytest.skip("SQLite lacks FTS5 or the trigram tokenizer")
+    return engine
+
+
+def _scores(results) -> dict[str, float]:
+    return {r.session.id: r.score for r in results}
+
+
+def _scan(engine: SearchEngine, query: str):
+    """Search with the linear scan only."""
+    engine._get_fts_index()._available = False
+    try:
+        return engine._search_content(query, engine._get_sessions(), 50)
+    finally:
+        engine._get_fts_index()._available = True
+
+
+def test_indexes_sessions_and_reindexes_changes(engine, write_session):
+    write_session("s1", ["first question", "an answer"])
+    sessions = engine._get_sessions()
+    fts = engine._get_fts_index()
+
+    assert engine._search_fts(fts, "question", sessions, 50)
+    assert fts.is_current(sessions[0])
+
+    write_session("s1", ["other words", "an answer", "more"])
+    engine.invalidate({"s1"})
+    sessions = engine._get_sessions(force_refresh=True)
+    assert not fts.is_current(sessions[0])
+    assert engine._search_fts(fts, "question", sessions, 50) == []
+    assert fts.is_current(sessions[0])
+
+
+def test_matches_substrings_case_insensitively(engine, write_session):
+    write_session("s1", ["raised a TypeError here", "ok"])
+    results = engine._search_content("error", engine._get_sessions(), 50)
+    assert [r.session.id for r in results] == ["s1"]
+    assert "TypeError" in results[0].snippet
+
+
+def test_escapes_quotes_and_operators(engine, write_session):
+    write_session("s1", ['he said "hi there" OR NOT', "fine"])
+    fts = engine._get_fts_index()
+    sessions = engine._get_sessions()
+    assert engine._search_fts(fts, '"hi there"', sessions, 50)
+    assert engine._search_fts(fts, "OR NOT", sessions, 50)
+    assert engine._search_fts(fts, 'x"y*', sessions, 50) == []
+
+
+def test_short_and_non_ascii_queries_fall_back(engine, write_session):
+    write_session("s1", ["ab İstanbul", "ok"])
+    fts = engine._get_fts_index()
+    assert fts.search("ab") is None
+    assert fts.search("i̇stanbul") is None
+    assert engine._search_fts(fts, "ab", engine._get_sessions(), 50) is None
+    assert _scores(engine._search_content("ab", engine._get_sessions(), 50)) == {"s1": 1}
+    assert _scores(engine._search_content("i̇stanbul", engine._get_sessions(), 50)) == {"s1": 1}
+
+
+def test_returns_every_matching_session(engine, write_session):
+    for n in range(120):
+        write_session(f"s{n:03d}", [f"needle {n}", "reply"])
+    results = engine._search_content("needle", engine._get_sessions(), 50)
+    assert len(results) == 120
+
+
+def test_scores_match_the_linear_scan(engine, write_session):
+    write_session("s1", ["error error error", "no match", "error again"])
+    write_session("s2", ["one error", "TypeError and ValueError"])
+    write_session("s3", ["errorerror", "nothing"])
+    fts_scores = _scores(engine._search_content("error", engine._get_sessions(), 50))
+    assert fts_scores == _scores(_scan(engine, "error"))
+    assert fts_scores == {"s1": 4, "s2": 3, "s3": 2}
+
+
+def test_schema_change_rebuilds_database(tmp_path: Path):
+    index = FTSIndex(tmp_path)
+    if not index.available:
+        pytest.skip("SQLite lacks FTS5 or the trigram tokenizer")
+    conn = index._connect()
+    conn.execute("PRAGMA user_version = 1")
+    conn.close()
+
+    reopened = FTSIndex(tmp_path)
+    assert reopened.available
+    version = reopened._connect().execute("PRAGMA user_version").fetchone()[0]
+    assert version != 1
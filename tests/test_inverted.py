@@ -0,0 +1,72 @@
+"""Tests for the whole-word inverted index."""
+
+import os
+from pathlib import Path
+
+from one_claude.core.scanner import ClaudeScanner
+from one_claude.index.inverted import InvertedIndex, tokenize
+
+
+def _index_all(index: InvertedIndex, scanner: ClaudeScanner) -> dict:
+    sessions = {s.id: s for p in scanner.scan_all() for s in p.sessions}
+    for session in sessions.values():
+        index.add_session(session, scanner.load_session_messages(session))
+    return sessions
+
+
+def test_tokenize_lowercases_words_of_three_or_more():
+    assert tokenize("Fix the DB io_error in parse_file, ok?") == [
+        "fix",
+        "the",
+        "io_error",
+        "parse_file",
+    ]
+
+
+def test_search_requires_every_term(tmp_path: Path, scanner: ClaudeScanner, write_session):
+    write_session("s1", ["parser crash on empty file", "fixed the parser"])
+    write_session("s2", ["parser works", "good"])
+    index = InvertedIndex(tmp_path / "index")
+    _index_all(index, scanner)
+
+    assert index.search("parser crash") == [("s1", "s1-0", 2)]
+    assert sorted(r[0] for r in index.search("PARSER")) == ["s1", "s2"]
+    assert index.search("parser", session_ids={"s2"}) == [("s2", "s2-0", 1)]
+    assert index.search("missing") == []
+
+
+def test_ranks_by_term_frequency(tmp_path: Path, scanner: ClaudeScanner, write_session):
+    write_session("s1", ["error", "ok"])
+    write_session("s2", ["error error", "another error"])
+    index = InvertedIndex(tmp_path / "index")
+    _index_all(index, scanner)
+    assert [r[0] for r in index.search("error")] == ["s2", "s1"]
+    assert index.search("error")[0][1] == "s2-0"
+
+
+def test_reindexing_replaces_postings(tmp_path: Path, scanner: ClaudeScanner, write_session):
+    path = write_session("s1", ["alpha words", "ok"])
+    index = InvertedIndex(tmp_path / "index")
+    sessions = _index_all(index, scanner)
+    assert index.is_current(sessions["s1"])
+
+    write_session("s1", ["beta words", "ok", "more"])
+    os.utime(path, (1000, 1000))
+    assert not index.is_current(sessions["s1"])
+    _index_all(index, ClaudeScanner(scanner.claude_dir))
+    assert index.search("alpha") == []
+    assert index.search("beta") == [("s1", "s1-0", 1)]
+
+    index.remove_session("s1")
+    assert index.search("beta") == []
+
+
+def test_save_and_reload(tmp_path: Path, scanner: ClaudeScanner, write_session):
+    write_session("s1", ["persisted term", "ok"])
+    index = InvertedIndex(tmp_path / "index")
+    sessions = _index_all(index, scanner)
+    index.save()
+
+    reloaded = InvertedIndex(tmp_path / "index")
+    assert reloaded.is_current(sessions["s1"])
+    assert reloaded.search("persisted") == [("s1", "s1-0", 1)]
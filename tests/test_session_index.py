@@ -0,0 +1,84 @@
+"""Tests for the persisted session metadata index."""
+
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from one_claude.core import session_index
+from one_claude.core.models import field_layout
+from one_claude.core.scanner import ClaudeScanner
+from one_claude.core.session_index import SessionIndex
+
+
+def test_round_trip(scanner: ClaudeScanner, claude_dir: Path, write_session):
+    write_session("s1", ["hello", "hi"])
+    [project] = scanner.scan_all()
+
+    entries = SessionIndex(claude_dir).load()
+    [(project_dir, files)] = entries.items()
+    mtime_ns, size, session = files["s1.jsonl"]
+    stat = (project_dir / "s1.jsonl").stat()
+    assert (mtime_ns, size) == (stat.st_mtime_ns, stat.st_size)
+    assert session.id == "s1"
+    assert session.title == project.sessions[0].title
+
+
+def test_reused_by_a_new_scanner(claude_dir: Path, write_session, monkeypatch: pytest.MonkeyPatch):
+    write_session("s1", ["hello", "hi"])
+    ClaudeScanner(claude_dir).scan_all()
+
+    def reread(*args):
+        raise AssertionError("unchanged session file was read again")
+
+    scanner = ClaudeScanner(claude_dir)
+    monkeypatch.setattr(scanner, "_scan_session_file", reread)
+    [project] = scanner.scan_all()
+    assert [s.id for s in project.sessions] == ["s1"]
+
+
+def test_ignores_other_layouts(claude_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    index = SessionIndex(claude_dir)
+    index.save({claude_dir: {}})
+    assert index.load() == {claude_dir: {}}
+
+    monkeypatch.setattr(session_index, "_INDEX_VERSION", "other")
+    assert index.load() == {}
+
+
+def test_layout_digest_tracks_fields():
+    @dataclass
+    class Before:
+        a: int
+        b: int
+
+    @dataclass
+    class After:
+        a: int
+        c: int
+        b: int
+
+    After.__name__ = Before.__name__
+    assert field_layout(Before) == field_layout(Before)
+    assert field_layout(Before) != field_layout(After)
+
+
+def test_corrupt_index_loads_empty(claude_dir: Path):
+    index = SessionIndex(claude_dir)
+    index.cache_dir.mkdir(parents=True)
+    index.path.write_bytes(b"not a pickle")
+    assert index.load() == {}
+
+
+def test_unreadable_projects_dir_keeps_index(
+    scanner: ClaudeScanner, claude_dir: Path, write_session
+):
+    write_session("s1", ["hello", "hi"])
+    scanner.scan_all()
+
+    projects = claude_dir / "projects"
+    shutil.rmtree(projects)
+    projects.write_text("")  # scandir() now raises NotADirectoryError
+    assert scanner.scan_all() == []
+    assert SessionIndex(claude_dir).load()
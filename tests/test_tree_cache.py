@@ -0,0 +1,87 @@
+"""Tests for the on-disk message tree cache."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from one_claude.core import tree_cache
+from one_claude.core.scanner import ClaudeScanner
+from one_claude.core.tree_cache import TreeCache
+
+
+@pytest.fixture
+def cache(claude_dir: Path, tmp_path: Path) -> TreeCache:
+    return TreeCache(claude_dir, tmp_path / "trees")
+
+
+def _settle(path: Path, age: float = 60.0) -> os.stat_result:
+    """Backdate path past the settle window and return its stat."""
+    then = time.time() - age
+    os.utime(path, (then, then))
+    return path.stat()
+
+
+def _parse(scanner: ClaudeScanner, path: Path):
+    return scanner.parser.parse_file(path)
+
+
+def test_hit_until_file_changes(cache: TreeCache, scanner: ClaudeScanner, write_session):
+    path = write_session("s1", ["hello", "hi"])
+    stat = _settle(path)
+    cache.put(path, stat, _parse(scanner, path))
+
+    tree = cache.get(path, stat)
+    assert tree is not None
+    assert sorted(tree.messages) == ["s1-0", "s1-1"]
+
+    # Touched but the same size
+    assert cache.get(path, _settle(path, age=30.0)) is None
+
+    # Same mtime but a different size
+    cache.put(path, stat, tree)
+    with open(path, "a") as f:
+        f.write("\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cache.get(path, path.stat()) is None
+
+
+def test_skips_files_still_being_written(cache: TreeCache, scanner: ClaudeScanner, write_session):
+    path = write_session("s1", ["hello", "hi"])
+    stat = path.stat()
+    cache.put(path, stat, _parse(scanner, path))
+    assert cache.get(path, stat) is None
+
+
+def test_ignores_other_layouts(
+    cache: TreeCache, scanner: ClaudeScanner, write_session, monkeypatch: pytest.MonkeyPatch
+):
+    path = write_session("s1", ["hello", "hi"])
+    stat = _settle(path)
+    cache.put(path, stat, _parse(scanner, path))
+    monkeypatch.setattr(tree_cache, "_CACHE_VERSION", "other")
+    assert cache.get(path, stat) is None
+
+
+def test_prune_drops_missing_and_oldest(cache: TreeCache, scanner: ClaudeScanner, write_session):
+    paths = [write_session(f"s{n}", ["hello", "hi"]) for n in range(3)]
+    for n, path in enumerate(paths):
+        stat = _settle(path)
+        cache.put(path, stat, _parse(scanner, path))
+        entry = cache._entry_path(path)
+        os.utime(entry, (1000 + n, 1000 + n))
+
+    cache.prune(paths[1:])
+    assert not cache._entry_path(paths[0]).exists()
+    assert cache._entry_path(paths[1]).exists()
+
+    newest = cache._entry_path(paths[2]).stat().st_size
+    cache.prune(paths, max_bytes=newest)
+    assert [cache._entry_path(p).exists() for p in paths] == [False, False, True]
+
+
+def test_separate_directories_per_claude_dir(tmp_path: Path):
+    one = TreeCache(tmp_path / "one", tmp_path / "trees")
+    two = TreeCache(tmp_path / "two", tmp_path / "trees")
+    assert one.cache_dir != two.cache_dir